@@ -0,0 +1,407 @@
+"""
+ats_boards.py
+
+Public job-board APIs of hosted ATS providers (and of Dice search).
+
+Company boards found on careers pages (see expand_career_sources() in the
+scraper) expose their whole posting list as JSON. Pulling a board in one
+request replaces scraping its listing page plus one detail fetch per job:
+
+  Greenhouse  GET boards-api.greenhouse.io/v1/boards/<token>/jobs?content=true
+  Lever       GET api.lever.co/v0/postings/<company>?mode=json
+  Ashby       GET api.ashbyhq.com/posting-api/job-board/<board>?includeCompensation=true
+  Dice        GET job-search-api.svc.dhigroupinc.com/v1/dice/jobs/search?<listing query>
+              (the search API behind dice.com/jobs, paged 100 at a time)
+
+Each job becomes an ApiPosting. posting_page_html() renders a posting as a
+small HTML page (title, company, location and a schema.org JobPosting
+JSON-LD block), so the scraper's normal extractor and rules can run on it
+exactly as they would on the vendor's own detail page, without fetching it.
+Lever, Ashby and Dice payloads are complete enough that the scraper builds its
+detail rows from the ApiPosting itself and skips page extraction altogether.
+
+This module has no dependency on po_job_scraper.py.
+"""
+
+from __future__ import annotations
+
+import html as _html
+import json
+import os
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+from http_client import http_get
+
+
+@dataclass
+class ApiPosting:
+    url: str
+    title: str
+    company: str = ""
+    locations: List[str] = field(default_factory=list)
+    remote: bool = False
+    workplace_type: str = ""   # "remote" | "hybrid" | "onsite" | ""
+    department: str = ""
+    employment_type: str = ""
+    date_posted: str = ""      # ISO date or datetime
+    salary_text: str = ""
+    description_html: str = ""
+    apply_url: str = ""
+    source: str = ""           # "greenhouse" | "lever" | ...
+
+    @property
+    def location_text(self) -> str:
+        return " | ".join(self.locations)
+
+
+def _get_json(url: str, timeout: float = 30, **kwargs: Any) -> Optional[Any]:
+    """GET + decode, or None on any HTTP / JSON failure."""
+    try:
+        resp = http_get(url, timeout=timeout, **kwargs)
+        if resp.status_code != 200:
+            return None
+        return resp.json()
+    except Exception:
+        return None
+
+
+def _as_int(value: Any) -> int:
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return 0
+
+
+def _prettify_slug(slug: str) -> str:
+    return re.sub(r"[-_]+", " ", slug or "").strip().title()
+
+
+# ---- Greenhouse ------------------------------------------------------------
+GREENHOUSE_API = "https://boards-api.greenhouse.io/v1/boards/{token}/jobs?content=true"
+
+
+def greenhouse_board_token(url: str) -> str:
+    """
+    Board token from any Greenhouse board URL:
+      boards.greenhouse.io/embed/job_board?for=<token>
+      job-boards.greenhouse.io/<token>[/jobs/<id>]
+    """
+    p = urlparse(url or "")
+    if "greenhouse.io" not in (p.netloc or "").lower():
+        return ""
+    token = (parse_qs(p.query).get("for") or [""])[0]
+    if not token:
+        parts = [s for s in (p.path or "").split("/") if s]
+        if parts and parts[0] not in ("embed", "v1"):
+            token = parts[0]
+    return token.strip().lower()
+
+
+def fetch_greenhouse_board(token: str) -> Optional[List[ApiPosting]]:
+    """Every published job on a Greenhouse board, or None when the API did not answer."""
+    data = _get_json(GREENHOUSE_API.format(token=token))
+    if not isinstance(data, dict) or not isinstance(data.get("jobs"), list):
+        return None
+
+    out: List[ApiPosting] = []
+    for job in data["jobs"]:
+        if not isinstance(job, dict) or not job.get("absolute_url"):
+            continue
+        location = str((job.get("location") or {}).get("name") or "").strip()
+        locations = [s.strip() for s in re.split(r"\s*[;|]\s*", location) if s.strip()]
+        departments = [d.get("name", "") for d in job.get("departments") or [] if isinstance(d, dict)]
+        out.append(ApiPosting(
+            url=str(job["absolute_url"]),
+            title=str(job.get("title") or "").strip(),
+            company=str(job.get("company_name") or "").strip() or _prettify_slug(token),
+            locations=locations,
+            remote=bool(re.search(r"\bremote\b", location, re.I)),
+            department=", ".join(d for d in departments if d),
+            date_posted=str(job.get("first_published") or job.get("updated_at") or ""),
+            # the board API returns the description entity-encoded
+            description_html=_html.unescape(str(job.get("content") or "")),
+            source="greenhouse",
+        ))
+    return out
+
+
+# ---- Lever -----------------------------------------------------------------
+LEVER_API = "https://{api_host}/v0/postings/{company}?mode=json"
+
+
+def lever_company_slug(url: str) -> str:
+    """Company slug from jobs.lever.co/<company>[/<posting id>] (EU boards included)."""
+    p = urlparse(url or "")
+    host = (p.netloc or "").lower()
+    if not (host == "jobs.lever.co" or host == "jobs.eu.lever.co"):
+        return ""
+    parts = [s for s in (p.path or "").split("/") if s]
+    return parts[0].lower() if parts else ""
+
+
+def _lever_salary_text(job: Dict[str, Any]) -> str:
+    rng = job.get("salaryRange") or {}
+    if isinstance(rng, dict) and (rng.get("min") or rng.get("max")):
+        cur = str(rng.get("currency") or "").strip()
+        interval = str(rng.get("interval") or "").replace("-", " ").strip()
+        lo, hi = (_as_int(rng.get(k)) for k in ("min", "max"))
+        span = f"{lo:,} - {hi:,}" if lo and hi else f"{lo or hi or 0:,}"
+        return " ".join(x for x in (cur, span, interval) if x)
+    return re.sub(r"<[^>]+>", " ", str(job.get("salaryDescription") or "")).strip()
+
+
+def fetch_lever_board(url: str) -> Optional[List[ApiPosting]]:
+    """Every posting on a Lever board, or None when the API did not answer."""
+    company = lever_company_slug(url)
+    if not company:
+        return None
+    api_host = "api.eu.lever.co" if "jobs.eu.lever.co" in url else "api.lever.co"
+    data = _get_json(LEVER_API.format(api_host=api_host, company=company))
+    if not isinstance(data, list):
+        return None
+
+    out: List[ApiPosting] = []
+    for job in data:
+        if not isinstance(job, dict) or not job.get("hostedUrl"):
+            continue
+        cats = job.get("categories") or {}
+        locations = [str(x).strip() for x in cats.get("allLocations") or [] if str(x).strip()]
+        if not locations and cats.get("location"):
+            locations = [str(cats["location"]).strip()]
+        workplace = str(job.get("workplaceType") or "").strip().lower()
+        if workplace == "unspecified":
+            workplace = ""
+
+        # description + the bulleted "lists" sections + closing text, as one body
+        body = [str(job.get("description") or "")]
+        for section in job.get("lists") or []:
+            if isinstance(section, dict):
+                body.append(f"<h3>{_html.escape(str(section.get('text') or ''))}</h3>")
+                body.append(f"<ul>{section.get('content') or ''}</ul>")
+        body.append(str(job.get("additional") or ""))
+
+        created = job.get("createdAt")
+        date_posted = ""
+        if isinstance(created, (int, float)) and created > 0:
+            date_posted = time.strftime("%Y-%m-%d", time.gmtime(created / 1000))
+
+        out.append(ApiPosting(
+            url=str(job["hostedUrl"]),
+            title=str(job.get("text") or "").strip(),
+            company=_prettify_slug(company),
+            locations=locations,
+            remote=workplace == "remote" or any(re.search(r"\bremote\b", x, re.I) for x in locations),
+            workplace_type=workplace,
+            department=" / ".join(str(x) for x in (cats.get("department"), cats.get("team")) if x),
+            employment_type=str(cats.get("commitment") or "").strip(),
+            date_posted=date_posted,
+            salary_text=_lever_salary_text(job),
+            description_html="\n".join(b for b in body if b),
+            apply_url=str(job.get("applyUrl") or ""),
+            source="lever",
+        ))
+    return out
+
+
+# ---- Ashby -----------------------------------------------------------------
+ASHBY_API = "https://api.ashbyhq.com/posting-api/job-board/{board}?includeCompensation=true"
+_UUID_RX = re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}", re.I)
+
+
+def ashby_board_slug(url: str) -> str:
+    """Board name from jobs.ashbyhq.com/<board>[/<job id>]."""
+    p = urlparse(url or "")
+    if not (p.netloc or "").lower().endswith("ashbyhq.com"):
+        return ""
+    parts = [s for s in (p.path or "").split("/") if s]
+    return parts[0] if parts else ""
+
+
+def ashby_job_id(url: str) -> str:
+    """Posting UUID from an Ashby job URL ('' for a board URL)."""
+    m = _UUID_RX.search(urlparse(url or "").path or "")
+    return m.group(0).lower() if m else ""
+
+
+def _ashby_location(job: Dict[str, Any]) -> List[str]:
+    locations = [str(job.get("location") or "").strip()]
+    for extra in job.get("secondaryLocations") or []:
+        if isinstance(extra, dict):
+            locations.append(str(extra.get("location") or "").strip())
+    addr = ((job.get("address") or {}).get("postalAddress") or {}) if isinstance(job.get("address"), dict) else {}
+    if not any(locations) and addr:
+        locations.append(", ".join(
+            str(addr.get(k) or "").strip()
+            for k in ("addressLocality", "addressRegion", "addressCountry")
+            if str(addr.get(k) or "").strip()
+        ))
+    return list(dict.fromkeys(x for x in locations if x))
+
+
+def fetch_ashby_board(board: str) -> Optional[List[ApiPosting]]:
+    """Every listed posting on an Ashby job board, or None when the API did not answer."""
+    if not board:
+        return None
+    data = _get_json(ASHBY_API.format(board=board))
+    if not isinstance(data, dict) or not isinstance(data.get("jobs"), list):
+        return None
+
+    out: List[ApiPosting] = []
+    for job in data["jobs"]:
+        if not isinstance(job, dict) or not job.get("jobUrl") or job.get("isListed") is False:
+            continue
+        workplace = str(job.get("workplaceType") or "").strip().lower()
+        comp = job.get("compensation") or {}
+        salary = ""
+        if isinstance(comp, dict):
+            salary = str(
+                comp.get("scrapeableCompensationSalarySummary")
+                or comp.get("compensationTierSummary")
+                or ""
+            ).strip()
+        out.append(ApiPosting(
+            url=str(job["jobUrl"]),
+            title=str(job.get("title") or "").strip(),
+            company=_prettify_slug(board),
+            locations=_ashby_location(job),
+            remote=bool(job.get("isRemote")) or workplace == "remote",
+            workplace_type=workplace,
+            department=" / ".join(str(x) for x in (job.get("department"), job.get("team")) if x),
+            employment_type=str(job.get("employmentType") or "").strip(),
+            date_posted=str(job.get("publishedAt") or ""),
+            salary_text=salary,
+            description_html=str(job.get("descriptionHtml") or ""),
+            apply_url=str(job.get("applyUrl") or ""),
+            source="ashby",
+        ))
+    return out
+
+
+# ---- Dice ------------------------------------------------------------------
+DICE_SEARCH_API = "https://job-search-api.svc.dhigroupinc.com/v1/dice/jobs/search"
+# the key the dice.com front end sends with every search; override if it rotates
+DICE_API_KEY = os.environ.get("DICE_API_KEY", "1YAt0R9wBg4WfsF9VB2778F5CHLAPMVW3WAZcKd8")
+DICE_PAGE_SIZE = 100
+_DICE_LISTING_PARAMS = ("q", "location", "latitude", "longitude", "radius", "radiusUnit", "countryCode2")
+
+
+def dice_search_params(listing_url: str) -> Dict[str, str]:
+    """Search API params equivalent to a dice.com/jobs?... listing URL."""
+    query = parse_qs(urlparse(listing_url or "").query)
+    params = {"countryCode2": "US", "radius": "30", "radiusUnit": "mi", "culture": "en", "includeRemote": "true"}
+    for key, values in query.items():
+        if values and (key in _DICE_LISTING_PARAMS or key.startswith("filters.")):
+            params[key] = values[0]
+    return params
+
+
+def _dice_workplace(job: Dict[str, Any]) -> str:
+    kinds = {str(x).strip().lower() for x in job.get("workplaceTypes") or []}
+    for kind in ("remote", "hybrid", "on-site", "onsite"):
+        if kind in kinds:
+            return "onsite" if kind == "on-site" else kind
+    return "remote" if job.get("isRemote") else ""
+
+
+def fetch_dice_search(listing_url: str, max_results: int = 500) -> Optional[List[ApiPosting]]:
+    """
+    Postings for a Dice search, in Dice's order, up to max_results. None when
+    the first page did not answer (later page failures end the walk early).
+    """
+    headers = {"x-api-key": DICE_API_KEY, "Accept": "application/json"}
+    base = dice_search_params(listing_url)
+    out: List[ApiPosting] = []
+    seen = set()
+    page = 1
+    while len(out) < max_results:
+        data = _get_json(DICE_SEARCH_API, headers=headers, params=dict(base, page=str(page), pageSize=str(DICE_PAGE_SIZE)))
+        if not isinstance(data, dict) or not isinstance(data.get("data"), list):
+            return out if page > 1 else None
+        for job in data["data"]:
+            if not isinstance(job, dict):
+                continue
+            url = str(job.get("detailsPageUrl") or "")
+            if not url and job.get("guid"):
+                url = f"https://www.dice.com/job-detail/{job['guid']}"
+            if not url or url in seen:
+                continue
+            seen.add(url)
+            location = str((job.get("jobLocation") or {}).get("displayName") or "").strip()
+            workplace = _dice_workplace(job)
+            summary = str(job.get("summary") or "").strip()
+            out.append(ApiPosting(
+                url=url,
+                title=str(job.get("title") or "").strip(),
+                company=str(job.get("companyName") or "").strip(),
+                locations=[location] if location else [],
+                remote=workplace == "remote",
+                workplace_type=workplace,
+                employment_type=str(job.get("employmentType") or "").strip(),
+                date_posted=str(job.get("postedDate") or ""),
+                salary_text=str(job.get("salary") or "").strip(),
+                description_html=f"<p>{_html.escape(summary)}</p>" if summary else "",
+                apply_url=url,
+                source="dice",
+            ))
+            if len(out) >= max_results:
+                break
+        meta = data.get("meta") or {}
+        if not data["data"] or page >= _as_int(meta.get("pageCount")):
+            break
+        page += 1
+    return out
+
+
+# ---- rendering -------------------------------------------------------------
+def _jobposting_ld(p: ApiPosting) -> Dict[str, Any]:
+    ld: Dict[str, Any] = {
+        "@context": "https://schema.org",
+        "@type": "JobPosting",
+        "title": p.title,
+        "hiringOrganization": {"@type": "Organization", "name": p.company},
+        "url": p.url,
+    }
+    if p.date_posted:
+        ld["datePosted"] = p.date_posted
+    if p.employment_type:
+        ld["employmentType"] = p.employment_type
+    places = [loc for loc in p.locations if loc.lower() != "remote"]
+    if places:
+        ld["jobLocation"] = [
+            {"@type": "Place", "address": {"@type": "PostalAddress", "addressLocality": loc}}
+            for loc in places
+        ]
+    if p.remote:
+        ld["jobLocationType"] = "TELECOMMUTE"
+    return ld
+
+
+def posting_page_html(p: ApiPosting) -> str:
+    """A minimal detail page for `p` that the generic extractor understands."""
+    esc = _html.escape
+    ld = json.dumps(_jobposting_ld(p), ensure_ascii=False).replace("</", "<\\/")
+    head_title = f"{p.title} - {p.company}" if p.company else p.title
+    parts = [
+        "<!DOCTYPE html><html><head>",
+        f"<title>{esc(head_title)}</title>",
+        f'<link rel="canonical" href="{esc(p.url)}">',
+        f'<meta property="og:title" content="{esc(head_title)}">',
+        f'<script type="application/ld+json">{ld}</script>',
+        "</head><body>",
+        f"<h1>{esc(p.title)}</h1>",
+    ]
+    if p.company:
+        parts.append(f'<div class="company-name">{esc(p.company)}</div>')
+    if p.locations:
+        parts.append(f'<div class="location">{esc(p.location_text)}</div>')
+    if p.department:
+        parts.append(f'<div class="department">{esc(p.department)}</div>')
+    if p.salary_text:
+        parts.append(f'<div class="salary">{esc(p.salary_text)}</div>')
+    parts.append(f'<div id="content">{p.description_html}</div>')
+    parts.append("</body></html>")
+    return "\n".join(parts)
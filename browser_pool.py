@@ -0,0 +1,248 @@
+"""
+browser_pool.py
+
+Run-scoped Playwright browser pool for the job scraper.
+
+Launching Chromium is by far the slowest part of a Playwright fetch, so we
+keep one browser alive for the whole run and hand out a reusable page.
+Contexts are recycled after a fixed number of pages (to drop cookies and
+memory growth) and the browser is relaunched after a crash or after a
+larger page budget.
+
+The sync Playwright API is bound to the thread that started it, so every
+thread gets its own slot (playwright driver + browser + context + page).
+This module has no dependency on po_job_scraper.py.
+"""
+
+from __future__ import annotations
+
+import atexit
+import threading
+from contextlib import contextmanager
+from typing import Any, Iterator, List, Optional
+
+from logging_utils import log_line
+
+try:
+    from playwright.sync_api import sync_playwright
+except Exception:
+    sync_playwright = None  # run without Playwright if not available
+
+
+class _PoolSlot:
+    """Per-thread Playwright state. Only ever touched from its own thread."""
+
+    def __init__(self) -> None:
+        self.pw: Any = None
+        self.browser: Any = None
+        self.context: Any = None
+        self.page: Any = None
+        self.user_agent: Optional[str] = None
+        self.context_pages = 0
+        self.browser_pages = 0
+
+    # ---- teardown helpers ------------------------------------------------
+    def close_context(self) -> None:
+        for obj in (self.page, self.context):
+            try:
+                if obj is not None:
+                    obj.close()
+            except Exception:
+                pass
+        self.page = None
+        self.context = None
+        self.context_pages = 0
+
+    def close_browser(self) -> None:
+        self.close_context()
+        try:
+            if self.browser is not None:
+                self.browser.close()
+        except Exception:
+            pass
+        self.browser = None
+        self.browser_pages = 0
+
+    def close(self) -> None:
+        self.close_browser()
+        try:
+            if self.pw is not None:
+                self.pw.stop()
+        except Exception:
+            pass
+        self.pw = None
+
+
+class BrowserPool:
+    """
+    Long-lived browser with a recycled context/page per thread.
+
+    Usage:
+        pool = BrowserPool(engine="chromium", launch_args=["--no-sandbox"])
+        with pool.page(user_agent=UA) as page:
+            page.goto(url)
+            html = page.content()
+
+    If the body of the `with` block raises, the context is thrown away so the
+    next fetch starts from a clean page; a disconnected browser is relaunched.
+    """
+
+    def __init__(
+        self,
+        engine: str = "chromium",
+        *,
+        headless: bool = True,
+        launch_args: Optional[List[str]] = None,
+        max_pages_per_context: int = 50,
+        max_pages_per_browser: int = 400,
+    ) -> None:
+        self.engine = engine
+        self.headless = headless
+        self.launch_args = list(launch_args or [])
+        self.max_pages_per_context = max(1, int(max_pages_per_context))
+        self.max_pages_per_browser = max(1, int(max_pages_per_browser))
+
+        self._local = threading.local()
+        self._slots: List[_PoolSlot] = []
+        self._lock = threading.Lock()
+
+        # simple run stats for the summary line
+        self.launches = 0
+        self.recycles = 0
+        self.crashes = 0
+
+    # ---- internals -------------------------------------------------------
+    def _slot(self) -> _PoolSlot:
+        slot = getattr(self._local, "slot", None)
+        if slot is None:
+            slot = _PoolSlot()
+            self._local.slot = slot
+            with self._lock:
+                self._slots.append(slot)
+        return slot
+
+    def _ensure_browser(self, slot: _PoolSlot) -> None:
+        if slot.browser is not None:
+            try:
+                if slot.browser.is_connected() and slot.browser_pages < self.max_pages_per_browser:
+                    return
+            except Exception:
+                pass
+            slot.close_browser()
+            self.recycles += 1
+
+        if slot.pw is None:
+            slot.pw = sync_playwright().start()
+        browser_type = getattr(slot.pw, self.engine)  # "chromium" | "firefox" | "webkit"
+        slot.browser = browser_type.launch(headless=self.headless, args=self.launch_args)
+        self.launches += 1
+
+    def _ensure_page(self, slot: _PoolSlot, user_agent: Optional[str]) -> Any:
+        self._ensure_browser(slot)
+
+        if slot.context is not None and (
+            slot.user_agent != user_agent
+            or slot.context_pages >= self.max_pages_per_context
+        ):
+            slot.close_context()
+            self.recycles += 1
+
+        if slot.context is None:
+            kwargs = {"user_agent": user_agent} if user_agent else {}
+            slot.context = slot.browser.new_context(**kwargs)
+            slot.user_agent = user_agent
+
+        if slot.page is None or slot.page.is_closed():
+            slot.page = slot.context.new_page()
+
+        return slot.page
+
+    # ---- public API ------------------------------------------------------
+    @property
+    def available(self) -> bool:
+        return sync_playwright is not None
+
+    @contextmanager
+    def page(self, user_agent: Optional[str] = None) -> Iterator[Any]:
+        """Borrow this thread's page for one fetch."""
+        if sync_playwright is None:
+            raise RuntimeError("Playwright is not installed")
+
+        slot = self._slot()
+        try:
+            pg = self._ensure_page(slot, user_agent)
+        except Exception:
+            # launch failed; drop everything so the next call starts fresh
+            self.crashes += 1
+            slot.close()
+            raise
+
+        slot.context_pages += 1
+        slot.browser_pages += 1
+        try:
+            yield pg
+        except Exception:
+            self.crashes += 1
+            slot.close_context()
+            try:
+                if slot.browser is not None and not slot.browser.is_connected():
+                    slot.close_browser()
+            except Exception:
+                slot.close_browser()
+            raise
+
+    def close_thread(self) -> None:
+        """Close the calling thread's browser. Call from worker threads before they exit."""
+        slot = getattr(self._local, "slot", None)
+        if slot is None:
+            return
+        slot.close()
+        self._local.slot = None
+        with self._lock:
+            try:
+                self._slots.remove(slot)
+            except ValueError:
+                pass
+
+    def shutdown(self) -> None:
+        """
+        Close the calling thread's browser and forget the others.
+
+        Sync Playwright objects cannot be closed from a foreign thread; any
+        slot left behind by a worker thread is torn down with the driver
+        process when the interpreter exits.
+        """
+        self.close_thread()
+        with self._lock:
+            self._slots.clear()
+
+    def stats_line(self) -> str:
+        return f"launches {self.launches}, recycles {self.recycles}, crashes {self.crashes}"
+
+
+_POOLS: dict = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def get_browser_pool(engine: str = "chromium", **kwargs: Any) -> BrowserPool:
+    """Return the run-wide pool for `engine`, creating it on first use."""
+    with _POOLS_LOCK:
+        pool = _POOLS.get(engine)
+        if pool is None:
+            pool = BrowserPool(engine, **kwargs)
+            _POOLS[engine] = pool
+        return pool
+
+
+def shutdown_browser_pools() -> None:
+    """Close every pool. Safe to call more than once."""
+    with _POOLS_LOCK:
+        pools = list(_POOLS.values())
+    for pool in pools:
+        try:
+            pool.shutdown()
+        except Exception as e:
+            log_line("WARN", f"Browser pool shutdown failed ({e.__class__.__name__}): {e}")
+
+
+atexit.register(shutdown_browser_pools)
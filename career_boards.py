@@ -0,0 +1,167 @@
+"""
+career_boards.py
+
+ATS boards linked from company careers pages, cached across runs.
+
+find_ats_boards() scans a careers page once: the raw HTML is unescaped
+(entities and JSON "\\/" escapes) and a single regex picks out every
+Greenhouse, Lever and Ashby board URL in it, whether it sits in an <a>,
+an <iframe> / <script> embed or an inline data blob. Each board comes back
+as the listing URL the scraper's source adapters understand:
+
+  Greenhouse  https://job-boards.greenhouse.io/embed/job_board?for=<token>
+  Lever       https://jobs.lever.co/<company>
+  Ashby       https://jobs.ashbyhq.com/<board>
+
+CareerBoardCache keeps the boards found per careers page in a small JSON
+file with the time they were checked. A fresh entry is used as-is; a stale
+one is still used for the current run and reported by stale() so the
+caller can re-scan it in the background. Pages that could not be fetched
+keep their previous entry.
+
+This module has no dependency on po_job_scraper.py.
+"""
+
+from __future__ import annotations
+
+import html as _html
+import json
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs
+
+
+_BOARD_RX = re.compile(
+    r"https?://(?:"
+    r"(?:boards|job-boards)\.greenhouse\.io/(?P<gh>[^\"'<>\s\\]+)"
+    r"|jobs\.lever\.co/(?P<lever>[a-z0-9\-]+)"
+    r"|jobs\.ashbyhq\.com/(?P<ashby>[a-z0-9\-]+)"
+    r")",
+    re.I,
+)
+
+# path segments on the Greenhouse hosts that are not board tokens
+_GH_NOT_TOKENS = {"embed", "job_board", "v1", "static", "assets"}
+
+
+def _greenhouse_token(path: str) -> str:
+    if path.lower().startswith("embed/job_board") or path.lower().startswith("job_board/js"):
+        query = path.split("?", 1)[1] if "?" in path else ""
+        return (parse_qs(query).get("for") or [""])[0].strip()
+    token = path.split("?", 1)[0].split("/", 1)[0].strip()
+    return "" if token.lower() in _GH_NOT_TOKENS else token
+
+
+def find_ats_boards(raw_html: str) -> List[str]:
+    """Board listing URLs linked or embedded anywhere in a careers page, sorted."""
+    text = _html.unescape((raw_html or "").replace("\\/", "/"))
+    found = set()
+    for m in _BOARD_RX.finditer(text):
+        if m.group("gh"):
+            token = _greenhouse_token(m.group("gh"))
+            if token:
+                found.add(f"https://job-boards.greenhouse.io/embed/job_board?for={token}")
+        elif m.group("lever"):
+            found.add(f"https://jobs.lever.co/{m.group('lever')}")
+        elif m.group("ashby"):
+            found.add(f"https://jobs.ashbyhq.com/{m.group('ashby')}")
+    return sorted(found)
+
+
+@dataclass
+class CareerPageEntry:
+    url: str
+    checked_at: float
+    boards: List[str] = field(default_factory=list)
+
+
+class CareerBoardCache:
+    """JSON-file careers-page URL -> boards cache with one TTL (seconds)."""
+
+    def __init__(self, path: str, ttl_seconds: float) -> None:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.path = path
+        self.ttl = float(ttl_seconds)
+        self._lock = threading.Lock()
+        self._entries: Dict[str, CareerPageEntry] = {}
+        self._load()
+
+        self.fresh = 0
+        self.stale_served = 0
+        self.missing = 0
+        self.refreshed = 0
+
+    def _load(self) -> None:
+        try:
+            with open(self.path, "r", encoding="utf-8") as fh:
+                data = json.load(fh)
+        except (OSError, ValueError):
+            return
+        for url, rec in (data.get("pages") or {}).items():
+            if isinstance(rec, dict):
+                self._entries[url] = CareerPageEntry(
+                    url=url,
+                    checked_at=float(rec.get("checked_at") or 0),
+                    boards=[str(b) for b in rec.get("boards") or []],
+                )
+
+    def _save(self) -> None:
+        payload = {
+            "pages": {
+                url: {"checked_at": e.checked_at, "boards": e.boards}
+                for url, e in sorted(self._entries.items())
+            }
+        }
+        tmp = f"{self.path}.{threading.get_ident()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump(payload, fh, indent=2)
+        os.replace(tmp, self.path)
+
+    # ---- read --------------------------------------------------------------
+    def get(self, url: str) -> Optional[CareerPageEntry]:
+        with self._lock:
+            return self._entries.get(url)
+
+    def is_fresh(self, entry: Optional[CareerPageEntry]) -> bool:
+        return entry is not None and self.ttl > 0 and (time.time() - entry.checked_at) < self.ttl
+
+    def split(self, urls: List[str]) -> tuple[Dict[str, List[str]], List[str], List[str]]:
+        """
+        (cached boards per page, stale pages, missing pages) for this run.
+        Stale pages are included in the cached boards; missing ones are not.
+        Counts the outcome for stats_line().
+        """
+        cached: Dict[str, List[str]] = {}
+        stale: List[str] = []
+        missing: List[str] = []
+        for url in urls:
+            entry = self.get(url)
+            if entry is None:
+                missing.append(url)
+                continue
+            cached[url] = list(entry.boards)
+            if not self.is_fresh(entry):
+                stale.append(url)
+        with self._lock:
+            self.fresh += len(cached) - len(stale)
+            self.stale_served += len(stale)
+            self.missing += len(missing)
+        return cached, stale, missing
+
+    # ---- write -------------------------------------------------------------
+    def record(self, url: str, boards: List[str]) -> None:
+        """Store the boards found on a successfully fetched careers page."""
+        with self._lock:
+            self._entries[url] = CareerPageEntry(url=url, checked_at=time.time(), boards=sorted(set(boards)))
+            self.refreshed += 1
+            self._save()
+
+    def stats_line(self) -> str:
+        return (
+            f"fresh {self.fresh}, stale (refreshed in background) {self.stale_served}, "
+            f"missing {self.missing}, pages scanned {self.refreshed}"
+        )
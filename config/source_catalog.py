@@ -1,13 +1,14 @@
 """Source-centric scraper metadata extracted from po_job_scraper.py.
 
-This module is not wired into the scraper yet. It is a cleanup target for
-future imports once po_job_scraper.py is ready to consume config modules.
+po_job_scraper.py reads PLAYWRIGHT_DOMAINS, KNOWN_SOURCE_LABELS,
+SOURCE_METADATA and FEED_SOURCES from here; its SourceAdapter registry uses
+SOURCE_METADATA to pick each listing source's preferred fetch engine, and
+reads listings on FEED_SOURCES hosts from their RSS/Atom feed instead.
 """
 
 PLAYWRIGHT_DOMAINS = {
     "about.gitlab.com",
     "app.welcometothejungle.com",
-    "ashbyhq.com",
     "builtin.com",
     "builtinseattle.com",
     "builtinvancouver.org",
@@ -15,10 +16,8 @@ PLAYWRIGHT_DOMAINS = {
     "edtech.com",
     "edtechjobs.io",
     "hubspot.com",
-    "jobs.ashbyhq.com",
     "myworkdayjobs.com",
     "myworkdaysite.com",
-    "remoteok.com",
     "us.welcometothejungle.com",
     "wd1.myworkdayjobs.com",
     "wd5.myworkdaysite.com",
@@ -34,7 +33,6 @@ PLAYWRIGHT_DOMAINS = {
     "www.edtech.com",
     "www.edtechjobs.io",
     "www.hubspot.com",
-    "www.remoteok.com",
     "www.wellfound.com",
     "www.welcometothejungle.com",
     "www.workingnomads.com",
@@ -50,6 +48,8 @@ KNOWN_SOURCE_LABELS = {
     "builtinvancouver.org": "Built In Vancouver",
     "www.builtinvancouver.org": "Built In Vancouver",
     "remoteok.com": "Remote OK",
+    "edsurge.com": "EdSurge",
+    "www.edsurge.com": "EdSurge",
     "wellfound.com": "Wellfound",
     "welcometothejungle.com": "Welcome to the Jungle",
 }
@@ -77,7 +77,7 @@ SOURCE_METADATA = {
     "builtinvancouver.org": {"label": "Built In Vancouver", "needs_playwright": True},
     "dice.com": {"label": "Dice", "needs_playwright": True},
     "hubspot.com": {"label": "HubSpot", "needs_playwright": True},
-    "remoteok.com": {"label": "Remote OK", "needs_playwright": True, "remote_default": True},
+    "remoteok.com": {"label": "Remote OK", "needs_playwright": False, "remote_default": True},
     "wellfound.com": {"label": "Wellfound", "needs_playwright": True},
     "welcometothejungle.com": {"label": "Welcome to the Jungle", "needs_playwright": True},
     "workingnomads.com": {"label": "Working Nomads", "needs_playwright": True},
@@ -89,13 +89,30 @@ SOURCE_METADATA = {
     "remotive.com": {"label": "Remotive", "needs_playwright": False},
     "simplyhired.com": {"label": "SimplyHired", "needs_playwright": False},
     "wd5.myworkdaysite.com": {"label": "Workday", "needs_playwright": True},
-    "jobs.ashbyhq.com": {"label": "Ashby", "needs_playwright": True},
+    "jobs.ashbyhq.com": {"label": "Ashby", "needs_playwright": False},
     "workatastartup.com": {"label": "Work at a Startup", "needs_playwright": False},
     "edtech.com": {"label": "EdTech", "needs_playwright": True},
+    "edsurge.com": {"label": "EdSurge", "needs_playwright": False},
     "edtechjobs.io": {"label": "EdTech Jobs", "needs_playwright": True},
     "nodesk.co": {"label": "NoDesk", "needs_playwright": False},
     "weworkremotely.com": {"label": "We Work Remotely", "needs_playwright": False, "remote_default": True},
 }
 
 
+# Listing pages read from a feed (feed_source.py), by host.
+#   path_prefix   only listing paths under it have a feed (default "/")
+#   feed_url      "{url}" is the listing URL without query / trailing slash
+#   title_format  "company: title" splits "<Company>: <Job title>" item titles
+#   location_tag  feed child element holding the job's location
+FEED_SOURCES = {
+    "weworkremotely.com": {
+        # /categories/<slug> has <slug>.rss; /remote-jobs/new and the like do not
+        "path_prefix": "/categories/",
+        "feed_url": "{url}.rss",
+        "title_format": "company: title",
+        "location_tag": "region",
+    },
+}
+
+
 SIMPLYHIRED_BASE_URL = "https://www.simplyhired.com"
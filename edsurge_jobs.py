@@ -1,13 +1,27 @@
 # edsurge_jobs.py
+#
+# EdSurge job search through the Algolia index behind edsurge.com/jobs.
+#
+# Algolia's /queries endpoint takes many searches per POST, so every role
+# query is asked for its first page in one request, and all further pages
+# of all queries in one more (split into chunks of ALGOLIA_BATCH_SIZE).
+# Requests go over the shared keep-alive session in http_client.py.
+#
+# EdSurgeJob.to_row() maps a hit onto the scraper's KEEP_FIELDS column
+# names, so rows can be classified without fetching the EdSurge page.
 
 from __future__ import annotations
 
+import json
 from dataclasses import dataclass
-from typing import List, Optional
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
 from urllib.parse import urlencode, urljoin
 
 import requests
 
+from http_client import http_post
+
 
 ALGOLIA_URL = "https://dizr5e00vc-dsn.algolia.net/1/indexes/*/queries"
 ALGOLIA_APP_ID = "DIZR5E00VC"
@@ -23,6 +37,9 @@ DEFAULT_QUERY = "Product"
 # You can bump this if you want more than 25 at a time
 DEFAULT_HITS_PER_PAGE = 50
 
+# searches per /queries POST
+ALGOLIA_BATCH_SIZE = 50
+
 
 @dataclass
 class EdSurgeJob:
@@ -42,33 +59,44 @@ class EdSurgeJob:
     apply_url: Optional[str] = None  # will use listing_url unless you later fetch detail page
     object_id: Optional[str] = None
 
+    @property
+    def location(self) -> str:
+        loc = (self.location_raw or "").strip()
+        if self.remote_flag:
+            return f"Remote - {loc}" if loc and "remote" not in loc.lower() else (loc or "Remote")
+        return loc
+
+    @property
+    def posting_date(self) -> str:
+        try:
+            return datetime.fromtimestamp(int(self.posted_at_utc or 0), tz=timezone.utc).date().isoformat()
+        except (TypeError, ValueError, OverflowError, OSError):
+            return ""
+
     def to_row(self) -> dict:
         """
-        Map into your generic row structure.
-        Adjust the keys to match base_row_from_listing / CSV schema.
+        Map into the scraper's KEEP_FIELDS columns (the ones a hit can fill).
         """
+        snippet = " · ".join(
+            x for x in (self.category, self.role, self.job_type, self.experience_level, self.organization_type) if x
+        )
         return {
-            "source": self.source,
-            "title": self.title,
-            "company": self.company,
-            "location_raw": self.location_raw,
-            "remote_flag": self.remote_flag,
-            "category": self.category,
-            "role": self.role,
-            "job_type": self.job_type,
-            "experience_level": self.experience_level,
-            "organization_type": self.organization_type,
-            "posted_side": self.posted_side,
-            "posted_at_utc": self.posted_at_utc,
-            "listing_url": self.listing_url,
-            "apply_url": self.apply_url,
-            "edsurge_object_id": self.object_id,
+            "Title": self.title,
+            "Job ID (Vendor)": self.object_id or "",
+            "Company": self.company,
+            "Career Board": "EdSurge",
+            "Location": self.location,
+            "Posted": self.posting_date,
+            "Posting Date": self.posting_date,
+            "Job URL": self.listing_url or "",
+            "Apply URL": self.apply_url or self.listing_url or "",
+            "Description Snippet": snippet,
         }
 
 
-def _build_params(query: str, page: int = 0, hits_per_page: int = DEFAULT_HITS_PER_PAGE) -> dict:
+def _search_params(query: str, page: int = 0, hits_per_page: int = DEFAULT_HITS_PER_PAGE) -> str:
     """
-    Build the Algolia 'params' query string.
+    Build the Algolia 'params' query string for one search.
     This needs to be a URL encoded query string inside the JSON body.
     """
     params_dict = {
@@ -80,31 +108,52 @@ def _build_params(query: str, page: int = 0, hits_per_page: int = DEFAULT_HITS_P
         "tagFilters": "",
     }
     # urlencode will turn the dict into "query=Product&hitsPerPage=50&..."
-    return {"requests": [{"indexName": ALGOLIA_INDEX, "params": urlencode(params_dict)}]}
+    return urlencode(params_dict)
 
 
-def _fetch_page(session: requests.Session, query: str, page: int) -> dict:
+def _build_params(query: str, page: int = 0, hits_per_page: int = DEFAULT_HITS_PER_PAGE) -> dict:
+    """Request body for a single search."""
+    return {"requests": [{"indexName": ALGOLIA_INDEX, "params": _search_params(query, page, hits_per_page)}]}
+
+
+def _post_queries(searches: List[Tuple[str, int]], session: Optional[requests.Session] = None) -> List[dict]:
+    """
+    Run (query, page) searches, ALGOLIA_BATCH_SIZE per POST. Returns one
+    Algolia result per search, in order ({} where a batch failed).
+    """
     headers = {"Content-Type": "application/json"}
     params = {
         "x-algolia-application-id": ALGOLIA_APP_ID,
         "x-algolia-api-key": ALGOLIA_API_KEY,
     }
-    payload = _build_params(query=query, page=page)
+    out: List[dict] = []
+    for start in range(0, len(searches), ALGOLIA_BATCH_SIZE):
+        chunk = searches[start:start + ALGOLIA_BATCH_SIZE]
+        payload = {"requests": [
+            {"indexName": ALGOLIA_INDEX, "params": _search_params(query, page)} for query, page in chunk
+        ]}
+        try:
+            if session is not None:
+                resp = session.post(ALGOLIA_URL, params=params, json=payload, timeout=30)
+            else:
+                resp = http_post(ALGOLIA_URL, params=params, headers=headers, data=json.dumps(payload), timeout=30)
+            resp.raise_for_status()
+            results = resp.json().get("results") or []
+        except Exception:
+            results = []
+        results = [r if isinstance(r, dict) else {} for r in results]
+        out.extend(results + [{}] * (len(chunk) - len(results)))
+    return out
 
-    resp = session.post(ALGOLIA_URL, params=params, json=payload, timeout=30)
-    resp.raise_for_status()
-    return resp.json()
 
+def _fetch_page(session: requests.Session, query: str, page: int) -> dict:
+    return {"results": _post_queries([(query, page)], session=session)}
 
-def _parse_hits(result_json: dict) -> List[EdSurgeJob]:
-    results = result_json.get("results", [])
-    if not results:
-        return []
 
-    hits = results[0].get("hits", [])
+def _parse_result(result: dict) -> List[EdSurgeJob]:
     jobs: List[EdSurgeJob] = []
 
-    for hit in hits:
+    for hit in result.get("hits", []):
         title = hit.get("title", "").strip()
         company = hit.get("organization_name", "").strip()
 
@@ -137,38 +186,60 @@ def _parse_hits(result_json: dict) -> List[EdSurgeJob]:
     return jobs
 
 
-def scrape_edsurge_jobs(
-    query: str = DEFAULT_QUERY,
+def _parse_hits(result_json: dict) -> List[EdSurgeJob]:
+    results = result_json.get("results", [])
+    if not results:
+        return []
+    return _parse_result(results[0])
+
+
+def fetch_edsurge_jobs(
+    queries: Iterable[str],
     max_pages: int = 3,
     session: Optional[requests.Session] = None,
-) -> List[dict]:
+) -> Optional[List[EdSurgeJob]]:
     """
-    Pull jobs from EdSurge for a given search term.
-    For you, default is 'Product' with up to max_pages pages.
+    Every hit for all queries (up to max_pages pages each), deduplicated by
+    Algolia objectID, in query order. Two POSTs for up to ALGOLIA_BATCH_SIZE
+    queries: all first pages, then all remaining pages. None when the first
+    round returned nothing at all (EdSurge / Algolia unreachable).
     """
-    if session is None:
-        session = requests.Session()
-
-    all_rows: List[dict] = []
-    page = 0
-
-    while page < max_pages:
-        data = _fetch_page(session, query=query, page=page)
-        results = data.get("results", [])
-        if not results:
-            break
+    queries = list(dict.fromkeys(q for q in queries if q))
+    if not queries:
+        return []
 
-        meta = results[0]
-        nb_pages = meta.get("nbPages", 1)
+    first = _post_queries([(q, 0) for q in queries], session=session)
+    if not any(first):
+        return None
 
-        jobs = _parse_hits(data)
-        if not jobs:
-            break
+    per_query: Dict[str, List[dict]] = {q: [r] for q, r in zip(queries, first)}
+    rest: List[Tuple[str, int]] = []
+    for q, r in zip(queries, first):
+        nb_pages = int(r.get("nbPages") or 1)
+        rest.extend((q, page) for page in range(1, min(nb_pages, max_pages)))
+    for (q, _page), r in zip(rest, _post_queries(rest, session=session)):
+        per_query[q].append(r)
 
-        all_rows.extend(job.to_row() for job in jobs)
+    jobs: List[EdSurgeJob] = []
+    seen = set()
+    for q in queries:
+        for result in per_query[q]:
+            for job in _parse_result(result):
+                key = job.object_id or job.listing_url
+                if key in seen:
+                    continue
+                seen.add(key)
+                jobs.append(job)
+    return jobs
 
-        page += 1
-        if page >= nb_pages:
-            break
 
-    return all_rows
+def scrape_edsurge_jobs(
+    query: str = DEFAULT_QUERY,
+    max_pages: int = 3,
+    session: Optional[requests.Session] = None,
+) -> List[dict]:
+    """
+    Pull jobs from EdSurge for a given search term.
+    For you, default is 'Product' with up to max_pages pages.
+    """
+    return [job.to_row() for job in fetch_edsurge_jobs([query], max_pages=max_pages, session=session) or []]
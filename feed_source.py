@@ -0,0 +1,185 @@
+"""
+feed_source.py
+
+RSS 2.0 / Atom job feeds, read incrementally and revalidated across runs.
+
+FeedReader.read(feed_url) streams the response body into an XML pull
+parser and yields one FeedItem per <item> / <entry> as it completes, so a
+large feed is never held as one document. Element names are matched
+without their namespace, and unknown child elements (e.g. We Work
+Remotely's <region>) are kept in FeedItem.extra.
+
+Every successful read is remembered in a small JSON state file together
+with the feed's ETag / Last-Modified. The next read sends them as
+If-None-Match / If-Modified-Since; a 304 answers from the stored items,
+so an unchanged feed costs one empty response.
+
+This module has no dependency on po_job_scraper.py.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+import xml.etree.ElementTree as ET
+from dataclasses import asdict, dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import Dict, List, Optional
+
+from http_client import http_get
+
+
+@dataclass
+class FeedItem:
+    title: str = ""
+    link: str = ""
+    summary_html: str = ""
+    published: str = ""        # ISO date ("" when the feed gives none)
+    author: str = ""
+    categories: List[str] = field(default_factory=list)
+    extra: Dict[str, str] = field(default_factory=dict)  # other child elements by local name
+
+
+def _local(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1].lower() if isinstance(tag, str) else ""
+
+
+def _iso_date(value: str) -> str:
+    value = (value or "").strip()
+    if not value:
+        return ""
+    if len(value) >= 10 and value[4] == "-" and value[7] == "-":
+        return value[:10]  # Atom / ISO 8601
+    try:
+        return parsedate_to_datetime(value).date().isoformat()  # RSS (RFC 822)
+    except (TypeError, ValueError, IndexError):
+        return ""
+
+
+def _item_from_element(el: ET.Element) -> FeedItem:
+    item = FeedItem()
+    for child in el:
+        name = _local(child.tag)
+        text = (child.text or "").strip()
+        if name == "title":
+            item.title = text
+        elif name == "link":
+            # Atom: <link rel="alternate" href="..."/>; RSS: <link>url</link>
+            href = child.get("href")
+            if href and child.get("rel", "alternate") == "alternate":
+                item.link = item.link or href
+            elif text:
+                item.link = item.link or text
+        elif name in ("description", "summary", "content", "encoded"):
+            if len(text) > len(item.summary_html):
+                item.summary_html = text
+        elif name in ("pubdate", "published", "updated", "date"):
+            item.published = item.published or _iso_date(text)
+        elif name in ("author", "creator"):
+            names = [(c.text or "").strip() for c in child if _local(c.tag) == "name"]
+            item.author = item.author or (names[0] if names else text)
+        elif name == "category":
+            term = child.get("term") or text
+            if term:
+                item.categories.append(term)
+        elif name == "guid":
+            if not item.link and text.startswith("http"):
+                item.link = text
+        elif text:
+            item.extra.setdefault(name, text)
+    return item
+
+
+def parse_feed_stream(chunks) -> List[FeedItem]:
+    """FeedItems from an iterable of byte chunks (RSS <item> or Atom <entry>)."""
+    parser = ET.XMLPullParser(events=("end",))
+    items: List[FeedItem] = []
+
+    def _drain() -> None:
+        for _event, el in parser.read_events():
+            if _local(el.tag) in ("item", "entry"):
+                items.append(_item_from_element(el))
+                el.clear()
+
+    for chunk in chunks:
+        if chunk:
+            parser.feed(chunk)
+            _drain()
+    parser.close()
+    _drain()
+    return items
+
+
+class FeedReader:
+    """Conditional-GET feed reader with on-disk items per feed URL."""
+
+    def __init__(self, state_path: str, *, headers: Optional[Dict[str, str]] = None, timeout: float = 30) -> None:
+        os.makedirs(os.path.dirname(state_path) or ".", exist_ok=True)
+        self.path = state_path
+        self.headers = dict(headers or {})
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._state: Dict[str, dict] = {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as fh:
+                data = json.load(fh)
+            if isinstance(data, dict):
+                self._state = {k: v for k, v in data.items() if isinstance(v, dict)}
+        except (OSError, ValueError):
+            pass
+
+        self.fetched = 0
+        self.not_modified = 0
+        self.failures = 0
+
+    def _save(self) -> None:
+        tmp = f"{self.path}.{threading.get_ident()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump(self._state, fh)
+        os.replace(tmp, self.path)
+
+    def _count(self, outcome: str) -> None:
+        with self._lock:
+            setattr(self, outcome, getattr(self, outcome) + 1)
+
+    def read(self, feed_url: str) -> Optional[List[FeedItem]]:
+        """Items of the feed (stored items on 304), or None when it could not be read."""
+        with self._lock:
+            prev = self._state.get(feed_url) or {}
+        headers = dict(self.headers)
+        if prev.get("etag"):
+            headers["If-None-Match"] = prev["etag"]
+        if prev.get("last_modified"):
+            headers["If-Modified-Since"] = prev["last_modified"]
+
+        try:
+            # the with-block returns a streamed connection to the pool on every path
+            with http_get(feed_url, headers=headers, timeout=self.timeout, stream=True) as resp:
+                if resp.status_code == 304 and "items" in prev:
+                    self._count("not_modified")
+                    with self._lock:
+                        prev["checked_at"] = time.time()
+                        self._save()
+                    return [FeedItem(**d) for d in prev["items"]]
+                if resp.status_code != 200:
+                    raise ValueError(f"HTTP {resp.status_code}")
+                items = parse_feed_stream(resp.iter_content(chunk_size=65536))
+        except Exception:
+            self._count("failures")
+            return None
+
+        self._count("fetched")
+        with self._lock:
+            self._state[feed_url] = {
+                "etag": resp.headers.get("ETag", ""),
+                "last_modified": resp.headers.get("Last-Modified", ""),
+                "checked_at": time.time(),
+                "items": [asdict(i) for i in items],
+            }
+            self._save()
+        return items
+
+    def stats_line(self) -> str:
+        return f"fetched {self.fetched}, not modified (304) {self.not_modified}, failures {self.failures}"
@@ -0,0 +1,180 @@
+"""
+fetch_archive.py
+
+Record-and-replay archive of everything the scraper fetched.
+
+Layout of an archive directory:
+
+  index.jsonl          one JSON line per response: method, url, request
+                       payload hash, final_url, status, headers, engine and
+                       the body file name (later lines win on replay)
+  bodies/<ab>/<sha1>.gz  gzip'd bodies, content-addressed so identical
+                       pages are stored once
+
+`--record DIR` appends to the archive while a normal run goes to the
+network. `--replay DIR` serves the whole pipeline from it with no network,
+which makes a full day's crawl re-runnable in seconds and gives a fixed
+corpus for profiling extraction.
+
+This module has no dependency on po_job_scraper.py.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from http_client import FetchResult
+
+
+def _payload_digest(payload: Any = None, params: Any = None) -> str:
+    """Stable hash of a request body / query params ('' for a plain GET)."""
+    if payload is None and params is None:
+        return ""
+    parts = []
+    for part in (payload, params):
+        if part is None:
+            parts.append("")
+        elif isinstance(part, bytes):
+            parts.append(part.decode("utf-8", "replace"))
+        elif isinstance(part, str):
+            parts.append(part)
+        else:
+            parts.append(json.dumps(part, sort_keys=True, default=str))
+    return hashlib.sha1("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+
+def archive_key(url: str, method: str = "GET", payload: Any = None, params: Any = None) -> str:
+    return f"{method.upper()} {url} {_payload_digest(payload, params)}".strip()
+
+
+class FetchArchive:
+    """Append-only response archive; mode is "record" or "replay"."""
+
+    def __init__(self, root: str, mode: str) -> None:
+        if mode not in ("record", "replay"):
+            raise ValueError(f"unknown archive mode: {mode}")
+        self.root = root
+        self.mode = mode
+        self.index_path = os.path.join(root, "index.jsonl")
+        self.bodies_dir = os.path.join(root, "bodies")
+        self._lock = threading.Lock()
+        self._index: Dict[str, dict] = {}
+
+        self.recorded = 0
+        self.served = 0
+        self.missing = 0
+
+        if mode == "record":
+            os.makedirs(self.bodies_dir, exist_ok=True)
+        elif not os.path.isfile(self.index_path):
+            raise FileNotFoundError(f"No archive index at {self.index_path}")
+
+        if os.path.isfile(self.index_path):
+            with open(self.index_path, encoding="utf-8") as fh:
+                for line in fh:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        rec = json.loads(line)
+                    except ValueError:
+                        continue
+                    self._index[rec.get("key", "")] = rec
+
+    @property
+    def recording(self) -> bool:
+        return self.mode == "record"
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == "replay"
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    # ---- record ------------------------------------------------------------
+    def record(
+        self,
+        result: FetchResult,
+        *,
+        method: str = "GET",
+        payload: Any = None,
+        params: Any = None,
+    ) -> None:
+        if not self.recording or result is None:
+            return
+        body_rel = ""
+        if result.html is not None:
+            raw = result.html.encode("utf-8")
+            digest = hashlib.sha1(raw).hexdigest()
+            body_rel = os.path.join("bodies", digest[:2], f"{digest}.gz")
+            body_abs = os.path.join(self.root, body_rel)
+            if not os.path.exists(body_abs):
+                os.makedirs(os.path.dirname(body_abs), exist_ok=True)
+                tmp = f"{body_abs}.{threading.get_ident()}.tmp"
+                with gzip.open(tmp, "wb", compresslevel=6) as fh:
+                    fh.write(raw)
+                os.replace(tmp, body_abs)
+
+        rec = {
+            "key": archive_key(result.url, method, payload, params),
+            "method": method.upper(),
+            "url": result.url,
+            "final_url": result.final_url or result.url,
+            "status": result.status,
+            "headers": dict(result.headers or {}),
+            "engine": result.engine,
+            "body": body_rel,
+            "recorded_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        }
+        line = json.dumps(rec, ensure_ascii=False)
+        with self._lock:
+            with open(self.index_path, "a", encoding="utf-8") as fh:
+                fh.write(line + "\n")
+            self._index[rec["key"]] = rec
+            self.recorded += 1
+
+    # ---- replay ------------------------------------------------------------
+    def lookup(
+        self,
+        url: str,
+        *,
+        method: str = "GET",
+        payload: Any = None,
+        params: Any = None,
+    ) -> Optional[FetchResult]:
+        rec = self._index.get(archive_key(url, method, payload, params))
+        if rec is None:
+            with self._lock:
+                self.missing += 1
+            return None
+        html = None
+        if rec.get("body"):
+            try:
+                with gzip.open(os.path.join(self.root, rec["body"]), "rb") as fh:
+                    html = fh.read().decode("utf-8")
+            except OSError:
+                with self._lock:
+                    self.missing += 1
+                return None
+        with self._lock:
+            self.served += 1
+        return FetchResult(
+            url=url,
+            final_url=rec.get("final_url") or url,
+            status=rec.get("status"),
+            html=html,
+            headers=rec.get("headers") or {},
+            engine=rec.get("engine") or "",
+        )
+
+    def stats_line(self) -> str:
+        if self.recording:
+            return f"recorded {self.recorded} responses to {self.root}"
+        return f"served {self.served}, missing {self.missing} from {self.root}"
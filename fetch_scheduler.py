@@ -0,0 +1,217 @@
+"""
+fetch_scheduler.py
+
+Host-aware worker pool for the job scraper.
+
+`run_ordered()` runs a function over many URLs on a small thread pool while
+keeping each host polite: at most N requests in flight per host and a
+minimum gap between request starts on the same host. Different hosts run
+in parallel. Results are yielded back in the original input order, so the
+caller can record keeps/skips exactly as the serial loop did and the CSVs
+stay diff-able between runs.
+
+This module has no dependency on po_job_scraper.py.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple
+from urllib.parse import urlparse
+
+
+def host_of(url: str) -> str:
+    """Lowercased host without a leading www."""
+    try:
+        host = (urlparse(str(url or "")).netloc or "").lower()
+    except Exception:
+        return ""
+    return host[4:] if host.startswith("www.") else host
+
+
+class HostThrottle:
+    """
+    Per-host concurrency cap and minimum spacing between request starts.
+
+    `concurrency` and `min_interval` map a host suffix to a limit, with a
+    "default" entry for everything else. Hosts that share a suffix entry
+    (e.g. every *.myworkdayjobs.com tenant) share one lane.
+    """
+
+    def __init__(
+        self,
+        concurrency: Optional[Dict[str, int]] = None,
+        min_interval: Optional[Dict[str, float]] = None,
+    ) -> None:
+        self.concurrency = dict(concurrency or {})
+        self.min_interval = dict(min_interval or {})
+        self.concurrency.setdefault("default", 2)
+        self.min_interval.setdefault("default", 0.0)
+
+        self._active: Dict[str, int] = {}
+        self._next_start: Dict[str, float] = {}
+        self._cond = threading.Condition()
+
+    # ---- lane lookup -----------------------------------------------------
+    def lane(self, url_or_host: str) -> str:
+        host = url_or_host if "/" not in url_or_host else host_of(url_or_host)
+        host = host[4:] if host.startswith("www.") else host
+        for table in (self.concurrency, self.min_interval):
+            for key in table:
+                if key != "default" and (host == key or host.endswith("." + key)):
+                    return key
+        return host
+
+    def _limit(self, lane: str) -> int:
+        return max(1, int(self.concurrency.get(lane, self.concurrency["default"])))
+
+    def _interval(self, lane: str) -> float:
+        return max(0.0, float(self.min_interval.get(lane, self.min_interval["default"])))
+
+    # ---- scheduling primitives (caller holds no lock) ----------------------
+    def ready_in(self, lane: str, now: Optional[float] = None) -> Optional[float]:
+        """
+        Seconds until `lane` may start another request, or None if it is at
+        its concurrency cap. 0.0 means it may start now.
+        """
+        now = time.monotonic() if now is None else now
+        with self._cond:
+            if self._active.get(lane, 0) >= self._limit(lane):
+                return None
+            return max(0.0, self._next_start.get(lane, 0.0) - now)
+
+    def try_start(self, lane: str) -> bool:
+        """Claim a slot on `lane` if it is free right now."""
+        now = time.monotonic()
+        with self._cond:
+            if self._active.get(lane, 0) >= self._limit(lane):
+                return False
+            if self._next_start.get(lane, 0.0) > now:
+                return False
+            self._active[lane] = self._active.get(lane, 0) + 1
+            self._next_start[lane] = now + self._interval(lane)
+            return True
+
+    def finish(self, lane: str) -> None:
+        with self._cond:
+            self._active[lane] = max(0, self._active.get(lane, 0) - 1)
+            self._cond.notify_all()
+
+    def acquire(self, url: str) -> str:
+        """Blocking variant for one-off calls outside run_ordered()."""
+        lane = self.lane(url)
+        while not self.try_start(lane):
+            wait = self.ready_in(lane)
+            with self._cond:
+                self._cond.wait(timeout=0.5 if wait is None else max(0.01, min(wait, 0.5)))
+        return lane
+
+
+def run_ordered(
+    items: Iterable[Any],
+    fn: Callable[[Any], Any],
+    *,
+    workers: int = 4,
+    throttle: Optional[HostThrottle] = None,
+    url_of: Callable[[Any], str] = str,
+    window: int = 200,
+    on_thread_exit: Optional[Callable[[], None]] = None,
+) -> Iterator[Tuple[Any, bool, Any]]:
+    """
+    Run fn(item) across `workers` threads and yield (item, ok, value) in input
+    order. `value` is the return value when ok is True, else the exception.
+
+    Workers only pick items whose host lane has room, so a long run of links
+    for one host does not park every thread behind that host's cap. `window`
+    bounds how far workers may run ahead of the consumer (memory cap).
+    workers <= 1 runs serially on the calling thread.
+    """
+    items = list(items)
+    throttle = throttle or HostThrottle()
+
+    if workers <= 1 or len(items) <= 1:
+        for item in items:
+            lane = throttle.acquire(url_of(item))
+            try:
+                yield item, True, fn(item)
+            except Exception as e:
+                yield item, False, e
+            finally:
+                throttle.finish(lane)
+        return
+
+    # pending work grouped by lane, each lane in input order
+    lanes: "OrderedDict[str, deque]" = OrderedDict()
+    for idx, item in enumerate(items):
+        lanes.setdefault(throttle.lane(url_of(item)), deque()).append(idx)
+
+    results: Dict[int, Tuple[bool, Any]] = {}
+    state = {"consumed": 0, "stop": False}
+    cond = threading.Condition()
+
+    def _pick() -> Tuple[Optional[int], Optional[str], float]:
+        """Return (idx, lane, 0) to run now, or (None, None, wait_seconds)."""
+        limit_idx = state["consumed"] + max(1, window)
+        best_wait = 0.5
+        for lane, queue in lanes.items():
+            if not queue or queue[0] >= limit_idx:
+                continue
+            wait = throttle.ready_in(lane)
+            if wait is None:
+                continue
+            if wait <= 0 and throttle.try_start(lane):
+                return queue.popleft(), lane, 0.0
+            best_wait = min(best_wait, max(wait, 0.01))
+        return None, None, best_wait
+
+    def _worker() -> None:
+        try:
+            while True:
+                with cond:
+                    while True:
+                        if state["stop"] or not any(lanes.values()):
+                            return
+                        idx, lane, wait = _pick()
+                        if idx is not None:
+                            break
+                        cond.wait(timeout=wait)
+                try:
+                    value = (True, fn(items[idx]))
+                except Exception as e:
+                    value = (False, e)
+                finally:
+                    throttle.finish(lane)
+                with cond:
+                    results[idx] = value
+                    cond.notify_all()
+        finally:
+            if on_thread_exit is not None:
+                try:
+                    on_thread_exit()
+                except Exception:
+                    pass
+
+    threads = [
+        threading.Thread(target=_worker, name=f"fetch-worker-{n}", daemon=True)
+        for n in range(min(workers, len(items)))
+    ]
+    for t in threads:
+        t.start()
+
+    try:
+        for idx, item in enumerate(items):
+            with cond:
+                while idx not in results:
+                    cond.wait(timeout=0.5)
+                ok, value = results.pop(idx)
+                state["consumed"] = idx + 1
+                cond.notify_all()
+            yield item, ok, value
+    finally:
+        with cond:
+            state["stop"] = True
+            cond.notify_all()
+        for t in threads:
+            t.join(timeout=60)
@@ -0,0 +1,184 @@
+"""
+http_client.py
+
+Run-scoped HTTP client for the job scraper.
+
+Every non-Playwright request goes through one shared requests.Session so
+repeated hits to the same ATS host reuse keep-alive connections instead of
+paying a fresh TCP + TLS handshake each time. Pool sizes are configurable,
+and responses are transparently decompressed (gzip/deflate always, brotli
+when the `brotli` or `brotlicffi` package is installed).
+
+This module has no dependency on po_job_scraper.py.
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+try:
+    import brotli  # noqa: F401  (urllib3 decodes "br" when this is importable)
+    HAVE_BROTLI = True
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        HAVE_BROTLI = True
+    except ImportError:
+        HAVE_BROTLI = False
+
+ACCEPT_ENCODING = "gzip, deflate, br" if HAVE_BROTLI else "gzip, deflate"
+
+# Defaults; the scraper overrides these through configure_http_client().
+POOL_CONNECTIONS = 32   # number of distinct hosts kept in the pool
+POOL_MAXSIZE = 8        # keep-alive connections kept per host
+
+
+@dataclass
+class FetchResult:
+    """
+    What one page fetch produced, whichever engine served it.
+
+    Carried alongside `details` so later stages (visibility scoring, cache,
+    archive) can reuse the status and body instead of fetching again.
+    `html` is None when the fetch failed.
+    """
+    url: str
+    final_url: str = ""
+    status: Optional[int] = None
+    html: Optional[str] = None
+    headers: Dict[str, str] = field(default_factory=dict)
+    engine: str = ""  # "requests" | "playwright"
+
+    @property
+    def ok(self) -> bool:
+        return bool(self.html)
+
+
+def fetch_result_from_response(url: str, resp: Optional[requests.Response]) -> FetchResult:
+    """Wrap a requests response (or None for a failed GET) in a FetchResult."""
+    if resp is None:
+        return FetchResult(url=url, engine="requests")
+    return FetchResult(
+        url=url,
+        final_url=str(resp.url or url),
+        status=resp.status_code,
+        html=resp.text,
+        headers=dict(resp.headers or {}),
+        engine="requests",
+    )
+
+
+def response_from_fetch_result(res: FetchResult) -> requests.Response:
+    """Rebuild a requests.Response from a FetchResult (used by replay)."""
+    resp = requests.Response()
+    resp.status_code = res.status if res.status is not None else 200
+    resp.url = res.final_url or res.url
+    resp.headers = CaseInsensitiveDict(res.headers or {})
+    # bodies are stored decoded; drop transfer encodings so .json()/.text just work
+    for k in ("Content-Encoding", "Transfer-Encoding", "Content-Length"):
+        resp.headers.pop(k, None)
+    resp._content = (res.html or "").encode("utf-8")
+    resp._content_consumed = True  # body is in memory: iter_content() must not read .raw
+    resp.encoding = "utf-8"
+    return resp
+
+
+_SESSION: Optional[requests.Session] = None
+_SESSION_LOCK = threading.Lock()
+_DEFAULT_HEADERS: Dict[str, str] = {}
+
+# Optional FetchArchive (fetch_archive.py) for --record / --replay
+_ARCHIVE: Any = None
+
+
+def set_fetch_archive(archive: Any) -> None:
+    """Record every request into `archive`, or serve them from it when replaying."""
+    global _ARCHIVE
+    _ARCHIVE = archive
+
+
+def configure_http_client(
+    *,
+    headers: Optional[Dict[str, str]] = None,
+    pool_connections: Optional[int] = None,
+    pool_maxsize: Optional[int] = None,
+) -> None:
+    """
+    Set default headers and pool sizes. Takes effect for the next session,
+    so call it before the first request (an existing session is closed).
+    """
+    global POOL_CONNECTIONS, POOL_MAXSIZE, _DEFAULT_HEADERS
+    if headers is not None:
+        _DEFAULT_HEADERS = dict(headers)
+    if pool_connections:
+        POOL_CONNECTIONS = int(pool_connections)
+    if pool_maxsize:
+        POOL_MAXSIZE = int(pool_maxsize)
+    close_http_session()
+
+
+def _build_session() -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        pool_block=False,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({"Accept-Encoding": ACCEPT_ENCODING})
+    session.headers.update(_DEFAULT_HEADERS)
+    return session
+
+
+def get_http_session() -> requests.Session:
+    """Return the shared session, creating it on first use."""
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                _SESSION = _build_session()
+    return _SESSION
+
+
+def _request(method: str, url: str, **kwargs: Any) -> requests.Response:
+    archive = _ARCHIVE
+    payload = kwargs.get("data", kwargs.get("json"))
+    params = kwargs.get("params")
+    if archive is not None and archive.replaying:
+        res = archive.lookup(url, method=method, payload=payload, params=params)
+        if res is None:
+            raise requests.ConnectionError(f"Not in replay archive: {method} {url}")
+        return response_from_fetch_result(res)
+
+    resp = get_http_session().request(method, url, **kwargs)
+    if archive is not None and archive.recording:
+        archive.record(fetch_result_from_response(url, resp), method=method, payload=payload, params=params)
+    return resp
+
+
+def http_get(url: str, **kwargs: Any) -> requests.Response:
+    """requests.get() over the shared connection pool."""
+    return _request("GET", url, **kwargs)
+
+
+def http_post(url: str, **kwargs: Any) -> requests.Response:
+    """requests.post() over the shared connection pool."""
+    return _request("POST", url, **kwargs)
+
+
+def close_http_session() -> None:
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is not None:
+            try:
+                _SESSION.close()
+            except Exception:
+                pass
+        _SESSION = None
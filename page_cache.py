@@ -0,0 +1,179 @@
+"""
+page_cache.py
+
+Persistent response cache for the job scraper.
+
+Pages are stored in a small SQLite file (stdlib only) keyed by URL, with
+the body zlib-compressed. Each host has its own TTL:
+
+  - fresh entry           -> served from disk, no network at all
+  - stale entry with an ETag / Last-Modified
+                          -> caller revalidates with If-None-Match /
+                             If-Modified-Since; a 304 refreshes the entry
+  - anything else         -> normal fetch, then store()
+
+Hit / revalidated / miss counts are kept for the run summary.
+This module has no dependency on po_job_scraper.py.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from http_client import FetchResult
+
+
+@dataclass
+class CacheEntry:
+    result: FetchResult
+    fetched_at: float
+    fresh: bool
+    etag: str = ""
+    last_modified: str = ""
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Validators to send when revalidating a stale entry."""
+        headers: Dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def _header(headers: Dict[str, str], name: str) -> str:
+    name = name.lower()
+    for k, v in (headers or {}).items():
+        if str(k).lower() == name:
+            return str(v or "")
+    return ""
+
+
+class PageCache:
+    """SQLite-backed URL -> FetchResult cache with per-host TTLs (seconds)."""
+
+    def __init__(self, cache_dir: str, ttl_by_host: Optional[Dict[str, float]] = None) -> None:
+        os.makedirs(cache_dir, exist_ok=True)
+        self.path = os.path.join(cache_dir, "pages.sqlite3")
+        self.ttl_by_host = dict(ttl_by_host or {})
+        self.ttl_by_host.setdefault("default", 6 * 3600)
+
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS pages (
+                url           TEXT PRIMARY KEY,
+                final_url     TEXT,
+                status        INTEGER,
+                headers       TEXT,
+                body          BLOB,
+                engine        TEXT,
+                etag          TEXT,
+                last_modified TEXT,
+                fetched_at    REAL
+            )
+            """
+        )
+        self._db.commit()
+
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+
+    # ---- TTLs --------------------------------------------------------------
+    def ttl_for(self, url: str) -> float:
+        from urllib.parse import urlparse
+
+        host = (urlparse(url).netloc or "").lower()
+        host = host[4:] if host.startswith("www.") else host
+        for key, ttl in self.ttl_by_host.items():
+            if key != "default" and (host == key or host.endswith("." + key)):
+                return float(ttl)
+        return float(self.ttl_by_host["default"])
+
+    # ---- read / write ------------------------------------------------------
+    def lookup(self, url: str) -> Optional[CacheEntry]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT final_url, status, headers, body, engine, etag, last_modified, fetched_at "
+                "FROM pages WHERE url = ?",
+                (url,),
+            ).fetchone()
+        if not row:
+            return None
+        final_url, status, headers, body, engine, etag, last_modified, fetched_at = row
+        try:
+            html = zlib.decompress(body).decode("utf-8") if body else None
+            headers = json.loads(headers or "{}")
+        except Exception:
+            return None
+        ttl = self.ttl_for(url)
+        return CacheEntry(
+            result=FetchResult(
+                url=url,
+                final_url=final_url or url,
+                status=status,
+                html=html,
+                headers=headers,
+                engine=engine or "",
+            ),
+            fetched_at=float(fetched_at or 0),
+            fresh=ttl > 0 and (time.time() - float(fetched_at or 0)) < ttl,
+            etag=etag or "",
+            last_modified=last_modified or "",
+        )
+
+    def store(self, result: FetchResult) -> None:
+        """Cache a successful fetch. Failed or non-2xx results are ignored."""
+        if not result or not result.html:
+            return
+        if result.status is not None and not (200 <= int(result.status) < 300):
+            return
+        body = zlib.compress(result.html.encode("utf-8"), 6)
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO pages "
+                "(url, final_url, status, headers, body, engine, etag, last_modified, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    result.url,
+                    result.final_url or result.url,
+                    result.status,
+                    json.dumps(result.headers or {}),
+                    body,
+                    result.engine,
+                    _header(result.headers, "ETag"),
+                    _header(result.headers, "Last-Modified"),
+                    time.time(),
+                ),
+            )
+            self._db.commit()
+
+    def touch(self, url: str) -> None:
+        """Mark an entry fresh again after a 304 Not Modified."""
+        with self._lock:
+            self._db.execute("UPDATE pages SET fetched_at = ? WHERE url = ?", (time.time(), url))
+            self._db.commit()
+
+    def note(self, outcome: str) -> None:
+        """Count a lookup outcome: "hits", "revalidated" or "misses"."""
+        with self._lock:
+            setattr(self, outcome, getattr(self, outcome) + 1)
+
+    def close(self) -> None:
+        with self._lock:
+            try:
+                self._db.close()
+            except Exception:
+                pass
+
+    def stats_line(self) -> str:
+        return f"hits {self.hits}, revalidated (304) {self.revalidated}, misses {self.misses}"
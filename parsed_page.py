@@ -0,0 +1,167 @@
+"""
+parsed_page.py
+
+Single-parse document model for job detail pages.
+
+A detail page used to be handed around as a raw HTML string and every
+extractor built its own BeautifulSoup from it (five or more parses per
+Built In page). A ParsedPage parses on first use and lazily exposes what
+the extractors need:
+
+  page.html            the raw string (for regex / substring checks)
+  page.soup            one shared tree. Treat it as read-only.
+  page.fresh_soup()    a separate tree for callers that prune/mutate
+  page.text            soup.get_text(" ", strip=True)
+  page.ld_json         parsed <script type="application/ld+json"> blocks
+  page.meta            <meta name|property> -> content
+  page.fragment(m)     memoized parse of an unescaped inner HTML fragment
+                       (Built In tooltip payloads and similar)
+
+Extractors accept either a string or a ParsedPage; `ParsedPage.of()`
+normalizes both so old call sites keep working.
+
+Every parse goes through make_soup(), which uses lxml when it is
+installed and falls back to "html.parser". Set SCRAPER_HTML_PARSER to
+force a backend; tools/check_parser_parity.py compares them on the saved
+pages in docs/.
+
+This module has no dependency on po_job_scraper.py.
+"""
+
+from __future__ import annotations
+
+import html as _html
+import json
+import os
+from typing import Any, Dict, List, Optional
+
+from bs4 import BeautifulSoup
+
+
+# BeautifulSoup tree builders in order of preference. lxml is a C parser
+# and several times faster than the pure-Python "html.parser" on large
+# Built In / Dice pages; "html.parser" is always available.
+PARSER_PREFERENCE = ("lxml", "html.parser")
+
+
+def _builder_available(name: str) -> bool:
+    if name == "html.parser":
+        return True
+    try:
+        __import__(name)
+    except ImportError:
+        return False
+    return True
+
+
+def pick_html_parser(requested: Optional[str] = None) -> str:
+    """
+    Resolve the parser name. An explicit request (or SCRAPER_HTML_PARSER)
+    wins when that builder is installed; otherwise the fastest available.
+    """
+    requested = (requested or os.environ.get("SCRAPER_HTML_PARSER") or "").strip()
+    if requested and _builder_available(requested):
+        return requested
+    for name in PARSER_PREFERENCE:
+        if _builder_available(name):
+            return name
+    return "html.parser"
+
+
+HTML_PARSER = pick_html_parser()
+
+
+def set_html_parser(name: str) -> str:
+    """Switch the backend for every later make_soup() / ParsedPage parse."""
+    global HTML_PARSER
+    HTML_PARSER = pick_html_parser(name)
+    return HTML_PARSER
+
+
+def make_soup(markup: Any) -> BeautifulSoup:
+    """BeautifulSoup(markup) with the configured backend."""
+    return BeautifulSoup(markup or "", HTML_PARSER)
+
+
+class ParsedPage:
+    """One detail page, parsed at most once per view."""
+
+    def __init__(self, html: Optional[str], url: str = "") -> None:
+        self.html: str = html or ""
+        self.url = url
+        self._soup: Optional[BeautifulSoup] = None
+        self._text: Optional[str] = None
+        self._ld_json: Optional[List[Any]] = None
+        self._meta: Optional[Dict[str, str]] = None
+        self._fragments: Dict[str, BeautifulSoup] = {}
+
+    @classmethod
+    def of(cls, html_or_page: Any, url: str = "") -> "ParsedPage":
+        """Return `html_or_page` if it is already a ParsedPage, else wrap the string."""
+        if isinstance(html_or_page, ParsedPage):
+            return html_or_page
+        return cls(html_or_page, url)
+
+    def __len__(self) -> int:
+        return len(self.html)
+
+    # ---- trees -------------------------------------------------------------
+    @property
+    def soup(self) -> BeautifulSoup:
+        """Shared tree. Do not decompose/extract nodes; use fresh_soup() for that."""
+        if self._soup is None:
+            self._soup = make_soup(self.html)
+        return self._soup
+
+    def fresh_soup(self) -> BeautifulSoup:
+        """A private tree the caller may mutate (pruning sections, etc)."""
+        return make_soup(self.html)
+
+    def fragment(self, markup: str) -> BeautifulSoup:
+        """Parse an inner HTML fragment once, however many extractors ask for it."""
+        key = markup or ""
+        frag = self._fragments.get(key)
+        if frag is None:
+            frag = make_soup(key)
+            self._fragments[key] = frag
+        return frag
+
+    @staticmethod
+    def unescape_twice(raw: str) -> str:
+        """Tooltip payloads are entity-encoded twice on Built In."""
+        return _html.unescape(_html.unescape(raw or ""))
+
+    # ---- derived views -----------------------------------------------------
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            self._text = self.soup.get_text(" ", strip=True)
+        return self._text
+
+    @property
+    def ld_json(self) -> List[Any]:
+        """Decoded JSON-LD blocks in document order; undecodable blocks are skipped."""
+        if self._ld_json is None:
+            blocks: List[Any] = []
+            for script in self.soup.select('script[type="application/ld+json"]'):
+                raw = (script.string or "").strip()
+                if not raw:
+                    continue
+                try:
+                    blocks.append(json.loads(raw))
+                except Exception:
+                    continue
+            self._ld_json = blocks
+        return self._ld_json
+
+    @property
+    def meta(self) -> Dict[str, str]:
+        """First content value per <meta name=...> / <meta property=...> key (lowercased)."""
+        if self._meta is None:
+            meta: Dict[str, str] = {}
+            for tag in self.soup.find_all("meta"):
+                key = (tag.get("property") or tag.get("name") or "").strip().lower()
+                if key and key not in meta and tag.get("content") is not None:
+                    meta[key] = str(tag.get("content") or "")
+            self._meta = meta
+        return self._meta
@@ -51,15 +51,15 @@ from contextlib import contextmanager
 from urllib import robotparser
 from playwright.sync_api import sync_playwright
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple, List, Iterable
-from urllib.parse import urlparse, urljoin, urlsplit, parse_qs, urlunparse, parse_qsl, urlencode
+from typing import Any, Callable, Dict, Optional, Tuple, List, Iterable
+from urllib.parse import urlparse, urljoin, urlsplit, parse_qs
 from pathlib import Path
 from datetime import datetime, timedelta
 from dateutil import parser as dateparser
 from bs4 import BeautifulSoup
-from contextlib import contextmanager
+from contextlib import contextmanager, redirect_stderr
 from classification_rules import ClassificationConfig, classify_keep_or_skip, classify_work_mode, _as_listish
-from edsurge_jobs import scrape_edsurge_jobs
+from edsurge_jobs import fetch_edsurge_jobs
 from gsheets_utils import (
     init_gs_libs,
     log_startup_warning_if_needed,
@@ -70,6 +70,34 @@ from gsheets_utils import (
     fetch_prior_decisions,
     push_rows_to_google_sheet,
 )
+from page_cache import PageCache
+from fetch_archive import FetchArchive
+from seen_index import SeenJob, SeenJobIndex, fingerprint
+from workday_client import WorkdayClient, parse_workday_listing, tenant_host_from_html
+from remote_feeds import RemoteFeeds
+from feed_source import FeedReader
+from ats_boards import (
+    ApiPosting,
+    ashby_board_slug,
+    ashby_job_id,
+    fetch_ashby_board,
+    fetch_dice_search,
+    fetch_greenhouse_board,
+    fetch_lever_board,
+    greenhouse_board_token,
+    lever_company_slug,
+    posting_page_html,
+)
+from career_boards import CareerBoardCache, find_ats_boards
+from url_canon import canonicalize, link_key
+from parsed_page import ParsedPage, make_soup, set_html_parser
+from http_client import (
+    FetchResult,
+    configure_http_client,
+    fetch_result_from_response,
+    http_get,
+    set_fetch_archive,
+)
 from logging_utils import (
     info,
     warn,
@@ -82,6 +110,12 @@ from logging_utils import (
     log_line, trace_chips,
 )
 from config.debug_flags import debug_print, load_debug_config
+from config.source_catalog import (
+    FEED_SOURCES,
+    KNOWN_SOURCE_LABELS,
+    PLAYWRIGHT_DOMAINS as CATALOG_PLAYWRIGHT_DOMAINS,
+    SOURCE_METADATA,
+)
 DEBUG_CFG = load_debug_config()
 
 DOT  = "."              # 1 dot
@@ -102,6 +136,15 @@ import sys, os, time
 # for the live progress spinner thread
 import threading
 
+# optional process pool for the detail extraction stage
+import io
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
+
+# True inside --extract-processes workers (spawned children re-import this
+# module), so one-time startup side effects below run in the parent only.
+IN_EXTRACT_WORKER = multiprocessing.parent_process() is not None
+
 
 # --- Unified CLI args & run configuration (single parse, early) ---
 import argparse
@@ -606,6 +649,25 @@ def _parse_args():
     dest="only_url",
     default="",
     help="Process exactly one job detail URL (skips board link discovery).",)
+    p.add_argument("--workers", type=int, default=DETAIL_WORKERS,
+                   help="Concurrent detail-page fetches across hosts (1 = serial)")
+    p.add_argument("--extract-processes", type=int, default=EXTRACT_PROCESSES,
+                   help="Extract detail pages in N worker processes (0 = on the main thread; -1 = one per core)")
+    p.add_argument("--no-title-prefilter", action="store_true",
+                   help="Fetch every detail page, even when the listing title is an obvious non-target")
+    p.add_argument("--revisit-days", type=float, default=SEEN_REVISIT_DAYS,
+                   help="Reuse keep/skip decisions made within this many days for unchanged links (0 = re-fetch all)")
+    p.add_argument("--no-cache", action="store_true",
+                   help="Ignore the on-disk page and career-board caches and fetch everything live")
+    p.add_argument("--cache-dir", type=str, default="",
+                   help=f"Page cache directory (default: {CACHE_DIR})")
+    p.add_argument("--html-parser", type=str, default="",
+                   help="BeautifulSoup backend: lxml or html.parser (default: lxml when installed)")
+    archive = p.add_mutually_exclusive_group()
+    archive.add_argument("--record", type=str, default="", metavar="DIR",
+                         help="Archive every fetched response into DIR for later --replay")
+    archive.add_argument("--replay", type=str, default="", metavar="DIR",
+                         help="Serve every fetch from an archive recorded with --record (no network)")
 
     # salary knobs
     p.add_argument("--floor", type=int, default=110_000,
@@ -775,7 +837,8 @@ def backup_all_py_to_archive(keep_last: int | None = None, max_age_days: int | N
 
 
 # --- HOW TO USE (uncomment exactly one) ---
-backup_all_py_to_archive()                  # 1) keep ALL backups
+if not IN_EXTRACT_WORKER:
+    backup_all_py_to_archive()              # 1) keep ALL backups
 # backup_all_py_to_archive(keep_last=10)    # 2) keep last 10 per file
 # backup_all_py_to_archive(max_age_days=30) # 3) delete backups older than 30 days
 # backup_all_py_to_archive(keep_last=10, max_age_days=60)  # combine both
@@ -799,8 +862,8 @@ def ts_pprint(*args, **kwargs):
 
 REQUIRED_PACKAGES = [
     "requests",
-    "requests-cache",
     "beautifulsoup4",
+    "lxml",             # fast BeautifulSoup backend (parsed_page.py falls back to html.parser)
     "python-dateutil",
     "playwright",
     "wcwidth",
@@ -929,86 +992,17 @@ from dateutil.tz import tzoffset
 from dateutil.parser import UnknownTimezoneWarning
 warnings.filterwarnings("ignore", category=UnknownTimezoneWarning)
 
-from urllib.parse import urlparse, parse_qsl, urlencode
-
-CASE_SENSITIVE_PATH_HOSTS = {
-    "ycombinator.com",
-}
-
-def _host_is_case_sensitive(host: str) -> bool:
-    h = (host or "").lower()
-    return any(dom in h for dom in CASE_SENSITIVE_PATH_HOSTS)
-
-def normalize_url_for_key(u: str) -> str:
-    """Stable URL for dedupe and job keys. Lowercase host always.
-    Lowercase path except for known case sensitive hosts (YC).
-    """
-    if not u:
-        return ""
-    p = urlparse(u.strip())
-
-    scheme = (p.scheme or "https").lower()
-    host = (p.netloc or "").lower()
-
-    path_raw = (p.path or "/").rstrip("/") or "/"
-    path = path_raw if _host_is_case_sensitive(host) else path_raw.lower()
-
-    # filter and sort query params for stability
-    drop = {"utm_source","utm_medium","utm_campaign","utm_term","utm_content",
-            "ref","referrer","source","_hsmi","_hsenc","gh_src","page","p","start"}
-    kept = [(k.lower(), v) for k, v in parse_qsl(p.query, keep_blank_values=True) if k.lower() not in drop]
-    kept.sort()
-
-    query = urlencode(kept, doseq=True)
-    return urlunparse((scheme, host, path, "", query, ""))
-
-
 def _job_key(details: dict, link: str) -> str:
     """
     Build a stable key so we only process the same job once per run.
 
-    Normalize the URL so tracking/pagination params don't create new keys
-    for the same job, while preserving path casing (needed for some boards).
+    Same key as discovery dedupe and the seen-job index (url_canon.link_key),
+    so tracking/pagination params and Built In mirrors don't create new keys.
     """
     job_url = (details.get("Job URL") or details.get("job_url") or link or "").strip()
     if not job_url:
         return ""
-
-    try:
-        p = urlparse(job_url)
-
-        scheme = (p.scheme or "https").lower()
-        host = (p.netloc or "").lower()
-
-        # Preserve path casing, only normalize trailing slash
-        path = (p.path or "/").rstrip("/") or "/"
-
-        drop = {
-            "utm_source", "utm_medium", "utm_campaign", "utm_term", "utm_content",
-            "ref", "referrer", "source", "_hsmi", "_hsenc", "gh_src", "page", "p", "start",
-        }
-
-        kept = []
-        for k, v in parse_qsl(p.query, keep_blank_values=True):
-            k_norm = (k or "").lower()
-            if k_norm in drop:
-                continue
-            kept.append((k_norm, v))
-
-        kept.sort()
-        query = urlencode(kept, doseq=True)
-
-        # Built In cross-board dedupe:
-        # Use path + normalized query only, so the key does not imply a specific host.
-        if host in {"builtin.com", "www.builtin.com", "builtinseattle.com", "www.builtinseattle.com", "builtinvancouver.org", "www.builtinvancouver.org"}:
-            return f"{path}?{query}" if query else path
-
-        clean = urlunparse((scheme, host, path, "", query, ""))
-        return clean or job_url
-
-    except Exception:
-        # Last resort: preserve original URL casing
-        return job_url
+    return link_key(job_url) or job_url
 
 def parse_date_relaxed(s):
     """Parse many date strings while neutralizing stray 'tzname' tokens like 'WI' or 'IL'.
@@ -1097,9 +1091,10 @@ def progress(i: int, total: int, kept: int, skipped: int) -> None:
     progress_tick(i=i, kept=kept_count, skip=skip_count)
 
 # --- Environment banner ---
-env(f".Using Python from: {sys.executable}")
-env(f".Virtual environment: {'Yes' if IN_VENV else 'No'}")
-env(f".Working directory: {os.getcwd()}")
+if not IN_EXTRACT_WORKER:
+    env(f".Using Python from: {sys.executable}")
+    env(f".Virtual environment: {'Yes' if IN_VENV else 'No'}")
+    env(f".Working directory: {os.getcwd()}")
 
 DEBUG_REMOTE = False  # flip to True only when tuning remote rules
 
@@ -1256,8 +1251,8 @@ def _yc_location_from_next_data(soup) -> str | None:
 
     return walk(data)
 
-def _yc_extract_location_from_embedded_job_payload(html: str) -> str | None:
-    soup = BeautifulSoup(html, "html.parser")
+def _yc_extract_location_from_embedded_job_payload(html: str | ParsedPage) -> str | None:
+    soup = ParsedPage.of(html).soup
 
     root = soup.select_one('[id^="WaasShowJobPage-react-component-"][data-page]')
     if not root:
@@ -1268,7 +1263,7 @@ def _yc_extract_location_from_embedded_job_payload(html: str) -> str | None:
         return None
 
     try:
-        data = json.loads(html.unescape(raw))
+        data = json.loads(_html.unescape(raw))
     except Exception:
         return None
 
@@ -1292,19 +1287,8 @@ def _yc_extract_location_from_embedded_job_payload(html: str) -> str | None:
 
     return None
 
-def _yc_extract_location_from_jsonld(html: str) -> str | None:
-    soup = BeautifulSoup(html, "html.parser")
-
-    for script in soup.select('script[type="application/ld+json"]'):
-        raw = (script.string or "").strip()
-        if not raw:
-            continue
-
-        try:
-            data = json.loads(raw)
-        except Exception:
-            continue
-
+def _yc_extract_location_from_jsonld(html: str | ParsedPage) -> str | None:
+    for data in ParsedPage.of(html).ld_json:
         objs = data if isinstance(data, list) else [data]
         for obj in objs:
             if not isinstance(obj, dict):
@@ -1543,188 +1527,6 @@ def _apply_builtin_family_hero_lock(details: dict, host: str, soup) -> None:
         except Exception:
             pass
 
-def workday_links_from_listing(listing_url: str, max_results: int = 250) -> list[str]:
-    """
-    Convert a Workday listing URL into job detail links by querying the cxs JSON API.
-    Handles both myworkdaysite and myworkdayjobs patterns.
-    """
-    # If this is already a detail page, just return it
-    if "/job/" in (p.path or ""):
-        return [listing_url]
-
-
-    p = up.urlparse(listing_url)
-    host = (p.netloc or "").lower()
-    parts = [s for s in (p.path or "").split("/") if s]
-    qs = up.parse_qs(p.query)
-    search = " ".join(qs.get("q", [])).strip() or ""
-
-    # Normalize locale prefix in path: /en-us/recruiting/... -> /recruiting/...
-    if parts and re.fullmatch(r"[a-z]{2}-[a-z]{2}", parts[0], re.I):
-        parts = parts[1:]
-
-
-    def _html_fallback_links(listing_url: str) -> list[str]:
-        html = get_html(listing_url) or ""
-        if not html:
-            return []
-        links = find_job_links(html, listing_url) or []
-        # keep only likely Workday detail links
-        out = []
-        for lk in links:
-            if "/job/" in lk or "/details/" in lk:
-                out.append(lk)
-
-        # de-dupe preserve order
-        seen, deduped = set(), []
-        for u in out:
-            if u not in seen:
-                seen.add(u)
-                deduped.append(u)
-        return deduped
-
-    # If host is wdN.myworkdayjobs.com, try to discover the real tenant host
-    if re.fullmatch(r"wd\d+\.myworkdayjobs\.com", host, re.I):
-        try:
-            html = get_html(listing_url) or ""
-            if not html:
-                log_line("WARN", f".[WORKDAY] Could not fetch listing HTML for tenant sniff (url={listing_url})")
-            else:
-                # Sniff a tenant host from HTML (embedded URLs)
-                m = re.search(r'https?://([a-z0-9-]+)\.(wd\d+)\.myworkdayjobs\.com', html, re.I)
-                if m:
-                    tenant_guess, wd_num = m.group(1), m.group(2)
-                    host = f"{tenant_guess}.{wd_num}.myworkdayjobs.com"
-                    # optional: log_line("DEBUG", f".[WORKDAY] Sniffed tenant host: {host}")
-        except Exception as e:
-            log_print("WARN", f".[WORKDAY] tenant sniff failed (error={e}, url={listing_url})")
-
-    # Infer tenant and site
-    tenant = None
-    site = None
-
-    if parts and parts[0] == "recruiting" and len(parts) >= 3:
-        tenant = parts[1]
-        site = parts[2]
-    else:
-        sub = host.split(".")[0]
-        if not re.fullmatch(r"wd\d+", sub, re.I):
-            tenant = sub
-        if not tenant and len(parts) >= 2:
-            tenant = parts[0]
-        if len(parts) >= 1:
-            site = parts[0]
-
-    if not tenant:
-        log_print(
-            "WARN",
-            f".[WORKDAY] Could not infer tenant (host={host}, parts={parts}, url={listing_url}). "
-            "Falling back to HTML link extraction (page 1 only)."
-        )
-        return _html_fallback_links(listing_url)
-
-    if not site:
-        site = tenant
-
-    api_host = _workday_api_host(host)
-    jobs = _wd_jobs(api_host, tenant, site, search, limit=50, max_results=max_results)
-
-    if not jobs:
-        return _html_fallback_links(listing_url)
-
-    out: list[str] = []
-    for j in jobs:
-        ext = j.get("externalUrl") or j.get("externalPath") or j.get("url")
-        if not ext:
-            continue
-        out.append(up.urljoin(f"https://{host}/", ext))
-
-    # De-dupe while preserving order
-    seen, deduped = set(), []
-    for u in out:
-        if u not in seen:
-            seen.add(u)
-            deduped.append(u)
-    return deduped
-
-def _workday_api_host(ui_host: str) -> str:
-    """
-    Convert a Workday UI host to the likely API host.
-    Examples:
-      velera.wd5.myworkdayjobs.com -> wd5.myworkday.com
-      wd5.myworkdaysite.com        -> wd5.myworkday.com
-      wd5.myworkday.com            -> wd5.myworkday.com
-    """
-    h = (ui_host or "").lower()
-
-    m = re.search(r"(wd\d+)\.", h)
-    if m:
-        return f"{m.group(1)}.myworkday.com"
-
-    # last resort, keep original
-    return ui_host
-
-
-def _wd_jobs(host: str, tenant: str, site: str, search: str, limit: int = 50, max_results: int = 250) -> list[dict]:
-    """
-    Query Workday cxs jobs endpoint and return raw job dicts.
-    Correct path is: /wday/cxs/{tenant}/jobs
-    """
-    #log_line("DEBUG", f".[WORKDAY] _wd_jobs entered (tenant={tenant}, site={site}, host={host})")
-
-    url = f"https://{host}/wday/cxs/{tenant}/{site}/jobs"
-    out, offset = [], 0
-    headers = {
-        "Accept": "application/json, text/plain, */*",
-        "Content-Type": "application/json;charset=UTF-8",
-        "User-Agent": "Mozilla/5.0"
-    }
-
-    while True:
-        remaining = max_results - len(out)
-        if remaining <= 0:
-            break
-
-        current_limit = min(limit, remaining)
-        payload = {"limit": current_limit, "offset": offset, "searchText": search}
-
-        r = requests.post(url, headers=headers, data=json.dumps(payload), timeout=30)
-
-        data = _safe_resp_json(r, context=f".[WORKDAY] cxs jobs (api={url})")
-        if not data:
-            # returning [] triggers your HTML fallback upstream
-            return []
-
-        total_hint = (
-            data.get("total")
-            or data.get("totalCount")
-            or data.get("totalHits")
-            or data.get("totalRecords")
-        )
-
-        items = data.get("jobPostings") or data.get("jobs") or data.get("data") or []
-        if isinstance(items, dict):
-            items = []
-        if not isinstance(items, list):
-            items = []
-        if not items:
-            break
-
-        out.extend(items)
-
-        if len(out) >= max_results:
-            break
-        if total_hint is not None and len(out) >= int(total_hint):
-            break
-        if total_hint is None and len(items) < current_limit:
-            break
-
-        offset += len(items)
-
-    return out
-
-
-
 def _set_qp(url: str, **updates) -> str:
     p = up.urlparse(url)
     q = up.parse_qs(p.query)
@@ -1795,8 +1597,11 @@ def parse_remotive(soup, job_url):
 
     return out
 
-def collect_dice_links(listing_url: str, max_pages: int = 25) -> list[str]:
-    """Walk Dice /jobs?page=N pagination and dedupe links across pages."""
+def collect_dice_links(listing_url: str, max_pages: int = 25, first_html: str | None = None) -> list[str]:
+    """
+    Walk Dice /jobs?page=N pagination and dedupe links across pages.
+    `first_html` is the already-fetched first page, so it is not fetched again.
+    """
     seen, out = set(), []
 
     # Try to start from whatever page the URL already has
@@ -1810,7 +1615,12 @@ def collect_dice_links(listing_url: str, max_pages: int = 25) -> list[str]:
         url = _set_qp(listing_url, page=page)
         set_source_tag(url)
 
-        html = get_html(url)  # will use Playwright for dice.com in your setup
+        if page == start_page and first_html:
+            html = first_html
+        elif _claim_listing_page(url):
+            html = get_html(url)  # will use Playwright for dice.com in your setup
+        else:
+            break  # another walk already covered this page
         if not html:
             break
 
@@ -1901,7 +1711,7 @@ def muse_company_from_header(html: str) -> str:
     The Muse: <a class="job-header_jobHeaderCompanyNameProgrammatic ...">Equinix, Inc</a>
     """
     try:
-        soup = BeautifulSoup(html or "", "html.parser")
+        soup = make_soup(html or "")
         a = soup.select_one("a.job-header_jobHeaderCompanyNameProgrammatic")
         if a and a.get_text(strip=True):
             return a.get_text(strip=True)
@@ -1979,8 +1789,11 @@ def extract_generic_dates(html: str) -> dict:
 
 
 import re
-def collect_hubspot_links(listing_url: str, max_pages: int = 25) -> list[str]:
-    """Walk HubSpot /careers/jobs?page=N pagination without double-counting page 1, with per-page logs."""
+def collect_hubspot_links(listing_url: str, max_pages: int = 25, first_html: str | None = None) -> list[str]:
+    """
+    Walk HubSpot /careers/jobs?page=N pagination without double-counting page 1, with per-page logs.
+    `first_html` is the already-fetched first page, so it is not fetched again.
+    """
     seen, out = set(), []
     try:
         start_page = int((up.parse_qs(up.urlparse(listing_url).query).get("page") or ["1"])[0])
@@ -1995,7 +1808,12 @@ def collect_hubspot_links(listing_url: str, max_pages: int = 25) -> list[str]:
         t0 = time.time()
         progress_clear_if_needed()
 
-        html = get_html(url)
+        if page == start_page and first_html:
+            html = first_html
+        elif _claim_listing_page(url):
+            html = get_html(url)
+        else:
+            break  # another walk already covered this page
         if not html:
             #log_print("[WARN", f"]{DOT3}{DOTW} Warning: Failed to GET listing page: {listing_url}")
             progress_clear_if_needed()
@@ -2082,7 +1900,7 @@ MAX_PAGES_SIMPLYHIRED = 2  # bump later if you like
 
 
 def parse_hubspot_list_page(html: str, base: str) -> list[str]:
-    soup = BeautifulSoup(html, "html.parser")
+    soup = make_soup(html)
     out: list[str] = []
 
     for a in soup.select('a[href]'):
@@ -2120,7 +1938,7 @@ from html import unescape
 
 
 
-def enrich_dice_fields(details: dict, raw_html: str) -> dict:
+def enrich_dice_fields(details: dict, raw_html: str | ParsedPage) -> dict:
     """
     Normalize a Dice job-detail page.
 
@@ -2128,8 +1946,9 @@ def enrich_dice_fields(details: dict, raw_html: str) -> dict:
     - `raw_html` should be the full HTML (what you see in view-source).
     """
 
-    html = raw_html or ""
-    soup = BeautifulSoup(html, "html.parser")
+    page = ParsedPage.of(raw_html)
+    html = page.html
+    soup = page.soup
 
     try:
         board_data = parse_dice(soup, details.get("Job URL") or details.get("Apply URL") or "") or {}
@@ -2299,8 +2118,6 @@ def enrich_dice_fields(details: dict, raw_html: str) -> dict:
 
 def parse_hubspot_detail(html_or_soup, job_url: str) -> dict:
     """Extract title/company/location/snippet; capture Apply link if present."""
-    from bs4 import BeautifulSoup
-
     UNHELPFUL_TITLES = {
         "all open positions",
         "open positions",
@@ -2312,7 +2129,7 @@ def parse_hubspot_detail(html_or_soup, job_url: str) -> dict:
     if hasattr(html_or_soup, "find"):
         soup = html_or_soup
     else:
-        soup = BeautifulSoup(html_or_soup or "", "html.parser")
+        soup = make_soup(html_or_soup or "")
 
     # Title heuristics: prefer <h2> headings that are not "All Open Positions"
     title = ""
@@ -2548,8 +2365,11 @@ def parse_hubspot_detail(html_or_soup, job_url: str) -> dict:
     return details
 
 
-def collect_simplyhired_links(listing_url: str) -> list[str]:
-    """Collect job detail links from a SimplyHired search listing."""
+def collect_simplyhired_links(listing_url: str, first_html: str | None = None) -> list[str]:
+    """
+    Collect job detail links from a SimplyHired search listing.
+    `first_html` is the already-fetched first page, so it is not fetched again.
+    """
     found: list[str] = []
     seen = set()
 
@@ -2557,12 +2377,17 @@ def collect_simplyhired_links(listing_url: str) -> list[str]:
     pages = 0
     while page_url and pages < MAX_PAGES_SIMPLYHIRED:
         set_source_tag(listing_url)
-        html = get_html(page_url)
+        if pages == 0 and first_html:
+            html = first_html
+        elif pages == 0 or _claim_listing_page(page_url):
+            html = get_html(page_url)
+        else:
+            break  # another walk already covered this page
         if not html:
             #log_print("[WARN", f" ]{DOT3}{DOTW} Warning: Failed to GET listing page: {listing_url}")
             break
 
-        soup = BeautifulSoup(html, "html.parser")
+        soup = make_soup(html)
 
         # Job cards: links look like /job/<slug-or-id>...
         for a in soup.find_all("a", href=True):
@@ -2578,6 +2403,7 @@ def collect_simplyhired_links(listing_url: str) -> list[str]:
                     title_text = a.get_text(" ", strip=True) or ""
                     if title_text:
                         SIMPLYHIRED_TITLES[url] = title_text
+                        _note_listing_title(url, title_text)
 
         # Follow pagination via rel=next or aria-label="Next"
         next_link = soup.find("a", rel=lambda v: v and "next" in v) or \
@@ -3182,7 +3008,7 @@ def _extract_biv_hiring_remotely_location(html: str) -> str | None:
     m = re.search(r"\bHiring\s+Remotely\s+in\s+([^<]{1,80})", text, re.I)
     if not m:
         # Fallback: try soup text
-        soup = BeautifulSoup(html or "", "html.parser")
+        soup = make_soup(html or "")
         soup_text = " ".join(soup.get_text(" ", strip=True).split())
         m = re.search(r"\bHiring\s+Remotely\s+in\s+(.{1,80})", soup_text, re.I)
         if not m:
@@ -3260,7 +3086,7 @@ def _extract_biv_hiring_remotely_country_chips(html: str) -> list[str]:
 
     return out
 
-def _builtin_tooltip_locations_from_html(html: str) -> list[str]:
+def _builtin_tooltip_locations_from_html(html: str | ParsedPage) -> list[str]:
     """
     Extract job locations from Built In tooltip HTML.
 
@@ -3270,8 +3096,8 @@ def _builtin_tooltip_locations_from_html(html: str) -> list[str]:
     - Never fall back to selecting all divs
     - Choose the best candidate tooltip by plausibility scoring
     """
-    import html as _html
-    soup0 = BeautifulSoup(html or "", "html.parser")
+    page = ParsedPage.of(html)
+    soup0 = page.soup
     candidates = soup0.select("[data-bs-toggle='tooltip'], [data-toggle='tooltip']")
 
     def _clean(s: str) -> str:
@@ -3319,8 +3145,7 @@ def _builtin_tooltip_locations_from_html(html: str) -> list[str]:
         if not raw:
             continue
 
-        unesc = _html.unescape(_html.unescape(raw))
-        inner = BeautifulSoup(unesc, "html.parser")
+        inner = page.fragment(ParsedPage.unescape_twice(raw))
 
         # Strict extraction: only known containers
         locs = [d.get_text(" ", strip=True) for d in inner.select("div.col-lg-6")]
@@ -3369,14 +3194,13 @@ def _builtin_tooltip_locations_from_html(html: str) -> list[str]:
 
     return best
 
-def _builtin_primary_locations_from_html(html: str) -> list[str]:
+def _builtin_primary_locations_from_html(html: str | ParsedPage) -> list[str]:
     """
     Extract the job's own location tooltip by anchoring on the location icon
     within the job detail card. Avoids "Similar Jobs" tooltips.
     """
-    import html as _html
-
-    soup = BeautifulSoup(html or "", "html.parser")
+    page = ParsedPage.of(html)
+    soup = page.soup
 
     # Find the first location icon in the main job section
     # This is much more specific than scanning all tooltips.
@@ -3413,8 +3237,7 @@ def _builtin_primary_locations_from_html(html: str) -> list[str]:
     if not raw:
         return []
 
-    unesc = _html.unescape(_html.unescape(raw))
-    inner = BeautifulSoup(unesc, "html.parser")
+    inner = page.fragment(ParsedPage.unescape_twice(raw))
 
     # Built In Vancouver uses col-lg-6 in the tooltip HTML you pasted
     locs = [d.get_text(" ", strip=True) for d in inner.select("div.col-lg-6")]
@@ -3523,15 +3346,16 @@ _YC_LOC_RX = re.compile(
     r")\b"
 )
 
-def _yc_extract_location_from_label(html: str) -> str:
+def _yc_extract_location_from_label(html: str | ParsedPage) -> str:
     """
     Extract location from the rendered HTML using the explicit 'Location:' label.
     Works even when soup based regex scanning grabs prose.
     """
-    if not html:
+    page = ParsedPage.of(html)
+    if not page.html:
         return ""
 
-    soup = BeautifulSoup(html, "html.parser")
+    soup = page.soup
     main = soup.select_one("main") or soup.select_one('[role="main"]') or soup.body
     if not main:
         return ""
@@ -3780,7 +3604,7 @@ def apply_builtin_salary(details: Dict[str, Any]) -> None:
                 # Double-unescape to handle nested entities
                 import html as _html
                 unesc = _html.unescape(_html.unescape(raw))
-                inner = BeautifulSoup(unesc, "html.parser")
+                inner = make_soup(unesc)
 
                 # Prefer the common Built In structure first
                 locs = [d.get_text(" ", strip=True) for d in inner.select("div.col-lg-6")]
@@ -3911,10 +3735,11 @@ def canonicalize_chip_pipe(pipe: str) -> str:
             out.append(t)
     return "|".join(out)
 
-def extract_job_details(html: str, job_url: str) -> dict:
+def extract_job_details(html: str | ParsedPage, job_url: str) -> dict:
     """
     Generic page detail parser used by many boards.
     Safe and defensive: never raises, returns a dict with the keys our pipeline expects.
+    Accepts raw HTML or a ParsedPage; read-only lookups share page.soup.
     """
 
     company_from_header = None
@@ -3922,7 +3747,10 @@ def extract_job_details(html: str, job_url: str) -> dict:
     details: dict = {}
     builtin_meta: dict = {}
 
-    soup = BeautifulSoup(html or "", "html.parser")
+    page = ParsedPage.of(html, job_url)
+    html = page.html
+    # Pruned below by _prune_non_job_sections(), so it gets its own tree.
+    soup = page.fresh_soup()
     host = (up.urlparse(job_url).netloc or "").lower()
     best: list[str] = []
     _debug_biv_loc(
@@ -4025,7 +3853,7 @@ def extract_job_details(html: str, job_url: str) -> dict:
             # Built In: header work mode (Tier 1 fact)
             # -----------------------------------------
             try:
-                soup_header = BeautifulSoup(html or "", "html.parser")
+                soup_header = page.soup
 
                 # Try to keep this header scoped. If selectors miss, fall back to first chunk of page text.
                 header_txt = ""
@@ -4070,7 +3898,7 @@ def extract_job_details(html: str, job_url: str) -> dict:
             # Built In / BIV header badge (strong signal)
             # -----------------------------------------
             try:
-                soup_badge = BeautifulSoup(html or "", "html.parser")
+                soup_badge = page.soup
                 details["workplace_badge"] = (_builtin_extract_workplace_badge_text(soup_badge) or "").strip()
             except Exception:
                 details["workplace_badge"] = ""
@@ -4099,7 +3927,7 @@ def extract_job_details(html: str, job_url: str) -> dict:
             badge_rule = None
 
             try:
-                soup_badge = BeautifulSoup(html or "", "html.parser")
+                soup_badge = page.soup
                 details["workplace_badge"] = (_builtin_extract_workplace_badge_text(soup_badge) or "").strip()
             except Exception:
                 details["workplace_badge"] = ""
@@ -4127,18 +3955,16 @@ def extract_job_details(html: str, job_url: str) -> dict:
             builtin_meta = {}
 
         # Built In tooltip extraction must happen before any pruning.
-        # Use a fresh soup so later mutations cannot break the scan.
-        soup_tooltip = BeautifulSoup(html or "", "html.parser")
-        
+        # page.soup is never pruned, so later mutations cannot break the scan.
         if "builtin.com" in host or "builtinseattle.com" in host or "builtinvancouver.org" in host:
-            soup_pre = BeautifulSoup(html or "", "html.parser")
+            soup_pre = page.soup
             pre_nodes = soup_pre.select("[data-bs-toggle='tooltip'], [data-toggle='tooltip']")
             log_line("DEBUG", f"[BIVDBG] pre_prune_tooltip_nodes={len(pre_nodes)}")
 
             # Always initialize so later "if new_val:" never crashes
             new_val = ""
 
-            tooltip_best = _builtin_tooltip_locations_from_html(html or "")
+            tooltip_best = _builtin_tooltip_locations_from_html(page)
             log_line(
                 "DEBUG",
                 f"[BIVDBG] tooltip_extract_result_preprune url={job_url} best_len={len(tooltip_best)} best_sample={(tooltip_best[:3] if tooltip_best else [])}",
@@ -4469,7 +4295,7 @@ def extract_job_details(html: str, job_url: str) -> dict:
 
     # --- JSON LD helper parse (central place) ---
     try:
-        ld_data = parse_jobposting_ldjson(html)
+        ld_data = parse_jobposting_ldjson(page)
         if ld_data:
             details.update({k: v for k, v in ld_data.items() if v})
     except Exception as e:
@@ -4556,7 +4382,7 @@ def extract_job_details(html: str, job_url: str) -> dict:
     if "dice.com" in host and "/job-detail/" in job_url:
         details["Career Board"] = "Dice"
         details.setdefault("Apply URL", job_url)
-        details = enrich_dice_fields(details, html)
+        details = enrich_dice_fields(details, page)
         return details
 
     if "workday" in host:
@@ -4571,21 +4397,21 @@ def extract_job_details(html: str, job_url: str) -> dict:
         yc_src = None
 
         # 1) Embedded YC job payload
-        cand = _yc_extract_location_from_embedded_job_payload(html)
+        cand = _yc_extract_location_from_embedded_job_payload(page)
         if _yc_is_plausible_location(cand):
             yc_loc = cand
             yc_src = "embedded_job_payload"
 
         # 2) JSON-LD
         if not yc_loc:
-            cand = _yc_extract_location_from_jsonld(html)
+            cand = _yc_extract_location_from_jsonld(page)
             if _yc_is_plausible_location(cand):
                 yc_loc = cand
                 yc_src = "jsonld"
 
         # 3) Label-based / header-based
         if not yc_loc:
-            cand = _yc_extract_location_from_label(html)
+            cand = _yc_extract_location_from_label(page)
             if _yc_is_plausible_location(cand):
                 yc_loc = cand
                 yc_src = "label"
@@ -4742,7 +4568,7 @@ def extract_job_details(html: str, job_url: str) -> dict:
         # Generic JSON-LD + HTML date extraction (covers boards like nodesk.co)
     # Only fills when missing, so it will not disrupt board-specific parsers.
     try:
-        schema_bits = parse_jobposting_ldjson(str(soup))
+        schema_bits = parse_jobposting_ldjson(soup)
         if schema_bits:
             if schema_bits.get("posting_date") and not details.get("posting_date"):
                 details["posting_date"] = schema_bits["posting_date"]
@@ -4841,7 +4667,7 @@ def extract_job_details(html: str, job_url: str) -> dict:
 
     # Helper that can be reused for missing companies
     def company_from_header_meta(page_host: str, html_text: str) -> str | None:
-        s2 = BeautifulSoup(html_text or "", "html.parser")
+        s2 = page.soup if html_text is html else make_soup(html_text or "")
         og2 = s2.find("meta", attrs={"property": "og:site_name"})
         if og2 and og2.get("content"):
             return og2["content"].strip()
@@ -4945,7 +4771,7 @@ def extract_job_details(html: str, job_url: str) -> dict:
                 # Parse the tooltip HTML, then pull each cell
                 if "<div" in unesc:
                     try:
-                        inner = BeautifulSoup(unesc, "html.parser")
+                        inner = page.fragment(unesc)
 
                         # BuiltIn renders each location in a col div
                         for div in inner.select("div.col-lg-6"):
@@ -5023,7 +4849,7 @@ def extract_job_details(html: str, job_url: str) -> dict:
         # Seattle fallback from raw HTML main card / page title if generic title stayed empty.
         if not title:
             try:
-                s_sea = BeautifulSoup(html or "", "html.parser")
+                s_sea = page.soup
                 h1_sea = s_sea.select_one("div[data-id='job-card'] h1") or s_sea.find("h1")
                 if h1_sea:
                     title = (h1_sea.get_text(" ", strip=True) or "").strip()
@@ -5050,7 +4876,7 @@ def extract_job_details(html: str, job_url: str) -> dict:
 
     # Workday location enrich before rules
     if "workday" in host or "myworkday" in host or "myworkdaysite" in host:
-        details = _enrich_workday_location(details, html, job_url)
+        details = _enrich_workday_location(details, page, job_url)
 
     # Capture full text lower for downstream rules
     # Keep the main-scoped page_text we already set earlier
@@ -5159,7 +4985,7 @@ def extract_job_details(html: str, job_url: str) -> dict:
                     # Double-unescape to handle nested entities
                     unesc = _html.unescape(_html.unescape(raw))
 
-                    inner = BeautifulSoup(unesc, "html.parser")
+                    inner = page.fragment(unesc)
 
                     # Support both tooltip layouts
                     locs = [d.get_text(" ", strip=True) for d in inner.select("div.col-lg-6")]
@@ -5306,7 +5132,7 @@ def extract_job_details(html: str, job_url: str) -> dict:
 
                     # Parse the embedded tooltip HTML.
                     try:
-                        inner = BeautifulSoup(unesc, "html.parser")
+                        inner = page.fragment(unesc)
                     except Exception:
                         continue
 
@@ -6294,7 +6120,7 @@ def _builtin_extract_location_from_card(card) -> str | None:
             if ("col-lg-6" not in unesc) and ("row" not in unesc):
                 continue
 
-            inner = BeautifulSoup(unesc, "html.parser")
+            inner = make_soup(unesc)
             locs = [d.get_text(" ", strip=True) for d in inner.select("div.col-lg-6")]
             locs = [x for x in locs if x]
 
@@ -7219,7 +7045,7 @@ def _derive_company_and_title(d: dict, html: str | None = None) -> dict:
             # Prefer the on-page company name (e.g., The Muse header / JSON-LD)
         if not company and html:
             try:
-                soup = BeautifulSoup(html, "html.parser")
+                soup = make_soup(html)
 
                 # The Muse — header company name (multiple class variants seen)
                 a = (
@@ -7259,7 +7085,7 @@ def _derive_company_and_title(d: dict, html: str | None = None) -> dict:
         # …after title-pattern checks…
         if not company and html:
             try:
-                soup = BeautifulSoup(html, "html.parser")
+                soup = make_soup(html)
                 # The Muse – company link in the job header
                 a = soup.select_one("a.job-header__jobHeaderCompanyNameProgrammatic")
                 if a:
@@ -7278,50 +7104,16 @@ def _derive_company_and_title(d: dict, html: str | None = None) -> dict:
 
 
 
-PLAYWRIGHT_DOMAINS = {
-    "edtech.com", "www.edtech.com",
-    "edtechjobs.io/", "www.edtechjobs.io",
-    "builtin.com", "www.builtin.com",
-    "builtinseattle.com", "www.builtinseattle.com",
-    "remoteok.com", "www.remoteok.com",
-    "builtinvancouver.org", "www.builtinvancouver.org",
-    "wellfound.com", "www.wellfound.com",
-    "welcometothejungle.com", "www.welcometothejungle.com",
-    "app.welcometothejungle.com", "us.welcometothejungle.com",
-    "workingnomads.com", "www.workingnomads.com",
-    # JS heavy boards that need Playwright
-    "dice.com", "www.dice.com",
-    "myworkdayjobs.com", "wd1.myworkdayjobs.com", "myworkdaysite.com",
-    "wd5.myworkdaysite.com", "ashbyhq.com", "jobs.ashbyhq.com",
-}
-
-
-PLAYWRIGHT_DOMAINS.update({
-    "www.hubspot.com",
-    "hubspot.com",
-    "www.ycombinator.com",
-    "ycombinator.com",
-    "about.gitlab.com",
-    "zapier.com",
-})
+# Hosts fetched with Playwright (JS-heavy boards). The list lives in
+# config/source_catalog.py next to the rest of the per-source metadata.
+PLAYWRIGHT_DOMAINS = set(CATALOG_PLAYWRIGHT_DOMAINS)
 
 try:
     from playwright.sync_api import sync_playwright
 except Exception:
     sync_playwright = None  # run without Playwright if not available
 
-KNOWN = {
-    # …keep existing…
-    "remoteok.com": "Remote OK",
-    "builtin.com": "Built In",
-    "www.builtin.com": "Built In",
-    "builtinseattle.com": "Built In Seattle",
-    "www.builtinseattle.com": "Built In Seattle",
-    "wellfound.com": "Wellfound",
-    "builtinvancouver.org": "Built In Vancouver",
-    "www.builtinvancouver.org": "Built In Vancouver",
-    "welcometothejungle.com": "Welcome to the Jungle",
-}
+KNOWN = dict(KNOWN_SOURCE_LABELS)
 
 
 import os
@@ -7339,13 +7131,97 @@ USER_AGENT = "AngeJobScraper/1.0 (+https://linkedin.com/in/angespring)"
 HEADERS = {"User-Agent": USER_AGENT, "Accept-Language": "en-US,en;q=0.9"}
 
 REQUEST_TIMEOUT = 20          # seconds
+HTTP_POOL_CONNECTIONS = 32    # hosts kept in the shared keep-alive pool
+HTTP_POOL_MAXSIZE = 8         # keep-alive connections per host
 MIN_DELAY = 2.0               # seconds
 MAX_DELAY = 5.0               # seconds
 ROBOTS_TIMEOUT = 6            # max seconds to read robots.txt
 PW_GOTO_TIMEOUT = 20000       # Playwright page.goto in ms
 PW_WAIT_TIMEOUT = 7000        # Playwright wait_for_selector in ms
+PW_CONTEXT_MAX_PAGES = 50     # recycle the pooled browser context after N pages
+PW_BROWSER_MAX_PAGES = 400    # relaunch the pooled browser after N pages
 MAX_SECONDS_PER_SITE = 60     # hard cap per listing page
 
+# All non-Playwright requests share one pooled session (http_client.py)
+configure_http_client(
+    headers=HEADERS,
+    pool_connections=HTTP_POOL_CONNECTIONS,
+    pool_maxsize=HTTP_POOL_MAXSIZE,
+)
+
+# On-disk page cache (page_cache.py). TTLs in seconds, matched by host suffix.
+CACHE_DIR = os.path.join(OUTPUT_DIR, "http_cache")
+CACHE_TTL_BY_HOST = {
+    "default": 6 * 3600,
+    "myworkdayjobs.com": 12 * 3600,
+    "myworkdaysite.com": 12 * 3600,
+    "greenhouse.io": 12 * 3600,
+    "lever.co": 12 * 3600,
+    "ycombinator.com": 24 * 3600,
+}
+PAGE_CACHE = None             # PageCache for this run; opened in main() unless --no-cache
+FETCH_ARCHIVE = None          # FetchArchive for --record / --replay (fetch_archive.py)
+
+# Cross-run seen-job index (seen_index.py). Links decided within the revisit
+# window are not fetched again unless their listing fingerprint changed.
+SEEN_INDEX_PATH = os.path.join(OUTPUT_DIR, "seen_jobs.sqlite3")
+SEEN_REVISIT_DAYS = 3.0       # --revisit-days; 0 re-fetches everything (index still updated)
+SEEN_INDEX = None             # SeenJobIndex for this run; opened in main()
+
+# Built In mirrors one posting on several boards; discovery keeps a single
+# copy per job ID, from this host when it is among the copies found.
+BUILTIN_PREFERRED_HOST = "builtin.com"
+
+# Dice searches come from the search API (ats_boards.fetch_dice_search);
+# the cap matches the 20-per-page listing walk it replaces.
+DICE_MAX_PAGES = 25
+
+# EdSurge (edsurge_jobs.py): role queries batched into one Algolia call per
+# round; an edsurge.com/jobs?query=... seed searches just that query.
+EDSURGE_QUERIES = (
+    "product owner",
+    "product manager",
+    "business analyst",
+    "systems analyst",
+    "scrum master",
+)
+EDSURGE_MAX_PAGES = 3
+
+# Boards found on CAREER_PAGES (career_boards.py). Fresh entries skip the
+# careers page fetch; stale ones are used once more and re-scanned in the background.
+CAREER_BOARDS_PATH = os.path.join(OUTPUT_DIR, "career_boards.json")
+CAREER_BOARDS_TTL_DAYS = 7.0
+CAREER_REFRESH_WORKERS = 2    # background re-scan threads (it overlaps the main run)
+# RSS/Atom listings (FEED_SOURCES): last items + ETag / Last-Modified per feed
+FEED_STATE_PATH = os.path.join(OUTPUT_DIR, "feeds.json")
+CAREER_BOARDS = None          # CareerBoardCache for this run; opened in main() unless --no-cache
+_CAREER_REFRESH = None        # background re-scan thread started by expand_career_sources()
+_SEEN_CURRENT: dict = {}      # the detail link being decided right now (main thread)
+
+
+def _replaying() -> bool:
+    return FETCH_ARCHIVE is not None and FETCH_ARCHIVE.replaying
+
+
+# Replay has no hosts to protect, so it runs without per-host limits
+_REPLAY_CONCURRENCY = {"default": 64}
+_REPLAY_MIN_INTERVAL = {"default": 0.0}
+
+# Detail stage concurrency. Hosts run in parallel; each host stays polite.
+DETAIL_WORKERS = 4            # worker threads for detail fetches (--workers)
+EXTRACT_PROCESSES = 0         # processes for HTML -> details extraction (--extract-processes; 0 = main thread)
+HOST_CONCURRENCY = {          # max in-flight requests per host (suffix match)
+    "default": 2,
+    "dice.com": 1,
+    "ycombinator.com": 1,
+    "myworkdayjobs.com": 2,
+    "myworkdaysite.com": 2,
+}
+HOST_MIN_INTERVAL = {         # seconds between request starts on one host
+    "default": 1.0,
+    "dice.com": MIN_DELAY,
+}
+
 # === Google Sheets push ===
 GS_KEY_PATH = "/Users/ange/job-scraper/service_account.json"   # absolute path to your JSON key
 GS_SHEET_URL = "https://docs.google.com/spreadsheets/d/1UloVHEsBxvMJ3WeQ8XkHvtIrL1cQ2CiyD50bsOb-Up8/edit?gid=1531552984#gid=1531552984"              # full URL to “product jobs scraper”
@@ -7521,6 +7397,9 @@ STARTING_PAGES = [
     "https://www.edtech.com/jobs/fully-remote-jobs?Cat=Product%20Development",
     "https://www.edtech.com/jobs/fully-remote-jobs?Cat=Information%20Technology",
     "https://www.edtech.com/jobs/fully-remote-jobs?Cat=Operations",
+
+    # EdSurge (Algolia search API; one seed runs every EDSURGE_QUERIES query)
+    "https://www.edsurge.com/jobs",
     "https://edtechjobs.io/jobs/product-management?location=Remote",
     "https://edtechjobs.io/jobs/business-analysis?location=Remote",
 
@@ -7548,6 +7427,9 @@ STARTING_PAGES = [
     # Remote OK
     "https://remoteok.com/?location=CA,US,region_NA",
 
+    # Remote Rocketship (server-rendered cards carry salary and location; all pages walked)
+    "https://www.remoterocketship.com/country/united-states/jobs/product-manager/",
+
     # Built In (JS-heavy → Playwright)
     "https://www.builtin.com/jobs?search=product%20manager&remote=true",
     "https://www.builtin.com/jobs?search=product%20owner&remote=true",
@@ -7565,43 +7447,44 @@ STARTING_PAGES = [
 
     # Welcome to the Jungle (JS-heavy → Playwright)
     "https://www.welcometothejungle.com/en/jobs?query=product%20manager&remote=true",
-    "https://app.welcometothejungle.com/companies/12Twenty#jobs-section"
-    "https://app.welcometothejungle.com/companies/Microsoft#jobs-section"
-    "https://app.welcometothejungle.com/companies/Google#jobs-section"
-    "https://app.welcometothejungle.com/companies/Adobe#jobs-section"
-    "https://app.welcometothejungle.com/companies/Asana#jobs-section"
-    "https://app.welcometothejungle.com/companies/Amazon#jobs-section"
-    "https://app.welcometothejungle.com/companies/Airtable#jobs-section"
-    "https://app.welcometothejungle.com/companies/Beam-Benefits#jobs-section"
-    "https://app.welcometothejungle.com/companies/Chime-Bank#jobs-section"
-    "https://app.welcometothejungle.com/companies/Clari#jobs-section"
-    "https://app.welcometothejungle.com/companies/Confluent#jobs-section"
-    "https://app.welcometothejungle.com/companies/DataDog#jobs-section"
-    "https://app.welcometothejungle.com/companies/Dataminr#jobs-section"
-    "https://app.welcometothejungle.com/companies/Expensify#jobs-section"
-    "https://app.welcometothejungle.com/companies/Figma#jobs-section"
-    "https://app.welcometothejungle.com/companies/Gong-io#jobs-section"
-    "https://app.welcometothejungle.com/companies/HashiCorp#jobs-section"
-    "https://app.welcometothejungle.com/companies/HubSpot#jobs-section"
-    "https://app.welcometothejungle.com/companies/Looker#jobs-section"
-    "https://app.welcometothejungle.com/companies/MaintainX#jobs-section"
-    "https://app.welcometothejungle.com/companies/Notion#jobs-section"
-    "https://app.welcometothejungle.com/companies/Outreach#jobs-section"
-    "https://app.welcometothejungle.com/companies/PagerDuty#jobs-section"
-    "https://app.welcometothejungle.com/companies/Segment#jobs-section"
-    "https://app.welcometothejungle.com/companies/Smartsheet#jobs-section"
-    "https://app.welcometothejungle.com/companies/Stripe#jobs-section"
-    "https://app.welcometothejungle.com/companies/Top-Hat#jobs-section"
-    "https://app.welcometothejungle.com/companies/TripActions#jobs-section"
-    "https://app.welcometothejungle.com/companies/UiPath#jobs-section"
-    "https://app.welcometothejungle.com/companies/Vetcove#jobs-section"
-    "https://app.welcometothejungle.com/companies/Zoom#jobs-section"
-    "https://app.welcometothejungle.com/companies/Metabase#jobs-section"
+    "https://app.welcometothejungle.com/companies/12Twenty#jobs-section",
+    "https://app.welcometothejungle.com/companies/Microsoft#jobs-section",
+    "https://app.welcometothejungle.com/companies/Google#jobs-section",
+    "https://app.welcometothejungle.com/companies/Adobe#jobs-section",
+    "https://app.welcometothejungle.com/companies/Asana#jobs-section",
+    "https://app.welcometothejungle.com/companies/Amazon#jobs-section",
+    "https://app.welcometothejungle.com/companies/Airtable#jobs-section",
+    "https://app.welcometothejungle.com/companies/Beam-Benefits#jobs-section",
+    "https://app.welcometothejungle.com/companies/Chime-Bank#jobs-section",
+    "https://app.welcometothejungle.com/companies/Clari#jobs-section",
+    "https://app.welcometothejungle.com/companies/Confluent#jobs-section",
+    "https://app.welcometothejungle.com/companies/DataDog#jobs-section",
+    "https://app.welcometothejungle.com/companies/Dataminr#jobs-section",
+    "https://app.welcometothejungle.com/companies/Expensify#jobs-section",
+    "https://app.welcometothejungle.com/companies/Figma#jobs-section",
+    "https://app.welcometothejungle.com/companies/Gong-io#jobs-section",
+    "https://app.welcometothejungle.com/companies/HashiCorp#jobs-section",
+    "https://app.welcometothejungle.com/companies/HubSpot#jobs-section",
+    "https://app.welcometothejungle.com/companies/Looker#jobs-section",
+    "https://app.welcometothejungle.com/companies/MaintainX#jobs-section",
+    "https://app.welcometothejungle.com/companies/Notion#jobs-section",
+    "https://app.welcometothejungle.com/companies/Outreach#jobs-section",
+    "https://app.welcometothejungle.com/companies/PagerDuty#jobs-section",
+    "https://app.welcometothejungle.com/companies/Segment#jobs-section",
+    "https://app.welcometothejungle.com/companies/Smartsheet#jobs-section",
+    "https://app.welcometothejungle.com/companies/Stripe#jobs-section",
+    "https://app.welcometothejungle.com/companies/Top-Hat#jobs-section",
+    "https://app.welcometothejungle.com/companies/TripActions#jobs-section",
+    "https://app.welcometothejungle.com/companies/UiPath#jobs-section",
+    "https://app.welcometothejungle.com/companies/Vetcove#jobs-section",
+    "https://app.welcometothejungle.com/companies/Zoom#jobs-section",
+    "https://app.welcometothejungle.com/companies/Metabase#jobs-section",
     "https://app.welcometothejungle.com/api/jobs?query=product%20owner&locations=remote",
     "https://app.welcometothejungle.com/api/jobs?query=product",
 ]
 
-assert all(u.startswith("http") for u in STARTING_PAGES), "A STARTING_PAGES entry is missing a comma."
+assert all(u.startswith("http") and u.count("://") == 1 for u in STARTING_PAGES), \
+    "A STARTING_PAGES entry is missing a comma."
 
 # -------------------------------------------------------------------
 # LEGACY TEXT BASED GEO HEURISTICS (DO NOT EXTEND IN THIS SOW)
@@ -7835,7 +7718,7 @@ import json
 import requests
 from urllib.parse import urlparse, urljoin
 
-WORKDAY_LIMIT = 30
+WORKDAY_PAGE_WORKERS = 4    # concurrent CXS offset pages per Workday board
 
 # ======================================
 # WORKDAY JSON API PAGINATION COLLECTOR
@@ -7844,27 +7727,15 @@ import json
 import requests
 from urllib.parse import urlparse, urljoin
 
-
-def fetch_workday_json_jobs(api_base, payload):
-    """
-    Wrapper around the Workday CXS endpoint.
-
-    Returns {} on any failure or non-JSON response so the caller can fall back to HTML.
-    """
-    try:
-        resp = requests.post(
-            api_base,
-            headers=HEADERS,
-            data=json.dumps(payload),
-            timeout=30,
-        )
-    except Exception as e:
-        log_line("WARN", f".[WORKDAY] Request failed (api={api_base}, error={type(e).__name__}: {e})")
-        return {}
-
-    return _safe_resp_json(resp, context=f".[WORKDAY] api json (api={api_base})") or {}
+_WORKDAY_CLIENT: WorkdayClient | None = None
 
 
+def get_workday_client() -> WorkdayClient:
+    """Run-wide Workday client (board -> CXS endpoint resolution is cached on it)."""
+    global _WORKDAY_CLIENT
+    if _WORKDAY_CLIENT is None:
+        _WORKDAY_CLIENT = WorkdayClient(headers=HEADERS, workers=WORKDAY_PAGE_WORKERS)
+    return _WORKDAY_CLIENT
 
 
 def _safe_resp_json(resp, context: str = "") -> dict:
@@ -7913,87 +7784,44 @@ def _safe_resp_json(resp, context: str = "") -> dict:
         return {}
 
 
+def _workday_html_links(listing_url: str, html: str | None = None) -> list[str]:
+    """Page-1 Workday detail links from the listing HTML (no JSON API for this board)."""
+    html = html or get_html(listing_url) or ""
+    links = find_job_links(html, listing_url) if html else []
+    return list(dict.fromkeys(lk for lk in links if "/job/" in lk or "/details/" in lk))
+
+
 def collect_workday_jobs(listing_url: str, max_links: int | None = None) -> list[str]:
     """
-    Robust JSON-based Workday collector.
-    Handles pagination via limit/offset.
+    Workday listing -> detail links through the CXS JSON API (workday_client.py).
+    Titles and locations from the search results are kept for the listing
+    prefilter and the location preference. Falls back to the listing HTML
+    when the board has no reachable JSON endpoint.
     """
-    parsed = urlparse(listing_url)
-    host = parsed.netloc.lower()
-
-    # Workday API lives on myworkday.com even if the UI host is myworkdaysite.com
-    api_host = host.replace("myworkdaysite.com", "myworkday.com")
-
-    parts = [p for p in parsed.path.split("/") if p]
-    tenant = site = None
-    if parts and parts[0].lower() == "recruiting" and len(parts) >= 3:
-        tenant, site = parts[1], parts[2]
-    elif len(parts) >= 2:
-        tenant, site = parts[0], parts[1]
-
-    if not (tenant and site):
-        log_line("WARN", f".[WORKDAY] Could not infer tenant/site from {listing_url}; skipping JSON API.")
-        return []
-
-
-
-    api_base = f"https://{api_host}/wday/cxs/{tenant}/{site}/jobs"
+    if "/job/" in up.urlparse(listing_url).path:
+        return [listing_url]  # already a detail page
 
-    # Extract `keywords=` from listing URL if present
-    # Example: ...search?q=business+analyst
-    query = parsed.query
-    keywords = None
-    if "q=" in query:
-        try:
-            from urllib.parse import parse_qs
-            qs = parse_qs(query)
-            raw = qs.get("q", [""])[0]
-            keywords = raw.replace("+", " ")
-        except Exception:
-            pass
-
-    all_links = []
-    offset = 0
-
-    while True:
-        payload = {
-            "limit": WORKDAY_LIMIT,
-            "offset": offset,
-        }
-        if keywords:
-            # Workday usually uses searchText in the JSON body
-            payload["searchText"] = keywords
-
-        data = fetch_workday_json_jobs(api_base, payload)
-        if not data:
-            # JSON endpoint not available; fall back to HTML parsing for this listing page
-            html = get_html(listing_url)
-            if html:
-                links = find_job_links(html, listing_url)
-                return links
-            break
-
-        # Different tenants sometimes use jobPostings vs jobs – be defensive
-        jobs = data.get("jobPostings", []) or data.get("jobs", [])
-
-        for job in jobs:
-            ext = job.get("externalPath")
-            if not ext:
-                continue
-
-            detail_url = urljoin(f"https://{host}/", ext)
-
-            if detail_url not in all_links:
-                all_links.append(detail_url)
-                if max_links and len(all_links) >= max_links:
-                    return all_links
-
-        if len(jobs) < WORKDAY_LIMIT:
-            break
-
-        offset += WORKDAY_LIMIT
-
-    return all_links
+    board = parse_workday_listing(listing_url)
+    html = None
+    if board is None:
+        # bare wdN.myworkdayjobs.com host: the tenant host is embedded in the page
+        html = get_html(listing_url) or ""
+        tenant_host = tenant_host_from_html(html)
+        board = parse_workday_listing(listing_url, tenant_host) if tenant_host else None
+    if board is None:
+        log_line("WARN", f".[WORKDAY] Could not infer tenant/site from {listing_url}; using listing HTML.")
+        return _workday_html_links(listing_url, html)
+
+    postings = get_workday_client().postings(board, max_results=max_links)
+    if postings is None:
+        log_line("WARN", f".[WORKDAY] No CXS JSON for {board.tenant}/{board.site}; using listing HTML.")
+        return _workday_html_links(listing_url, html)
+
+    for job in postings:
+        _note_listing_title(job.url, job.title)
+        if job.locations_text:
+            _note_listing_context(job.url, Location=job.locations_text)
+    return [job.url for job in postings]
 
 from urllib.parse import urljoin
 from bs4 import BeautifulSoup
@@ -8004,7 +7832,7 @@ def extract_wttj_company_jobs(html: str, company_url: str) -> list[str]:
     Given the HTML for a company page on app.welcometothejungle.com,
     return a list of absolute job URLs found on that page.
     """
-    soup = BeautifulSoup(html, "html.parser")
+    soup = make_soup(html)
 
     links: list[str] = []
     for a in soup.find_all("a", href=True):
@@ -8027,7 +7855,7 @@ def collect_wttj_company_links(company_url: str) -> list[str]:
             "https://app.welcometothejungle.com/companies/Beam-Benefits"
         )
     """
-    resp = requests.get(company_url, timeout=20)
+    resp = http_get(company_url, timeout=20)
     resp.raise_for_status()
     html = resp.text
 
@@ -8046,6 +7874,8 @@ from bs4 import BeautifulSoup, NavigableString, Tag
 REMOTE_ROCKETSHIP_PM_US = (
     "https://www.remoterocketship.com/country/united-states/jobs/product-manager/"
 )
+REMOTE_ROCKETSHIP_MAX_PAGES = 10   # result pages per search (?page=N)
+REMOTE_ROCKETSHIP_PAGE_WORKERS = 4  # pages in flight; HOST_CONCURRENCY still caps the host
 
 
 @dataclass
@@ -8062,19 +7892,18 @@ class RemoteRocketshipJob:
 
     def to_row(self) -> dict:
         """
-        Map into your generic row structure.
-        Adjust keys here to align with base_row_from_listing or your CSV schema.
+        Map into the KEEP_FIELDS columns (the ones a result card can fill).
         """
         return {
-            "source": self.source,
-            "title": self.title,
-            "company": self.company,
-            "location_raw": self.location_raw,
-            "salary_text": self.salary_text,
-            "posted_text": self.posted_text,
-            "tags_raw": self.tags_raw,
-            "listing_url": self.listing_url,
-            "apply_url": self.apply_url,
+            "Title": self.title,
+            "Company": self.company,
+            "Career Board": "Remote Rocketship",
+            "Location": self.location_raw or "",
+            "Posted": self.posted_text or "",
+            "Job URL": self.listing_url or "",
+            "Apply URL": self.apply_url or self.listing_url or "",
+            "Description Snippet": self.tags_raw or "",
+            "Salary Est. (Low-High)": self.salary_text or "",
         }
 
 
@@ -8114,7 +7943,7 @@ def _first_salary_after(anchor: Tag) -> Optional[str]:
 
 
 def parse_remote_rocketship_jobs(html: str, page_url: str) -> List[RemoteRocketshipJob]:
-    soup = BeautifulSoup(html, "html.parser")
+    soup = make_soup(html)
     jobs: List[RemoteRocketshipJob] = []
 
     # Each job starts at an h3 that has a "View Job" and "Apply" further down
@@ -8207,15 +8036,59 @@ def parse_remote_rocketship_jobs(html: str, page_url: str) -> List[RemoteRockets
     return jobs
 
 
-def scrape_remote_rocketship_pm_us(session: Optional[requests.Session] = None) -> List[dict]:
+def remote_rocketship_page_count(html: str) -> int:
+    """Highest ?page=N linked from a results page (1 when there is no pager)."""
+    pages = [int(n) for n in re.findall(r"[?&](?:amp;)?page=(\d+)", html or "")]
+    return max(pages + [1])
+
+
+def scrape_remote_rocketship(
+    listing_url: str,
+    first_html: str | None = None,
+    max_pages: int = REMOTE_ROCKETSHIP_MAX_PAGES,
+    throttle: "HostThrottle | None" = None,
+) -> List[RemoteRocketshipJob]:
     """
-    One shot helper that returns rows ready for CSV or your base_row_from_listing.
+    Every job card across a search's result pages. Page 1 tells how many
+    pages there are; the rest are fetched side by side under `throttle`
+    (default: the run's page-fetch limits) and merged in page order,
+    deduped by job URL.
     """
-    if session is None:
-        session = requests.Session()
+    html = first_html if first_html is not None else get_html(listing_url)
+    if not html:
+        return []
+    pages = [html]
+
+    last = min(remote_rocketship_page_count(html), max_pages)
+    urls = [
+        u for u in (_set_qp(listing_url, page=n) for n in range(2, last + 1))
+        if _claim_listing_page(u)
+    ]
+    for url, ok, page_html in run_ordered(
+        urls,
+        get_html,
+        workers=REMOTE_ROCKETSHIP_PAGE_WORKERS,
+        throttle=throttle or _detail_throttle(),
+    ):
+        if ok and page_html:
+            pages.append(page_html)
 
-    html = fetch_remote_rocketship_html(session, REMOTE_ROCKETSHIP_PM_US)
-    jobs = parse_remote_rocketship_jobs(html, REMOTE_ROCKETSHIP_PM_US)
+    jobs: List[RemoteRocketshipJob] = []
+    seen = set()
+    for page_html in pages:
+        for job in parse_remote_rocketship_jobs(page_html, listing_url):
+            if job.listing_url in seen:
+                continue
+            seen.add(job.listing_url)
+            jobs.append(job)
+    return jobs
+
+
+def scrape_remote_rocketship_pm_us() -> List[dict]:
+    """
+    One shot helper that returns KEEP_FIELDS rows for the PM (US) search.
+    """
+    jobs = scrape_remote_rocketship(REMOTE_ROCKETSHIP_PM_US)
     return [job.to_row() for job in jobs]
 
 
@@ -8227,7 +8100,7 @@ def can_fetch(url):
     robots_url = f"{parsed.scheme}://{parsed.netloc}/robots.txt"
     rp = robotparser.RobotFileParser()
     try:
-        r = requests.get(robots_url, headers=HEADERS, timeout=ROBOTS_TIMEOUT)
+        r = http_get(robots_url, headers=HEADERS, timeout=ROBOTS_TIMEOUT)
         if r.status_code >= 400 or not r.text:
             rp.parse([])  # treat as empty robots
         else:
@@ -8242,7 +8115,8 @@ def can_fetch(url):
     return float(delay) if delay is not None else None
 
 
-def polite_get(url, retries=2):
+def polite_get(url, retries=2, headers=None):
+    """GET with retries. `headers` are merged over HEADERS (e.g. cache validators)."""
     backoff = 1.5
     req_host = up.urlparse(url).netloc.lower()
 
@@ -8255,7 +8129,7 @@ def polite_get(url, retries=2):
 
     for attempt in range(retries + 1):
         try:
-            resp = requests.get(url, headers=HEADERS, timeout=REQUEST_TIMEOUT, allow_redirects=True)
+            resp = http_get(url, headers={**HEADERS, **(headers or {})}, timeout=REQUEST_TIMEOUT, allow_redirects=True)
             final_host = up.urlparse(resp.url).netloc.lower()
             # If the request was redirected off-site to a blocked or aggregator domain, treat as not-fetchable
             REDIRECT_BLOCKERS = {"talent.com", "de.talent.com", "in.talent.com"}
@@ -8273,7 +8147,7 @@ def polite_get(url, retries=2):
                 fallback_url = _http_fallback(url)
                 if fallback_url and fallback_url != url:
                     try:
-                        resp = requests.get(
+                        resp = http_get(
                             fallback_url,
                             headers=HEADERS,
                             timeout=REQUEST_TIMEOUT,
@@ -8343,6 +8217,8 @@ def career_board_name(url: str) -> str:
 
 
 def random_delay(base_min=MIN_DELAY, base_max=MAX_DELAY):
+    if _replaying():
+        return  # nothing to be polite to when serving from the archive
     time.sleep(random.uniform(base_min, base_max))
 
 def is_job_detail_url(u: str) -> bool:
@@ -8490,7 +8366,7 @@ def normalize_text(node_or_text, strip=True) -> str:
     return " ".join(s.split())
 
 def find_job_links(listing_html: str, base_url: str) -> list[str]:
-    soup = BeautifulSoup(listing_html, "html.parser")
+    soup = make_soup(listing_html)
     anchors = soup.find_all("a", href=True)
     links: set[str] = set()
 
@@ -8526,12 +8402,24 @@ def find_job_links(listing_html: str, base_url: str) -> list[str]:
                 continue
 
             links.add(full_url)
+            _note_listing_title(full_url, text)
 
         return list(links)
 
 
     cap = 120 if ("ashbyhq.com" in base_host or is_workday) else None
-    # Ashby special case
+    on_host = 0  # links kept on base_host, checked against cap
+
+    def _keep(url: str, title) -> None:
+        nonlocal on_host
+        if url in links:
+            return
+        links.add(url)
+        _note_listing_title(url, title)
+        if base_host in url:
+            on_host += 1
+
+    # Ashby special case (only reached when the posting API failed)
     if "ashbyhq.com" in base_host:
         for a in anchors:
             href = a["href"].strip()
@@ -8543,11 +8431,11 @@ def find_job_links(listing_html: str, base_url: str) -> list[str]:
             p = up.urlparse(full_url)
             if p.netloc.lower().endswith("ashbyhq.com"):
                 if re.fullmatch(r"/[^/]+/[1-9]\d*/", p.path) and "departmentid=" not in p.query.lower():
-                    links.add(full_url)
+                    _keep(full_url, a.get_text(" ", strip=True))
                 elif re.fullmatch(r"/[^/]+/jobs/[^/]+/", p.path):
-                    links.add(full_url)
+                    _keep(full_url, a.get_text(" ", strip=True))
 
-                if cap and sum(1 for L in links if base_host in L) >= cap:
+                if cap and on_host >= cap:
                     break
 
         return list(links)
@@ -8568,9 +8456,9 @@ def find_job_links(listing_html: str, base_url: str) -> list[str]:
             continue
 
         if is_job_detail_url(full_url):
-            links.add(full_url)
+            _keep(full_url, a.get_text(" ", strip=True) or a.get("aria-label") or a.get("title"))
 
-        if cap and sum(1 for L in links if base_host in L) >= cap:
+        if cap and on_host >= cap:
             break
 
     return list(links)
@@ -10994,6 +10882,8 @@ def _autoscroll_listing(page,
 
 
 from playwright.sync_api import sync_playwright
+from browser_pool import get_browser_pool, shutdown_browser_pools
+from fetch_scheduler import HostThrottle, run_ordered
 from urllib import parse as up
 import re
 import time
@@ -11008,14 +10898,31 @@ TRANSIENT_NET_MARKERS = (
 PW_SUCCESS = 0
 PW_FAIL = 0
 REQ_FALLBACK = 0
+_PW_STATS_LOCK = threading.Lock()
+
+
+def _bump_pw_stats(*names: str) -> None:
+    """Increment the Playwright counters above; fetch worker threads share them."""
+    with _PW_STATS_LOCK:
+        g = globals()
+        for name in names:
+            g[name] += 1
 
 
 def fetch_html_with_playwright(url, user_agent=USER_AGENT, engine="chromium"):
+    """Fetch HTML for a URL using Playwright. Returns None on failure."""
+    res = fetch_result_with_playwright(url, user_agent=user_agent, engine=engine)
+    return res.html if res else None
+
+
+def fetch_result_with_playwright(url, user_agent=USER_AGENT, engine="chromium"):
     """
-    Fetch HTML for a URL using Playwright, with:
+    Fetch a URL using Playwright and return a FetchResult (status, final URL,
+    headers, html), or None on failure. With:
+      - A pooled browser/page that lives for the whole run
       - Transient network retries on page.goto
       - Host specific waits and scrolling
-      - Optional stats counters (PW_SUCCESS, PW_FAIL, REQ_FALLBACK) if defined
+      - Stats counters (PW_SUCCESS, PW_FAIL, REQ_FALLBACK), updated under a lock
     """
     if sync_playwright is None:
         return None
@@ -11028,248 +10935,307 @@ def fetch_html_with_playwright(url, user_agent=USER_AGENT, engine="chromium"):
         "ERR_TIMED_OUT",
     )
 
+    # Long-lived browser shared by the whole run (see browser_pool.py);
+    # a fetch borrows a page instead of launching Chromium.
+    pool = get_browser_pool(
+        engine,
+        launch_args=["--no-sandbox"],
+        max_pages_per_context=PW_CONTEXT_MAX_PAGES,
+        max_pages_per_browser=PW_BROWSER_MAX_PAGES,
+    )
+
     try:
-        with sync_playwright() as p:
-            browser_type = getattr(p, engine)  # "chromium" | "firefox" | "webkit"
-            browser = browser_type.launch(headless=True, args=["--no-sandbox"])
-            context = browser.new_context(user_agent=user_agent)
-            page = context.new_page()
+        with pool.page(user_agent=user_agent) as page:
+            # ---------------------------
+            # 1. Robust page.goto with retry
+            # ---------------------------
+            last_exc = None
+            for attempt in range(1, 4):  # up to 3 attempts
+                try:
+                    resp = page.goto(
+                        url,
+                        timeout=PW_GOTO_TIMEOUT,
+                        wait_until="domcontentloaded",
+                    )
 
-            try:
-                # ---------------------------
-                # 1. Robust page.goto with retry
-                # ---------------------------
-                last_exc = None
-                for attempt in range(1, 4):  # up to 3 attempts
-                    try:
-                        resp = page.goto(
-                            url,
-                            timeout=PW_GOTO_TIMEOUT,
-                            wait_until="domcontentloaded",
-                        )
+                    """ removed 20261215 - this was just for debugging YC routing and block detection, but it was too noisy in the logs
+                    # DEBUG: YC routing and block detection (runs only when goto succeeded)
+                    if "ycombinator.com" in (up.urlparse(url).netloc or "").lower():
+                        status = resp.status if resp else None
+                        log_event("DEBUG", f"YC goto status={status} requested={url} final={page.url}")
+                        try:
+                            log_event("DEBUG", f"YC page title: {page.title()}")
+                        except Exception:
+                            pass
+                    """
 
-                        """ removed 20261215 - this was just for debugging YC routing and block detection, but it was too noisy in the logs
-                        # DEBUG: YC routing and block detection (runs only when goto succeeded)
-                        if "ycombinator.com" in (up.urlparse(url).netloc or "").lower():
-                            status = resp.status if resp else None
-                            log_event("DEBUG", f"YC goto status={status} requested={url} final={page.url}")
-                            try:
-                                log_event("DEBUG", f"YC page title: {page.title()}")
-                            except Exception:
-                                pass
+                    # goto succeeded: one navigation per fetch
+                    last_exc = None
+                    break
 
-                        last_exc = None
-                        break
-                        """
-
-                    except Exception as e:
-                        last_exc = e
-                        msg = str(e)
-                        is_transient = any(m in msg for m in TRANSIENT_NET_MARKERS)
-                        if is_transient and attempt < 3:
-                            log_event(
-                                "WARN",
-                                (
-                                    f"Playwright network issue on attempt {attempt} for "
-                                    f"{url} ({e.__class__.__name__}): {e}. Retrying..."
-                                ),
-                            )
-                            time.sleep(3 * attempt)
-                            continue
+                except Exception as e:
+                    last_exc = e
+                    msg = str(e)
+                    is_transient = any(m in msg for m in TRANSIENT_NET_MARKERS)
+                    if is_transient and attempt < 3:
+                        log_event(
+                            "WARN",
+                            (
+                                f"Playwright network issue on attempt {attempt} for "
+                                f"{url} ({e.__class__.__name__}): {e}. Retrying..."
+                            ),
+                        )
+                        time.sleep(3 * attempt)
+                        continue
 
-                        # non transient or last attempt
-                        raise
+                    # non transient or last attempt
+                    raise
 
-                # if all attempts failed, re raise last exception
-                if last_exc is not None:
-                    raise last_exc
+            # if all attempts failed, re raise last exception
+            if last_exc is not None:
+                raise last_exc
 
-                # ---------------------------
-                # 2. Host and path info
-                # ---------------------------
-                try:
-                    parsed = up.urlparse(url)
-                    host = parsed.netloc.lower()
-                    path = parsed.path or "/"
-                    #log_event("DEBUG", f"Playwright host={host} path={path} url={url}")    ignored 20251215
-                except Exception:
-                    host = ""
-                    path = "/"
+            # ---------------------------
+            # 2. Host and path info
+            # ---------------------------
+            try:
+                parsed = up.urlparse(url)
+                host = parsed.netloc.lower()
+                path = parsed.path or "/"
+                #log_event("DEBUG", f"Playwright host={host} path={path} url={url}")    ignored 20251215
+            except Exception:
+                host = ""
+                path = "/"
 
-                """ removed 20260108 - this was just for debugging YC routing and block detection, but it was too noisy in the logs
-                if "ycombinator.com" in host:
-                    log_event("DEBUG", f"PW YC fetch active: {url}")
-                 """
+            """ removed 20260108 - this was just for debugging YC routing and block detection, but it was too noisy in the logs
+            if "ycombinator.com" in host:
+                log_event("DEBUG", f"PW YC fetch active: {url}")
+             """
 
 
-                # ---------------------------
-                # 3. Host specific behavior
-                # ---------------------------
-                try:
-                    if host.endswith("jobs.ashbyhq.com"):
-                        # Wait until job cards or links render
-                        page.wait_for_selector(
-                            "a[href*='/jobs/']:not([href$='/jobs'])",
-                            timeout=PW_WAIT_TIMEOUT * 2,
-                        )
-                        # Gentle scroll to trigger lazy loads
-                        page.mouse.wheel(0, 2500)
-                        page.wait_for_timeout(800)
+            # ---------------------------
+            # 3. Host specific behavior
+            # ---------------------------
+            try:
+                if host.endswith("jobs.ashbyhq.com"):
+                    # Wait until job cards or links render
+                    page.wait_for_selector(
+                        "a[href*='/jobs/']:not([href$='/jobs'])",
+                        timeout=PW_WAIT_TIMEOUT * 2,
+                    )
+                    # Gentle scroll to trigger lazy loads
+                    page.mouse.wheel(0, 2500)
+                    page.wait_for_timeout(800)
 
-                    elif host.endswith("myworkdayjobs.com") or host.endswith("myworkdaysite.com"):
-                        # Workday often needs a bit of extra time
-                        page.wait_for_timeout(1200)
+                elif host.endswith("myworkdayjobs.com") or host.endswith("myworkdaysite.com"):
+                    # Workday often needs a bit of extra time
+                    page.wait_for_timeout(1200)
 
-                    elif host.endswith("ycombinator.com") or host.endswith("www.ycombinator.com"):
-                        # YC is React. We need to wait for the rendered job header.
-                        page.wait_for_selector(
-                            "h1.ycdc-section-title",
-                            timeout=PW_WAIT_TIMEOUT * 2,
-                        )
-                        # Optional: small pause to let adjacent fields render consistently
-                        page.wait_for_timeout(300)
+                elif host.endswith("ycombinator.com") or host.endswith("www.ycombinator.com"):
+                    # YC is React. We need to wait for the rendered job header.
+                    page.wait_for_selector(
+                        "h1.ycdc-section-title",
+                        timeout=PW_WAIT_TIMEOUT * 2,
+                    )
+                    # Optional: small pause to let adjacent fields render consistently
+                    page.wait_for_timeout(300)
 
 
-                    elif host.endswith("wellfound.com"):
-                        page.wait_for_selector(
-                            "a[href^='/jobs/'], a[href^='/l/']",
-                            timeout=PW_WAIT_TIMEOUT * 2,
-                        )
-                        page.mouse.wheel(0, 3000)
-                        page.wait_for_timeout(800)
+                elif host.endswith("wellfound.com"):
+                    page.wait_for_selector(
+                        "a[href^='/jobs/'], a[href^='/l/']",
+                        timeout=PW_WAIT_TIMEOUT * 2,
+                    )
+                    page.mouse.wheel(0, 3000)
+                    page.wait_for_timeout(800)
 
-                    elif host.endswith("dice.com") or host.endswith("www.dice.com"):
-                        # Wait for job cards rendered by JS
-                        page.wait_for_selector(
-                            "a[href*='/job-detail/']",
-                            timeout=PW_WAIT_TIMEOUT * 2,
-                        )
-                        page.mouse.wheel(0, 4000)
-                        page.wait_for_timeout(800)
+                elif host.endswith("dice.com") or host.endswith("www.dice.com"):
+                    # Wait for job cards rendered by JS
+                    page.wait_for_selector(
+                        "a[href*='/job-detail/']",
+                        timeout=PW_WAIT_TIMEOUT * 2,
+                    )
+                    page.mouse.wheel(0, 4000)
+                    page.wait_for_timeout(800)
 
-                    elif host.endswith("welcometothejungle.com"):
-                        # Wait for the main content
-                        page.wait_for_selector(
-                            "main, [data-testid='job-offer']",
-                            timeout=PW_WAIT_TIMEOUT * 2,
-                        )
+                elif host.endswith("welcometothejungle.com"):
+                    # Wait for the main content
+                    page.wait_for_selector(
+                        "main, [data-testid='job-offer']",
+                        timeout=PW_WAIT_TIMEOUT * 2,
+                    )
 
-                        # Click visible "View more" expanders so hidden sections load
-                        try:
-                            # Role-based locator first
-                            buttons = page.get_by_role(
-                                "button",
-                                name=re.compile(r"view more", re.I),
-                            )
-                            count = buttons.count()
-                            if count:
-                                for i in range(min(count, 4)):
+                    # Click visible "View more" expanders so hidden sections load
+                    try:
+                        # Role-based locator first
+                        buttons = page.get_by_role(
+                            "button",
+                            name=re.compile(r"view more", re.I),
+                        )
+                        count = buttons.count()
+                        if count:
+                            for i in range(min(count, 4)):
+                                try:
+                                    buttons.nth(i).click()
+                                    page.wait_for_timeout(300)
+                                except Exception:
+                                    pass
+
+                        # Fallback to common WTTJ expanders
+                        for sel in [
+                            "button:has-text('View more')",
+                            "[role='button']:has-text('View more')",
+                            "button[data-testid='show-more']",
+                        ]:
+                            els = page.locator(sel)
+                            n = els.count()
+                            if n:
+                                for i in range(min(n, 4)):
                                     try:
-                                        buttons.nth(i).click()
+                                        els.nth(i).click()
                                         page.wait_for_timeout(300)
                                     except Exception:
                                         pass
 
-                            # Fallback to common WTTJ expanders
-                            for sel in [
-                                "button:has-text('View more')",
-                                "[role='button']:has-text('View more')",
-                                "button[data-testid='show-more']",
-                            ]:
-                                els = page.locator(sel)
-                                n = els.count()
-                                if n:
-                                    for i in range(min(n, 4)):
-                                        try:
-                                            els.nth(i).click()
-                                            page.wait_for_timeout(300)
-                                        except Exception:
-                                            pass
-
-                            # Let the DOM settle
-                            page.wait_for_timeout(500)
-                        except Exception:
-                            pass
+                        # Let the DOM settle
+                        page.wait_for_timeout(500)
+                    except Exception:
+                        pass
 
-                except Exception:
-                    # do not fail the run on host specific tweaks
-                    pass
+            except Exception:
+                # do not fail the run on host specific tweaks
+                pass
 
-                # ---------------------------
-                # 4. EdTech listing autoscroll
-                # ---------------------------
-                try:
-                    needs_autoscroll = (
-                        host in {"edtech.com", "www.edtech.com"}
-                        and "/jobs/" in path
-                        and path.endswith("-jobs")
+            # ---------------------------
+            # 4. EdTech listing autoscroll
+            # ---------------------------
+            try:
+                needs_autoscroll = (
+                    host in {"edtech.com", "www.edtech.com"}
+                    and "/jobs/" in path
+                    and path.endswith("-jobs")
+                )
+
+                if needs_autoscroll:
+                    # click "More" buttons first if present
+                    try:
+                        for _ in range(50):
+                            btn = page.query_selector(
+                                "button:has-text('More'), "
+                                "a:has-text('More'), "
+                                "button:has-text('Load'), "
+                                "a:has-text('Load')"
+                            )
+                            if not btn:
+                                break
+                            btn.click()
+                            page.wait_for_timeout(900)
+                    except Exception:
+                        pass
+
+                    # then deep autoscroll until stable
+                    _autoscroll_listing(
+                        page,
+                        link_css='a[href^="/jobs/"]:not([href$="-jobs"])',
+                        max_loops=1100,
+                        idle_ms=2000,
                     )
+            except Exception:
+                # do not fail run if autoscroll logic hiccups
+                pass
 
-                    if needs_autoscroll:
-                        # click "More" buttons first if present
-                        try:
-                            for _ in range(50):
-                                btn = page.query_selector(
-                                    "button:has-text('More'), "
-                                    "a:has-text('More'), "
-                                    "button:has-text('Load'), "
-                                    "a:has-text('Load')"
-                                )
-                                if not btn:
-                                    break
-                                btn.click()
-                                page.wait_for_timeout(900)
-                        except Exception:
-                            pass
+            # ---------------------------
+            # 5. Generic waits for common job structures
+            # ---------------------------
+            try:
+                page.wait_for_selector(
+                    "a[href^='/job/'], "
+                    "a[href*='/jobs/'], "
+                    "a[href*='/remote-jobs/'], "
+                    "a:has(h2), "
+                    "a:has(h3), "
+                    "main article",
+                    timeout=PW_WAIT_TIMEOUT,
+                )
+            except Exception:
+                pass
 
-                        # then deep autoscroll until stable
-                        _autoscroll_listing(
-                            page,
-                            link_css='a[href^="/jobs/"]:not([href$="-jobs"])',
-                            max_loops=1100,
-                            idle_ms=2000,
-                        )
-                except Exception:
-                    # do not fail run if autoscroll logic hiccups
-                    pass
+            # wait for common embedded boards if present
+            try:
+                page.wait_for_selector(
+                    "script[src*='greenhouse.io/embed/job_board'], "
+                    "iframe[src*='greenhouse'], "
+                    "a[href*='jobs.lever.co'], "
+                    "a[href*='ashbyhq.com']",
+                    timeout=PW_WAIT_TIMEOUT,
+                )
+            except Exception:
+                # fine to fall back to whatever is loaded
+                pass
+
+            # Built In is JS heavy. In bulk runs we can capture the pre hydration shell.
+            # Wait briefly for any post hydration signal before reading page.content().
+            try:
+                cur_url = page.url or ""
+            except Exception:
+                cur_url = ""
 
-                # ---------------------------
-                # 5. Generic waits for common job structures
-                # ---------------------------
+            if ("builtin.com/job/" in cur_url) or ("builtinseattle.com/job/" in cur_url) or ("builtinvancouver.org/job/" in cur_url) or ("builtin.com" in (cur_url or "")) or ("builtinseattle.com" in (cur_url or "")) or ("builtinvancouver.org" in (cur_url or "")):
                 try:
-                    page.wait_for_selector(
-                        "a[href^='/job/'], "
-                        "a[href*='/jobs/'], "
-                        "a[href*='/remote-jobs/'], "
-                        "a:has(h2), "
-                        "a:has(h3), "
-                        "main article",
-                        timeout=PW_WAIT_TIMEOUT,
+                    page.wait_for_function(
+                        """() => {
+                            const html = document.documentElement && document.documentElement.innerHTML ? document.documentElement.innerHTML : "";
+                            if (html.includes("Builtin.jobPostInit")) return true;
+                            if (html.includes('type="application/ld+json"')) return true;
+                            if (document.querySelector("span[data-bs-toggle='tooltip']")) return true;
+                            return false;
+                        }""",
+                        timeout=15000,
                     )
                 except Exception:
                     pass
+                # Seattle pages sometimes hydrate later but expose stable DOM markers first.
+                if "builtinseattle.com/job/" in (cur_url or ""):
+                    try:
+                        page.wait_for_selector(
+                            "[data-id='company-title'], div[data-id='job-card'] h1",
+                            timeout=15000,
+                        )
+                    except Exception:
+                        pass
 
-                # wait for common embedded boards if present
-                try:
-                    page.wait_for_selector(
-                        "script[src*='greenhouse.io/embed/job_board'], "
-                        "iframe[src*='greenhouse'], "
-                        "a[href*='jobs.lever.co'], "
-                        "a[href*='ashbyhq.com']",
-                        timeout=PW_WAIT_TIMEOUT,
+            # ---------------------------
+            # 6. Capture HTML and bump counters
+            # ---------------------------
+            html = page.content()
+
+            # Built In Seattle can intermittently return a partial shell first
+            # (title present, but no JSON-LD / jobPostInit / company node yet).
+            if "builtinseattle.com/job/" in (cur_url or ""):
+                def _sea_has_strong_job_signals(h: str) -> bool:
+                    h_low = (h or "").lower()
+                    return (
+                        ("Builtin.jobPostInit" in (h or ""))
+                        or ("hiringOrganization" in (h or ""))
+                        or ('data-id="company-title"' in (h or ""))
+                        or ("job-post-body-" in h_low)
+                        or ('<meta name="description"' in h_low)
                     )
-                except Exception:
-                    # fine to fall back to whatever is loaded
-                    pass
 
-                # Built In is JS heavy. In bulk runs we can capture the pre hydration shell.
-                # Wait briefly for any post hydration signal before reading page.content().
-                try:
-                    cur_url = page.url or ""
-                except Exception:
-                    cur_url = ""
+                if not _sea_has_strong_job_signals(html):
+                    for _ in range(3):  # additive wait budget ~9s
+                        try:
+                            page.wait_for_timeout(3000)
+                        except Exception:
+                            break
+                        html = page.content()
+                        if _sea_has_strong_job_signals(html):
+                            break
 
-                if ("builtin.com/job/" in cur_url) or ("builtinseattle.com/job/" in cur_url) or ("builtinvancouver.org/job/" in cur_url) or ("builtin.com" in (cur_url or "")) or ("builtinseattle.com" in (cur_url or "")) or ("builtinvancouver.org" in (cur_url or "")):
+            # If we still got a tiny shell, try one reload once.
+            if (("builtin.com/job/" in cur_url) or ("builtinseattle.com/job/" in cur_url)) and (not html or len(html) < 50000):
+                try:
+                    page.reload(wait_until="domcontentloaded")
                     try:
                         page.wait_for_function(
                             """() => {
@@ -11283,7 +11249,6 @@ def fetch_html_with_playwright(url, user_agent=USER_AGENT, engine="chromium"):
                         )
                     except Exception:
                         pass
-                    # Seattle pages sometimes hydrate later but expose stable DOM markers first.
                     if "builtinseattle.com/job/" in (cur_url or ""):
                         try:
                             page.wait_for_selector(
@@ -11292,114 +11257,46 @@ def fetch_html_with_playwright(url, user_agent=USER_AGENT, engine="chromium"):
                             )
                         except Exception:
                             pass
-
-                # ---------------------------
-                # 6. Capture HTML and bump counters
-                # ---------------------------
-                html = page.content()
-
-                # Built In Seattle can intermittently return a partial shell first
-                # (title present, but no JSON-LD / jobPostInit / company node yet).
-                if "builtinseattle.com/job/" in (cur_url or ""):
-                    def _sea_has_strong_job_signals(h: str) -> bool:
-                        h_low = (h or "").lower()
-                        return (
-                            ("Builtin.jobPostInit" in (h or ""))
-                            or ("hiringOrganization" in (h or ""))
-                            or ('data-id="company-title"' in (h or ""))
-                            or ("job-post-body-" in h_low)
-                            or ('<meta name="description"' in h_low)
-                        )
-
-                    if not _sea_has_strong_job_signals(html):
-                        for _ in range(3):  # additive wait budget ~9s
+                    html = page.content()
+                    if "builtinseattle.com/job/" in (cur_url or ""):
+                        # One more short poll after reload for slower Seattle hydration.
+                        for _ in range(2):
+                            html_low = (html or "").lower()
+                            if (
+                                "Builtin.jobPostInit" in (html or "")
+                                or "hiringOrganization" in (html or "")
+                                or 'data-id="company-title"' in (html or "")
+                                or "job-post-body-" in html_low
+                                or '<meta name="description"' in html_low
+                            ):
+                                break
                             try:
-                                page.wait_for_timeout(3000)
+                                page.wait_for_timeout(2500)
                             except Exception:
                                 break
                             html = page.content()
-                            if _sea_has_strong_job_signals(html):
-                                break
-
-                # If we still got a tiny shell, try one reload once.
-                if (("builtin.com/job/" in cur_url) or ("builtinseattle.com/job/" in cur_url)) and (not html or len(html) < 50000):
-                    try:
-                        page.reload(wait_until="domcontentloaded")
-                        try:
-                            page.wait_for_function(
-                                """() => {
-                                    const html = document.documentElement && document.documentElement.innerHTML ? document.documentElement.innerHTML : "";
-                                    if (html.includes("Builtin.jobPostInit")) return true;
-                                    if (html.includes('type="application/ld+json"')) return true;
-                                    if (document.querySelector("span[data-bs-toggle='tooltip']")) return true;
-                                    return false;
-                                }""",
-                                timeout=15000,
-                            )
-                        except Exception:
-                            pass
-                        if "builtinseattle.com/job/" in (cur_url or ""):
-                            try:
-                                page.wait_for_selector(
-                                    "[data-id='company-title'], div[data-id='job-card'] h1",
-                                    timeout=15000,
-                                )
-                            except Exception:
-                                pass
-                        html = page.content()
-                        if "builtinseattle.com/job/" in (cur_url or ""):
-                            # One more short poll after reload for slower Seattle hydration.
-                            for _ in range(2):
-                                html_low = (html or "").lower()
-                                if (
-                                    "Builtin.jobPostInit" in (html or "")
-                                    or "hiringOrganization" in (html or "")
-                                    or 'data-id="company-title"' in (html or "")
-                                    or "job-post-body-" in html_low
-                                    or '<meta name="description"' in html_low
-                                ):
-                                    break
-                                try:
-                                    page.wait_for_timeout(2500)
-                                except Exception:
-                                    break
-                                html = page.content()
-                    except Exception:
-                        pass
-
-
-                # optional counters if you define them globally
-                try:
-                    g = globals()
-                    if "PW_SUCCESS" in g:
-                        g["PW_SUCCESS"] += 1
                 except Exception:
                     pass
 
-                #log_event("DEBUG", f"Playwright returned HTML for {url}")       ignored 20251215
-                return html
 
-            finally:
-                # always clean up Playwright resources
-                try:
-                    context.close()
-                except Exception:
-                    pass
-                try:
-                    browser.close()
-                except Exception:
-                    pass
+            _bump_pw_stats("PW_SUCCESS")
+
+            #log_event("DEBUG", f"Playwright returned HTML for {url}")       ignored 20251215
+            try:
+                resp_headers = dict(resp.headers) if resp else {}
+            except Exception:
+                resp_headers = {}
+            return FetchResult(
+                url=url,
+                final_url=cur_url or url,
+                status=(resp.status if resp else None),
+                html=html,
+                headers=resp_headers,
+                engine="playwright",
+            )
 
     except Exception as e:
-        # optional failure / fallback counters
-        try:
-            g = globals()
-            if "PW_FAIL" in g:
-                g["PW_FAIL"] += 1
-            if "REQ_FALLBACK" in g:
-                g["REQ_FALLBACK"] += 1
-        except Exception:
-            pass
+        _bump_pw_stats("PW_FAIL", "REQ_FALLBACK")
 
         msg = (
             f"Playwright failed on {url} ({e.__class__.__name__}):\n"
@@ -11432,142 +11329,167 @@ def _is_partial_builtinseattle_job_shell(url: str, html: str | None) -> bool:
         return False
 
 
-def get_html(url):
+def fetch_page(url, engine: str = "") -> FetchResult:
+    """
+    Fetch a URL with the engine its host needs and return a FetchResult.
+    result.html is None when the page could not be fetched. engine
+    ("playwright" | "requests") overrides the PLAYWRIGHT_DOMAINS host rule.
+
+    Under --replay the result comes from the fetch archive and nothing
+    touches the network; under --record every result is archived.
+    """
+    archive = FETCH_ARCHIVE
+    if archive is not None and archive.replaying:
+        return archive.lookup(url) or FetchResult(url=url, engine="replay")
+
+    res = _fetch_page_cached(url, engine)
+    if archive is not None:
+        archive.record(res)
+    return res
+
+
+def _fetch_page_cached(url, engine: str = "") -> FetchResult:
+    """
+    fetch_page() minus the archive. With the page cache on, a fresh entry is served from disk. A stale
+    requests-path entry is revalidated with its ETag/Last-Modified (304 =
+    reuse). Playwright pages have no validators, so they go by TTL only.
+    """
+    cache = PAGE_CACHE
+    cached = cache.lookup(url) if cache else None
+    if cached and cached.fresh:
+        cache.note("hits")
+        return cached.result
+
+    res = _fetch_page_live(url, cached, engine)
+    if cache:
+        if res.engine == "requests" and res.status == 304 and cached:
+            cache.touch(url)
+            cache.note("revalidated")
+            return cached.result
+        cache.note("misses")
+        cache.store(res)
+    return res
+
+
+def _fetch_page_live(url, cached=None, engine: str = "") -> FetchResult:
+    """Network fetch behind fetch_page(); `cached` supplies revalidation headers."""
     domain = up.urlparse(url).netloc.lower()
-    if domain in PLAYWRIGHT_DOMAINS:
-        html = fetch_html_with_playwright(url)
-        if _is_partial_builtinseattle_job_shell(url, html):
+    if engine == "playwright" or (engine != "requests" and domain in PLAYWRIGHT_DOMAINS):
+        res = fetch_result_with_playwright(url)
+        if _is_partial_builtinseattle_job_shell(url, res.html if res else None):
             try:
                 log_line("DEBUG", f"[BIVDBG] Seattle partial shell detected, retrying Playwright once: {url}")
             except Exception:
                 pass
-            html_retry = fetch_html_with_playwright(url)
-            if html_retry and not _is_partial_builtinseattle_job_shell(url, html_retry):
-                html = html_retry
+            res_retry = fetch_result_with_playwright(url)
+            if res_retry and res_retry.html and not _is_partial_builtinseattle_job_shell(url, res_retry.html):
+                res = res_retry
             else:
                 # Seattle-only additive fallback: some pages are server-rendered well enough via requests.
                 try:
                     resp = polite_get(url)
                 except Exception:
                     resp = None
-                html_req = resp.text if resp else None
-                if html_req and not _is_partial_builtinseattle_job_shell(url, html_req):
+                res_req = fetch_result_from_response(url, resp)
+                if res_req.html and not _is_partial_builtinseattle_job_shell(url, res_req.html):
                     try:
                         log_line("DEBUG", f"[BIVDBG] Seattle partial shell resolved via requests fallback: {url}")
                     except Exception:
                         pass
-                    html = html_req
+                    res = res_req
                 else:
                     # One more PW try for intermittent Seattle pages (kept Seattle-only).
-                    html_retry2 = fetch_html_with_playwright(url)
-                    if html_retry2 and not _is_partial_builtinseattle_job_shell(url, html_retry2):
-                        html = html_retry2
-        return html  # do not attempt requests() fallback for PW-only sites
-    resp = polite_get(url)
-    return resp.text if resp else None
+                    res_retry2 = fetch_result_with_playwright(url)
+                    if res_retry2 and res_retry2.html and not _is_partial_builtinseattle_job_shell(url, res_retry2.html):
+                        res = res_retry2
+        # do not attempt requests() fallback for PW-only sites
+        return res or FetchResult(url=url, engine="playwright")
+    validators = cached.conditional_headers() if cached else None
+    return fetch_result_from_response(url, polite_get(url, headers=validators))
 
-def _find_ats_boards(html: str) -> list[str]:
-    boards = []
 
-    # Greenhouse: both JS and embed variants
-    for m in re.findall(r'https?://boards\.greenhouse\.io/(?:embed/job_board|embed/job_board/js|job_board/js)\?for=([a-z0-9\-]+)', html, flags=re.I):
-        boards.append(f"https://boards.greenhouse.io/embed/job_board?for={m}")
+def get_html(url, engine: str = ""):
+    return fetch_page(url, engine).html
 
-    # Also catch direct /<company> style if present (rare on GH)
-    for m in re.findall(r'https?://boards\.greenhouse\.io/([a-z0-9\-]+)/?', html, flags=re.I):
-        boards.append(f"https://boards.greenhouse.io/embed/job_board?for={m}")
+def _scan_career_pages(urls: list[str], quiet: bool = False, background: bool = False) -> dict[str, list[str]]:
+    """
+    Fetch careers pages side by side and return {page: boards} for the ones
+    that loaded; each is recorded in the career-board cache when it is open.
+    A background scan runs beside discovery and the detail stage, so it uses
+    few workers and the run's page-fetch throttle, sharing its host limits.
+    """
+    def _probe(url):
+        if not quiet:
+            progress_clear_if_needed()
+            _bk_log_wrap("[CAREERS", f" ]{DOT3}Probing {url}")
+        return get_html(url)
+
+    # careers pages are on different hosts, so fetch them side by side
+    fetched = run_ordered(
+        urls,
+        _probe,
+        workers=CAREER_REFRESH_WORKERS if background else DISCOVERY_WORKERS,
+        throttle=_detail_throttle() if background else _discovery_throttle(),
+        on_thread_exit=lambda: get_browser_pool("chromium").close_thread(),
+    )
+    found: dict[str, list[str]] = {}
+    for url, ok, html in fetched:
+        if not ok or not html:
+            if not quiet:
+                progress_clear_if_needed()
+                _bk_log_wrap("[WARN", f" ]{DOT3}{DOTW}Could not fetch: {url}")
+            continue
 
-    # Lever: jobs.lever.co/<company>
-    for m in re.findall(r'https?://jobs\.lever\.co/([a-z0-9\-]+)', html, flags=re.I):
-        boards.append(f"https://jobs.lever.co/{m}")
+        boards = find_ats_boards(html)
+        found[url] = boards
+        if CAREER_BOARDS is not None:
+            CAREER_BOARDS.record(url, boards)
+        if quiet:
+            continue
+        progress_clear_if_needed()
+        if boards:
+            _bk_log_wrap("[CAREERS", f" ]{DOT6}{len(boards)} board(s) found on {url}")
+        else:
+            _bk_log_wrap("[CAREERS", f" ]{DOT6}No ATS links found on {url}")
+    return found
 
-    # De-dupe
-    return sorted(set(boards))
 
 def expand_career_sources():
-    """Return a list of ATS job board URLs discovered on company careers pages."""
-    pages = []
-    for url in CAREER_PAGES:
-        progress_clear_if_needed()
-        _bk_log_wrap("[CAREERS", f" ]{DOT3}Probing {url}")
-        html = get_html(url)
-        if not html:
-            #log_print("[WARN", f" ]{DOT3}{DOTW}Warning: Failed to GET listing page: {url}")
+    """
+    Return a list of ATS job board URLs discovered on company careers pages.
 
+    With the career-board cache open, only pages never scanned before are
+    fetched now; stale pages contribute their cached boards to this run and
+    are re-scanned on a background thread for the next one.
+    """
+    global _CAREER_REFRESH
+    if CAREER_BOARDS is None:
+        found = _scan_career_pages(CAREER_PAGES)
+    else:
+        found, stale, missing = CAREER_BOARDS.split(CAREER_PAGES)
+        if missing:
+            found.update(_scan_career_pages(missing))
+        if stale:
             progress_clear_if_needed()
-            _bk_log_wrap("[WARN", f" ]{DOT3}{DOTW}Could not fetch: {url}")
-            continue
-
-
-        soup = BeautifulSoup(html, "html.parser")
-        found = set()
+            _bk_log_wrap("[CAREERS", f" ]{DOT3}Re-scanning {len(stale)} stale careers page(s) in the background")
+            _CAREER_REFRESH = threading.Thread(
+                target=_scan_career_pages, args=(stale, True, True), name="career-refresh", daemon=True,
+            )
+            _CAREER_REFRESH.start()
 
-        # Scan visible links
-        for a in soup.find_all("a", href=True):
-            full = up.urljoin(url, a["href"])
-            host = up.urlparse(full).netloc.lower()
-            path = up.urlparse(full).path.lower()
-
-            # 1) Greenhouse embedded via <iframe>
-            for iframe in soup.find_all("iframe", src=True):
-                src = iframe["src"]
-                if "greenhouse" in src and "for=" in src:
-                    qs = up.parse_qs(up.urlparse(src).query)
-                    slug = qs.get("for", [None])[0]
-                    if slug:
-                        found.add(f"https://job-boards.greenhouse.io/embed/job_board?for={slug}")
-
-            # 2) Plain text fallback (some sites inline the URL in data blobs)
-            raw = html or ""
-            for m in re.findall(r"https?://(?:boards|job-boards)\.greenhouse\.io/[^\"'<> ]+", raw, flags=re.I):
-                # normalize any /<company>/jobs style to embed if needed
-                g = re.search(r"(?:boards|job-boards)\.greenhouse\.io/([^/]+)/", m)
-                if g:
-                    found.add(f"https://job-boards.greenhouse.io/embed/job_board?for={g.group(1)}")
-            for m in re.findall(r"https?://jobs\.lever\.co/([a-z0-9\-]+)", raw, flags=re.I):
-                found.add(f"https://jobs.lever.co/{m}")
-            for m in re.findall(r"https?://jobs\.ashbyhq\.com/([a-z0-9\-]+)/?", raw, flags=re.I):
-                found.add(f"https://jobs.ashbyhq.com/{m}")
-
-            # Greenhouse
-            if "boards.greenhouse.io" in host or "job-boards.greenhouse.io" in host:
-                m = re.search(r"(?:boards|job-boards)\.greenhouse\.io/([^/]+)/jobs", full)
-                if m:
-                    slug = m.group(1)
-                    found.add(f"https://job-boards.greenhouse.io/embed/job_board?for={slug}")
-                elif "embed/job_board" in path and "for=" in full:
-                    found.add(full)
-
-            # Lever
-            elif "jobs.lever.co" in host:
-                m = re.search(r"jobs\.lever\.co/([^/]+)/?", full)
-                if m:
-                    found.add(f"https://jobs.lever.co/{m.group(1)}")
+    pages = []
+    for url in CAREER_PAGES:
+        pages.extend(found.get(url, []))
+    return list(dict.fromkeys(pages))
 
-            # Ashby
-            elif "jobs.ashbyhq.com" in host:
-                m = re.search(r"jobs\.ashbyhq\.com/([^/]+)/", full)
-                if m:
-                    found.add(f"https://jobs.ashbyhq.com/{m.group(1)}")
-
-        # Greenhouse embed <script src="...embed/job_board/js?for=<slug>">
-        for s in soup.find_all("script", src=True):
-            src = s["src"]
-            if "greenhouse.io/embed/job_board" in src and "for=" in src:
-                qs = up.parse_qs(up.urlparse(src).query)
-                slug = qs.get("for", [None])[0]
-                if slug:
-                    found.add(f"https://job-boards.greenhouse.io/embed/job_board?for={slug}")
-
-        if found:
-            progress_clear_if_needed()
-            _bk_log_wrap("[CAREERS", f" ]{DOT6}{len(found)} board(s) found on {url}")
-            pages.extend(sorted(found))
-        else:
-            progress_clear_if_needed()
-            _bk_log_wrap("[CAREERS", f" ]{DOT6}No ATS links found on {url}")
 
-    return pages
+def finish_career_refresh(timeout: float = 120) -> None:
+    """Wait for the background careers re-scan so its results reach the cache."""
+    if _CAREER_REFRESH is None or not _CAREER_REFRESH.is_alive():
+        return
+    _CAREER_REFRESH.join(timeout)
+    if _CAREER_REFRESH.is_alive():
+        warn("[CAREERS] Background careers re-scan still running; its results may not be saved.")
 
 import json
 from datetime import datetime, timedelta, timezone
@@ -11646,9 +11568,12 @@ def _posted_label_to_iso_date(posted: str, now: datetime | None = None) -> str |
     return None
 
 
-def parse_jobposting_ldjson(html: str) -> dict:
-    """Parse schema.org JobPosting JSON-LD and pull out title, company, locations, dates."""
-    soup = BeautifulSoup(html, "html.parser")
+def parse_jobposting_ldjson(html: str | ParsedPage | BeautifulSoup) -> dict:
+    """
+    Parse schema.org JobPosting JSON-LD and pull out title, company, locations, dates.
+    Accepts raw HTML, a ParsedPage, or an already-built soup.
+    """
+    soup = html if isinstance(html, BeautifulSoup) else ParsedPage.of(html).soup
 
     def _set_if(d: dict, key: str, val):
         if val not in (None, "", []):
@@ -11854,7 +11779,7 @@ def extract_wttj_company_jobs(html: str, company_url: str) -> list[str]:
     Given the HTML for a company page on app.welcometothejungle.com,
     return a list of absolute job URLs found on that page.
     """
-    soup = BeautifulSoup(html, "html.parser")
+    soup = make_soup(html)
 
     links: list[str] = []
     for a in soup.find_all("a", href=True):
@@ -11941,6 +11866,24 @@ EXCLUDE_TITLES = [
     r"\bintern\b",
 ]
 
+# listing-title prefilter: whole-word hits only, no lookaheads, so a title
+# that merely might be off-target (operations, support, growth...) still goes
+# to the full path. This is not parity: _is_target_role lets a target title in
+# the description snippet override any exclude, so a "UX Designer" whose
+# description names a product owner is kept there but skipped here. Checked
+# by tools/check_title_prefilter.py.
+LISTING_EXCLUDE_TITLES = [
+    r"\b(?:product\s+marketing|demand\s+gen)\b",
+    r"\b(?:data|financial|research|credit)\s+analyst\b",
+    r"\bdata\s+(?:scientist|engineer)\b",
+    r"\b(?:ml|ai)\s+(?:engineer|scientist)\b",
+    r"\b(?:dev|backend|frontend|full[-\s]?stack|software|platform|sre|qa|test)\s+engineer\b",
+    r"\b(?:ux|ui|hr)\b",
+    r"\b(?:designer|recruiter|payroll|bookkeeper|accountant|intern)\b",
+    r"\b(?:visual|graphic)\s+design\b",
+    r"\b(?:talent\s+acquisition|people\s+ops)\b",
+]
+
 # responsibility signals that look like PO/PM/BA/BSA/Scrum Master work
 RESPONSIBILITY_SIGNALS = [
     r"\b(backlog|product\s+backlog)\b",
@@ -12150,6 +12093,64 @@ SIMPLYHIRED_BASE = "https://www.simplyhired.com"
 # Map job detail URL → title text from the SimplyHired listing page
 SIMPLYHIRED_TITLES: dict[str, str] = {}
 
+# Map job detail URL → card/anchor title from any listing page (all collectors)
+LISTING_TITLES: dict[str, str] = {}
+LISTING_TITLE_PREFILTER = True   # skip obvious non-target titles before fetching (--no-title-prefilter)
+
+# Map job detail URL → fields a listing/API already gave us (e.g. {"Location": ...})
+LISTING_CONTEXT: dict[str, dict] = {}
+
+# Map job detail URL → detail page rendered from an ATS API payload (no fetch needed)
+API_DETAIL_PAGES: dict[str, FetchResult] = {}
+
+# Map job detail URL → API posting whose details are built directly (no extraction)
+API_POSTINGS: dict[str, ApiPosting] = {}
+
+_GENERIC_ANCHOR_RX = re.compile(
+    r"^(easy\s+)?apply(\s+now)?$|^(view|see)(\s+(job|details|more|role))?$|^(learn|read)\s+more$|"
+    r"^(job\s+)?details$|^more$|^save$|^share$",
+    re.I,
+)
+
+
+def _note_listing_title(url: str, text: str | None) -> None:
+    """Remember the first real title a listing shows for `url` (buttons and card blobs ignored)."""
+    title = " ".join(str(text or "").split())
+    if not url or len(title) < 4 or len(title) > 160 or _GENERIC_ANCHOR_RX.match(title):
+        return
+    LISTING_TITLES.setdefault(url, title)
+
+
+def _note_listing_context(url: str, **fields) -> None:
+    """Remember non-empty listing fields for `url`; the first value seen wins."""
+    if not url:
+        return
+    ctx = LISTING_CONTEXT.setdefault(url, {})
+    for k, v in fields.items():
+        v = " ".join(str(v or "").split())
+        if v:
+            ctx.setdefault(k, v)
+
+
+def _listing_title_skip_reason(title: str) -> str | None:
+    """
+    Cheap title-only pre-classification for a listing card.
+    Returns a skip reason only for obvious non-targets: the title hits
+    LISTING_EXCLUDE_TITLES and nothing in INCLUDE_TITLES_EXACT / INCLUDE_TITLES_FUZZY.
+    Anything ambiguous returns None and goes through the full detail path.
+    """
+    t = normalize_title(title or "").lower()
+    if not t:
+        return None
+    if any(re.search(p, t, re.I) for p in INCLUDE_TITLES_EXACT):
+        return None
+    if any(re.search(p, t, re.I) for p in INCLUDE_TITLES_FUZZY):
+        return None
+    for p in LISTING_EXCLUDE_TITLES:
+        if re.search(p, t, re.I):
+            return "Not a target role (listing title)"
+    return None
+
 
 # Whitelists (always treat as remote)
 SOURCE_WHITELIST_REMOTE = ["weworkremotely.com", "remoteok.com"]
@@ -12197,30 +12198,28 @@ def label_visibility(ats_status_200: bool, listed_on_careers: bool,
     else:
         return "expired", score, "🔴"
 
-def _public_sanity_checks(keep_row: dict) -> tuple[str, int, str]:
+def _public_sanity_checks(keep_row: dict, fetch: FetchResult | None = None) -> tuple[str, int, str]:
     """
     Light-weight checks to decide if a job looks PUBLIC and boost confidence:
       - 200 on ATS/job URL
       - listed on company careers page we scraped (if present)
       - any recent ISO date on the page
+    Uses the status and HTML from the original fetch (`fetch`); no extra I/O.
     Returns (visibility, score, mark) using label_visibility()
     """
-    import requests
     url = (keep_row.get("Job URL") or "").strip()
     if not url:
         return "quiet", 40, "🟠"
 
+    # a 403/429 never gets here: polite_get() fails those fetches, so no row is kept
     ats_ok = False
-    soft_ok = False  # treat bot-blocked/429 as quiet
+    soft_ok = False  # bot-blocking hosts count as reachable
     text   = ""
-    try:
-        r = requests.get(url, headers=HEADERS, timeout=REQUEST_TIMEOUT, allow_redirects=True)
-        ats_ok = (r.status_code == 200)
-        if r.status_code in (403, 429):
-            soft_ok = True
-        text   = r.text or ""
-    except Exception:
-        pass
+    if fetch is not None:
+        status = fetch.status
+        # Playwright can return no response object for same-document loads
+        ats_ok = (status == 200) or (status is None and fetch.ok)
+        text   = fetch.html or ""
 
     # If we previously fetched the company careers page HTML, you can pass it in later;
     # for now we just use the URL host as a proxy (Lever/Greenhouse/Ashby usually = public)
@@ -12235,7 +12234,7 @@ def _public_sanity_checks(keep_row: dict) -> tuple[str, int, str]:
     return label_visibility(
         ats_status_200 = ats_ok or soft_ok,
         listed_on_careers = listed_on_careers,
-        in_org_feed = False,
+        in_org_feed = fetch is not None and fetch.engine == "api",
         has_recent_date = has_recent_date,
         last_seen_days = 0,
         cache_only = False,
@@ -12506,14 +12505,16 @@ def _is_commutable_local(d: dict) -> bool:
     return False
 
 
-def _enrich_workday_location(details: dict, html: str, job_url: str = "") -> dict:
+def _enrich_workday_location(details: dict, html: str | ParsedPage, job_url: str = "") -> dict:
     """
     Pull location info from Workday job detail page JSON blobs and the visible
     badges (remoteType, locations).
     """
     try:
-        html_lower = (html or "").lower()
-        soup = BeautifulSoup(html or "", "html.parser")
+        page = ParsedPage.of(html, job_url)
+        html = page.html
+        html_lower = html.lower()
+        soup = page.soup
 
         # 1. Visible "Remote type" badge, for tenants like UW
         try:
@@ -12791,13 +12792,16 @@ def refresh_progress() -> None:
     progress_refresh_after_log(force=True)
 
 
-CURRENT_SOURCE = ""  # global tag used by log_event
+_SOURCE_TAG = threading.local()  # per-thread tag: discovery / detail workers each set their own
 
 def set_source_tag(url: str):
-    """Set a short source tag like 'remotive.com' or 'simplyhired.com'."""
-    global CURRENT_SOURCE
-    host = up.urlparse(url).netloc.replace("www.", "")
-    CURRENT_SOURCE = host
+    """Set a short source tag like 'remotive.com' or 'simplyhired.com' for this thread."""
+    _SOURCE_TAG.host = up.urlparse(url).netloc.replace("www.", "")
+
+
+def current_source_tag() -> str:
+    """The tag set_source_tag() last set on this thread ('' if none)."""
+    return getattr(_SOURCE_TAG, "host", "")
 
 
 def _normalize_job_defaults(d: dict) -> dict:
@@ -12985,39 +12989,6 @@ def _normalize_job_defaults(d: dict) -> dict:
 
 
 
-def link_key(u: str) -> str:
-    """
-    Stable key so duplicate listing and detail URLs collapse across boards.
-    - lowercases host
-    - lowercases path for most boards
-    - preserves path casing for case-sensitive boards (YC)
-    - strips 'www.' and trailing slashes
-    - drops tracking or paging query params
-    - ignores fragments
-    """
-    p = urlparse(str(u or ""))
-    host = (p.netloc or "").lower()
-    if host.startswith("www."):
-        host = host[4:]
-
-    path_raw = (p.path or "").rstrip("/") or "/"
-    path = path_raw if "ycombinator.com" in host else path_raw.lower()
-
-    drop = {
-        "utm_source", "utm_medium", "utm_campaign", "utm_term", "utm_content",
-        "ref", "source", "src", "page", "p", "start"
-    }
-
-    kept = []
-    for k, v in parse_qsl(p.query or "", keep_blank_values=False):
-        if (k or "").lower() in drop:
-            continue
-        kept.append(((k or "").lower(), v))
-
-    q = urlencode(kept, doseq=True)
-    return f"{host}{path}?{q}" if q else f"{host}{path}"
-
-
 def _title_for_log(d: dict, link: str) -> str:
     # normalize first so trailing " @Company" / "[Hiring]" etc. are removed
     t = normalize_title((d.get("Title") or "").strip())
@@ -13496,6 +13467,7 @@ def _record_keep(row: dict) -> bool:
 
     kept_rows.append(to_keep_sheet_row(row))
     kept_count += 1
+    _remember_decision(row, "keep")
     progress_clear_if_needed()
     _progress_after_decision()
     return True
@@ -13540,10 +13512,58 @@ def _record_skip(
 
     skipped_rows.append(to_skipped_sheet_row(row))
     skip_count += 1
+    _remember_decision(row, "skip")
     progress_clear_if_needed()
     _progress_after_decision()
 
 
+def _remember_decision(row: dict, decision: str) -> None:
+    """
+    Store the decision for the detail link being processed in the seen-job
+    index. Only pages we actually fetched count, so a failed fetch is retried
+    next run instead of being remembered.
+    """
+    if SEEN_INDEX is None or not _SEEN_CURRENT.get("content_fp"):
+        return
+    try:
+        SEEN_INDEX.record(
+            _SEEN_CURRENT["key"],
+            decision=decision,
+            row=row,
+            job_key=(row.get("Job Key") or "").strip(),
+            content_fp=_SEEN_CURRENT["content_fp"],
+            listing_fp=_SEEN_CURRENT.get("listing_fp", ""),
+        )
+    except Exception as e:
+        warn(f"[SEEN] Could not record {decision} for {_SEEN_CURRENT.get('key')} ({e})")
+
+
+def _listing_fingerprint(link: str, listing_ctx_by_url: dict | None = None) -> str:
+    """What the listing pages told us about a link; '' when they said nothing."""
+    ctx = (listing_ctx_by_url or {}).get(link) or {}
+    return fingerprint(ctx, LISTING_TITLES.get(link, ""))
+
+
+def _replay_seen_decision(link: str, seen: SeenJob) -> None:
+    """Carry an unchanged job's earlier keep/skip row into this run without fetching it."""
+    row = dict(seen.row)
+    decided = datetime.fromtimestamp(seen.decided_at).strftime("%Y-%m-%d")
+    log_line("SEEN", f"{DOT3}Unchanged since {decided}, reusing {seen.decision.upper()}: {_title_for_log(row, link)}")
+    if seen.decision == "keep":
+        # the Sheet is the source of truth for Applied?/Reason, not last run's copy
+        applied_prev, reason_prev = PRIOR_DECISIONS_CACHE.get((row.get("Job URL") or "").strip(), ("", ""))
+        if applied_prev:
+            row["Applied?"] = applied_prev
+        if reason_prev:
+            row["Reason"] = reason_prev
+        if _record_keep(row):
+            _log_keep_to_terminal(row)
+    else:
+        _log_and_record_skip(link, row.get("Reason Skipped") or "", row)
+    if SEEN_INDEX is not None:
+        SEEN_INDEX.touch(seen.key)
+
+
 def _progress_after_decision() -> None:
     """Advance the spinner counters after each keep/skip decision."""
     try:
@@ -13632,6 +13652,688 @@ def require_optional_package(pkg_name: str, log_line, extra_hint: str = "") -> b
             log_line("WARN", extra_hint)
         return False
 
+DISCOVERY_WORKERS = 8         # concurrent listing hosts during discovery
+
+
+def _discovery_workers(args) -> int:
+    """Discovery fans out unless the run was asked to be serial (--workers 1)."""
+    return DISCOVERY_WORKERS if int(getattr(args, "workers", DETAIL_WORKERS) or 1) > 1 else 1
+
+
+# stage -> the run's HostThrottle; every pool of a stage shares its host limits
+_THROTTLES: dict[str, HostThrottle] = {}
+_THROTTLES_LOCK = threading.Lock()
+
+
+def _run_throttle(stage: str, concurrency: dict, min_interval: dict) -> HostThrottle:
+    with _THROTTLES_LOCK:
+        throttle = _THROTTLES.get(stage)
+        if throttle is None:
+            if _replaying():
+                throttle = HostThrottle(_REPLAY_CONCURRENCY, _REPLAY_MIN_INTERVAL)
+            else:
+                throttle = HostThrottle(concurrency, min_interval)
+            _THROTTLES[stage] = throttle
+        return throttle
+
+
+def _discovery_throttle() -> HostThrottle:
+    """One listing walk per host at a time; hosts run in parallel."""
+    return _run_throttle("discovery", {k: 1 for k in HOST_CONCURRENCY}, HOST_MIN_INTERVAL)
+
+
+def _detail_throttle() -> HostThrottle:
+    """Per-host caps for page fetches (HOST_CONCURRENCY / HOST_MIN_INTERVAL)."""
+    return _run_throttle("detail", HOST_CONCURRENCY, HOST_MIN_INTERVAL)
+
+
+def details_from_api_posting(p: ApiPosting) -> dict:
+    """
+    Details for an ATS API posting, built from the payload instead of a page.
+    Fills the base fields extract_job_details() would, then runs the same
+    salary, location-rule and chip normalization passes.
+    """
+    job_url = p.url
+    host = (up.urlparse(job_url).netloc or "").lower()
+    page_text = make_soup(p.description_html).get_text(" ", strip=True)
+    location = " / ".join(p.locations)
+    company = _normalize_company_name(p.company)
+
+    details: dict = {
+        "Title": normalize_title(p.title, company),
+        "Company": company or "No Company Found",
+        "Career Board": infer_board_from_url(job_url),
+        "Location": location,
+        "Location Raw": location,
+        "LocationRaw": location,
+        "Description": page_text[:300],
+        "Description Snippet": page_text[:300],
+        "Job URL": job_url,
+        "job_url": job_url,
+        "apply_url": p.apply_url or job_url,
+        "page_text": page_text,
+        "html_raw": p.description_html,
+        "workplace_type": p.workplace_type,
+        "is_remote_flag": "remote" if p.remote else "unknown_or_onsite",
+    }
+    if p.date_posted:
+        details["posting_date"] = p.date_posted.split("T", 1)[0]
+    if p.salary_text:
+        details["Salary Range"] = p.salary_text
+    if p.locations:
+        details["Location Chips"] = _chips_pipe_from_location_strings(p.locations)
+
+    details = enrich_salary_fields(details, page_host=host)
+    details = _derive_location_rules(details)
+
+    if not details.get("salary_min") and not details.get("salary_max"):
+        lo, hi = extract_salary_from_text(p.salary_text or page_text)
+        if lo or hi:
+            details["salary_min"] = lo
+            details["salary_max"] = hi
+            details["salary_raw"] = f"{lo or ''}–{hi or ''}"
+
+    loc_low = location.lower()
+    country = set()
+    if "canada" in loc_low:
+        country.add("canada")
+    if any(x in loc_low for x in ("united states", "usa", "u.s.")):
+        country.add("us")
+    details["Country Chips"] = _as_pipe_chips(sorted(country)) or ""
+    details["page_text_lower"] = page_text.lower()
+
+    details["Location Chips"] = _as_pipe_location_chips(details.get("Location Chips")) or ""
+    if "Applicant Regions" in details:
+        details["Applicant Regions"] = _as_pipe_regions(details.get("Applicant Regions"))
+    return details
+
+
+def _extract_detail_fields(link: str, html: str, listing: dict | None = None) -> dict:
+    """
+    The CPU-only part of the detail stage: HTML -> details dict.
+    extract_job_details(), listing location preference, JSON-LD and HTML dates.
+    Runs on the main thread, or in an extraction process (--extract-processes).
+    """
+    page = ParsedPage(html, link)
+    details = extract_job_details(page, link)
+
+    # DEBUG one-off: YC location correctness
+    try:
+        if "ycombinator.com" in (up.urlparse(link).netloc or "").lower() and "companies/gromo/jobs" in link:
+            host_dbg = (up.urlparse(link).netloc or "").lower()
+            log_line(
+                "YC CHECK",
+                f"Location={details.get('Location')!r} | Location Raw={details.get('Location Raw')!r} | "
+                f"Location Chips={details.get('Location Chips')!r} | Applicant Regions={details.get('Applicant Regions')!r} | "
+                f"Country Chips={details.get('Country Chips')!r} | host={host_dbg} | url={link}"
+            )
+    except Exception:
+        pass
+
+    if "ycombinator.com" in link:
+        log_line("YC TAP", f"Company={details.get('Company')!r} | Title={details.get('Title')!r} | job_url={details.get('job_url')!r}")        #removed 20260108- activate if you want to log the company, title, and job URL for each YC job page.
+
+    details = _prefer_listing_location(details, listing or {})
+
+    # 1) Try to pull structured JobPosting data (datePosted, validThrough, etc.)
+    schema_bits = parse_jobposting_ldjson(page)
+    if schema_bits:
+        # Only copy fields we care about; avoid overwriting with None
+        for key in ("Title", "Company", "posting_date", "valid_through", "posted"):
+            val = schema_bits.get(key)
+            if val:
+                details[key] = val
+
+    # 2) Fallback: regex-based extraction from raw HTML (Muse, Remotive, etc.)
+    html_dates = _extract_dates_from_html(html)
+    if html_dates:
+        for k, v in html_dates.items():
+            if v:
+                details[k] = v
+
+    return details
+
+
+_EXTRACT_POOL: ProcessPoolExecutor | None = None
+
+
+def _init_extract_worker(settings: dict) -> None:
+    """Runs once in each extraction process: copy over the knobs main() set from args."""
+    global SALARY_FLOOR, SOFT_SALARY_FLOOR, SALARY_CEIL, SMOKE
+    SALARY_FLOOR = settings["SALARY_FLOOR"]
+    SOFT_SALARY_FLOOR = settings["SOFT_SALARY_FLOOR"]
+    SALARY_CEIL = settings["SALARY_CEIL"]
+    SMOKE = settings["SMOKE"]
+    set_html_parser(settings["HTML_PARSER"])
+
+
+def _extract_detail_in_worker(link: str, html: str, listing: dict | None) -> tuple[dict, str]:
+    """
+    Process-pool entry point. Log lines are captured and handed back with the
+    details so the parent prints them in job order; queued DEBUG rows travel
+    inside details["__debug_rows"].
+    """
+    buf = io.StringIO()
+    with redirect_stderr(buf):
+        details = _extract_detail_fields(link, html, listing)
+    return details, buf.getvalue()
+
+
+def start_extract_pool(processes: int, html_parser: str) -> ProcessPoolExecutor | None:
+    """Start the extraction pool (spawned, so no Playwright/thread state is forked)."""
+    global _EXTRACT_POOL
+    if processes < 0:
+        processes = os.cpu_count() or 1
+    if processes <= 0:
+        return None
+    _EXTRACT_POOL = ProcessPoolExecutor(
+        max_workers=processes,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_extract_worker,
+        initargs=({
+            "SALARY_FLOOR": SALARY_FLOOR,
+            "SOFT_SALARY_FLOOR": SOFT_SALARY_FLOOR,
+            "SALARY_CEIL": SALARY_CEIL,
+            "SMOKE": SMOKE,
+            "HTML_PARSER": html_parser,
+        },),
+    )
+    return _EXTRACT_POOL
+
+
+def shutdown_extract_pool() -> None:
+    global _EXTRACT_POOL
+    if _EXTRACT_POOL is not None:
+        _EXTRACT_POOL.shutdown(wait=False, cancel_futures=True)
+        _EXTRACT_POOL = None
+
+
+def _fetch_detail_page(link: str, listing: dict | None = None) -> tuple[FetchResult, Future | None]:
+    """
+    Detail-stage worker: fetch the page (or take the one rendered from an ATS
+    API payload) and, when the extraction pool is up, queue its extraction
+    right away so processes stay busy while the main thread is still
+    consuming earlier links.
+    """
+    if link not in API_DETAIL_PAGES and ashby_board_slug(link) and not _lookup_ashby_posting(link):
+        fetch_result = _render_ashby_page(link)
+    else:
+        fetch_result = API_DETAIL_PAGES.get(link) or fetch_page(link)
+    pool = _EXTRACT_POOL
+    if pool is None or not fetch_result.html or link in API_POSTINGS:
+        return fetch_result, None
+    return fetch_result, pool.submit(_extract_detail_in_worker, link, fetch_result.html, listing)
+
+
+def _extracted_details(link: str, html: str, listing: dict | None, extraction: Future | None) -> dict:
+    """Collect a pooled extraction (replaying its log lines), else extract in-process."""
+    posting = API_POSTINGS.get(link)
+    if posting is not None:
+        return details_from_api_posting(posting)
+    if extraction is not None:
+        try:
+            details, worker_log = extraction.result()
+            if worker_log:
+                progress_clear_if_needed()
+                sys.stderr.write(worker_log)
+                progress_refresh_after_log()
+            return details
+        except Exception as e:
+            warn(f"[EXTRACT] Worker failed for {link} ({e}). Extracting in-process.")
+    return _extract_detail_fields(link, html, listing)
+
+
+# ---- Listing sources ----
+# Every listing URL is handled by one SourceAdapter. The adapter decides
+# whether the first page is fetched up front (HTML boards) or not at all
+# (JSON APIs), walks any pagination itself, and says which discovered URLs
+# are real detail pages. Per-host labels and the Playwright preference come
+# from config/source_catalog.py.
+
+_LISTING_PAGES_FETCHED: set[str] = set()
+_LISTING_PAGES_LOCK = threading.Lock()
+LISTING_FETCH_STATS = {"fetched": 0, "repeats": 0}
+
+
+def _claim_listing_page(url: str) -> bool:
+    """
+    True the first time a listing / pagination URL is seen this run, False
+    after that. Overlapping seeds and pagination walks stop at a page that
+    another walk already fetched (its links are already in the run).
+    """
+    key = (url or "").split("#", 1)[0]
+    with _LISTING_PAGES_LOCK:
+        if key in _LISTING_PAGES_FETCHED:
+            LISTING_FETCH_STATS["repeats"] += 1
+            return False
+        _LISTING_PAGES_FETCHED.add(key)
+        LISTING_FETCH_STATS["fetched"] += 1
+        return True
+
+
+def source_metadata(url: str) -> dict:
+    """SOURCE_METADATA entry for the URL's host (longest matching domain), or {}."""
+    host = up.urlparse(url).netloc.lower().replace("www.", "")
+    best = ""
+    for domain in SOURCE_METADATA:
+        if (host == domain or host.endswith("." + domain)) and len(domain) > len(best):
+            best = domain
+    return SOURCE_METADATA.get(best, {}) if best else {}
+
+
+@dataclass
+class SourceAdapter:
+    """
+    How one listing source is discovered.
+
+    discover(listing_url, first_html) returns detail links; first_html is the
+    listing page fetched by the dispatcher, or None for engine="json" sources.
+    is_detail, when set, keeps only URLs that look like detail pages.
+    """
+    name: str
+    matches: Callable[[str], bool]
+    discover: Callable[[str, Optional[str]], List[str]]
+    is_detail: Optional[Callable[[str], bool]] = None
+    engine: str = ""  # "json" | "playwright" | "requests" ("" = from source_catalog)
+
+    def preferred_engine(self, listing_url: str) -> str:
+        """
+        Engine for the first listing page: the adapter's own, else the
+        catalog's needs_playwright, else "" (fetch_page's host rule decides).
+        """
+        if self.engine:
+            return self.engine
+        needs = source_metadata(listing_url).get("needs_playwright")
+        if needs is None:
+            return ""
+        return "playwright" if needs else "requests"
+
+
+def _listing_host(url: str) -> str:
+    return up.urlparse(url).netloc.lower().replace("www.", "")
+
+
+def _is_builtin_host(url: str) -> bool:
+    host = _listing_host(url)
+    return any(d in host for d in ("builtin.com", "builtinseattle.com", "builtinvancouver.org"))
+
+
+def _is_workday_host(url: str) -> bool:
+    host = _listing_host(url)
+    return host.endswith("myworkdayjobs.com") or host.endswith("myworkdaysite.com")
+
+
+def _discover_workday(listing_url: str, html: str | None) -> list[str]:
+    return collect_workday_jobs(listing_url, max_links=(LINK_CAP or None))
+
+
+def _discover_generic(listing_url: str, html: str | None) -> list[str]:
+    return find_job_links(html or "", listing_url)
+
+
+def _register_api_postings(postings: list[ApiPosting], build_details: bool = False, engine: str = "api") -> list[str]:
+    """
+    Keep a rendered detail page for each API posting so the detail stage
+    extracts it without fetching, and feed titles/locations to the prefilter.
+    With build_details, the detail stage skips extraction too and builds the
+    details from the posting (details_from_api_posting). engine="api" marks
+    a company's own ATS feed; job-board search APIs pass another label.
+    """
+    links: list[str] = []
+    for p in postings:
+        if not p.url or is_blocked_url(p.url):
+            continue
+        API_DETAIL_PAGES[p.url] = FetchResult(
+            url=p.url, final_url=p.url, status=200, html=posting_page_html(p), engine=engine,
+        )
+        if build_details:
+            API_POSTINGS[p.url] = p
+        _note_listing_title(p.url, p.title)
+        if p.location_text:
+            _note_listing_context(p.url, Location=p.location_text)
+        links.append(p.url)
+    return links
+
+
+def _discover_greenhouse(listing_url: str, html: str | None) -> list[str]:
+    """Whole Greenhouse board from the job board API; listing HTML only if that fails."""
+    token = greenhouse_board_token(listing_url)
+    postings = fetch_greenhouse_board(token)
+    if postings is None:
+        log_line("WARN", f".[GREENHOUSE] Board API unavailable for {token}; scraping the listing page.")
+        return _discover_generic(listing_url, html or get_html(listing_url))
+    log_line("INFO", f".[GREENHOUSE] {token}: {len(postings)} jobs from the board API")
+    return _register_api_postings(postings)
+
+
+def _discover_ashby(listing_url: str, html: str | None) -> list[str]:
+    """Whole Ashby board from the posting API; the rendered listing only if that fails."""
+    board = ashby_board_slug(listing_url)
+    postings = _ashby_board(board)
+    if postings is None:
+        log_line("WARN", f".[ASHBY] Posting API unavailable for {board}; rendering the listing page.")
+        return _discover_generic(listing_url, _render_ashby_page(listing_url).html)
+    log_line("INFO", f".[ASHBY] {board}: {len(postings)} postings from the API")
+    return _register_api_postings(postings, build_details=True)
+
+
+# board slug -> future of its postings (None = API failed), shared by discovery
+# and detail lookups; only callers of the same board wait for its fetch
+_ASHBY_BOARDS: dict[str, Future] = {}
+_ASHBY_BOARDS_LOCK = threading.Lock()
+
+
+def _ashby_board(board: str) -> list[ApiPosting] | None:
+    with _ASHBY_BOARDS_LOCK:
+        fut = _ASHBY_BOARDS.get(board)
+        owner = fut is None
+        if owner:
+            fut = _ASHBY_BOARDS[board] = Future()
+    if owner:
+        try:
+            fut.set_result(fetch_ashby_board(board))
+        except Exception:
+            fut.set_result(None)
+    return fut.result()
+
+
+def _lookup_ashby_posting(link: str) -> bool:
+    """
+    Ashby detail links found off-board (careers pages, aggregators) are served
+    from their board's API payload instead of a browser load.
+    False when the board has no posting with the link's job ID.
+    """
+    job_id = ashby_job_id(link)
+    for p in _ashby_board(ashby_board_slug(link)) or []:
+        if ashby_job_id(p.url) == job_id:
+            _register_api_postings([p], build_details=True)
+            if p.url != link:
+                API_DETAIL_PAGES[link] = API_DETAIL_PAGES[p.url]
+                API_POSTINGS[link] = p
+            return True
+    return False
+
+
+def _render_ashby_page(url: str) -> FetchResult:
+    """
+    Ashby pages are client-rendered (a plain GET returns an empty shell), so
+    without an API payload they are fetched with Playwright, or skipped.
+    """
+    res = fetch_page(url, engine="playwright")
+    if not res.html:
+        log_line("WARN", f".[ASHBY] Could not render {url}; skipping it.")
+    return res
+
+
+def _discover_dice(listing_url: str, html: str | None) -> list[str]:
+    """Dice search from the search API; paginated listing pages only if that fails."""
+    postings = fetch_dice_search(listing_url, max_results=DICE_MAX_PAGES * 20)
+    if postings is None:
+        log_line("WARN", f".[DICE] Search API unavailable; walking the listing pages for {listing_url}")
+        return collect_dice_links(listing_url, max_pages=DICE_MAX_PAGES, first_html=html)
+    log_line("INFO", f".[DICE] {len(postings)} postings from the search API for {listing_url}")
+    return _register_api_postings(postings, build_details=True, engine="search-api")
+
+
+def _api_posting_from_row(row: dict, source: str) -> ApiPosting:
+    """ApiPosting for a feed row already in KEEP_FIELDS column names."""
+    location = (row.get("Location") or "").strip()
+    snippet = (row.get("Description Snippet") or "").strip()
+    posted = (row.get("Posting Date") or "").strip() or _posted_label_to_iso_date(row.get("Posted") or "") or ""
+    return ApiPosting(
+        url=row.get("Job URL") or "",
+        title=row.get("Title") or "",
+        company=row.get("Company") or "",
+        locations=[location] if location else [],
+        remote="remote" in location.lower(),
+        workplace_type="remote" if "remote" in location.lower() else "",
+        date_posted=posted,
+        salary_text=row.get("Salary Est. (Low-High)") or "",
+        description_html=f"<p>{html_lib.escape(snippet)}</p>" if snippet else "",
+        apply_url=row.get("Apply URL") or "",
+        source=source,
+    )
+
+
+def _discover_edsurge(listing_url: str, html: str | None) -> list[str]:
+    """EdSurge jobs for the seed's query (or every EDSURGE_QUERIES query) from Algolia."""
+    query = (up.parse_qs(up.urlparse(listing_url).query).get("query") or [""])[0].strip()
+    queries = [query] if query else list(EDSURGE_QUERIES)
+    jobs = fetch_edsurge_jobs(queries, max_pages=EDSURGE_MAX_PAGES)
+    if jobs is None:
+        log_line("WARN", f".[EDSURGE] Search API unavailable for {listing_url}")
+        return []
+    log_line("INFO", f".[EDSURGE] {len(jobs)} jobs for {len(queries)} queries from the search API")
+    postings = [_api_posting_from_row(job.to_row(), "edsurge") for job in jobs]
+    return _register_api_postings([p for p in postings if p.url], build_details=True, engine="search-api")
+
+
+def _discover_remote_rocketship(listing_url: str, html: str | None) -> list[str]:
+    """Every result page of a Remote Rocketship search, rows taken from the cards."""
+    jobs = scrape_remote_rocketship(listing_url, first_html=html or "")
+    log_line("INFO", f".[ROCKETSHIP] {len(jobs)} jobs from {listing_url}")
+    postings = [_api_posting_from_row(job.to_row(), "remote_rocketship") for job in jobs]
+    return _register_api_postings([p for p in postings if p.url], build_details=True, engine="search-api")
+
+
+_REMOTE_FEEDS: RemoteFeeds | None = None
+_REMOTE_FEEDS_LOCK = threading.Lock()
+
+
+def get_remote_feeds() -> RemoteFeeds:
+    """The run-wide RemoteFeeds (one download per board feed), created on first use."""
+    global _REMOTE_FEEDS
+    with _REMOTE_FEEDS_LOCK:
+        if _REMOTE_FEEDS is None:
+            _REMOTE_FEEDS = RemoteFeeds(timeout=REQUEST_TIMEOUT)
+        return _REMOTE_FEEDS
+
+
+def _discover_remote_feed(listing_url: str, html: str | None) -> list[str]:
+    """Remotive / Remote OK jobs from the board's JSON feed; listing HTML only if that fails."""
+    board = "remoteok" if "remoteok.com" in _listing_host(listing_url) else "remotive"
+    feeds = get_remote_feeds()
+    postings = feeds.remoteok(listing_url) if board == "remoteok" else feeds.remotive(listing_url)
+    if postings is None:
+        log_line("WARN", f".[{board.upper()}] JSON feed unavailable; scraping the listing page {listing_url}")
+        return _discover_generic(listing_url, html or get_html(listing_url))
+    log_line("INFO", f".[{board.upper()}] {len(postings)} jobs from the JSON feed for {listing_url}")
+    return _register_api_postings(postings, build_details=True, engine="search-api")
+
+
+_FEED_READER: FeedReader | None = None
+_FEED_READER_LOCK = threading.Lock()
+
+
+def get_feed_reader() -> FeedReader:
+    """The run-wide FeedReader (one state file writer), created on first use."""
+    global _FEED_READER
+    with _FEED_READER_LOCK:
+        if _FEED_READER is None:
+            _FEED_READER = FeedReader(FEED_STATE_PATH, headers=HEADERS, timeout=REQUEST_TIMEOUT)
+        return _FEED_READER
+
+
+def feed_config(url: str) -> dict:
+    """FEED_SOURCES entry for the URL's host (suffix match) and path prefix, or {}."""
+    host = _listing_host(url)
+    path = up.urlparse(url).path or "/"
+    for domain, cfg in FEED_SOURCES.items():
+        if host == domain or host.endswith("." + domain):
+            return cfg if path.startswith(cfg.get("path_prefix", "/")) else {}
+    return {}
+
+
+def _discover_feed(listing_url: str, html: str | None) -> list[str]:
+    """Listing read from its RSS/Atom feed (one 304 when unchanged); HTML only if that fails."""
+    cfg = feed_config(listing_url)
+    p = up.urlparse(listing_url)
+    base = up.urlunparse((p.scheme, p.netloc, p.path.rstrip("/"), "", "", ""))
+    feed_url = cfg.get("feed_url", "{url}").format(url=base)
+
+    items = get_feed_reader().read(feed_url)
+    if items is None:
+        log_line("WARN", f".[FEED] Could not read {feed_url}; scraping the listing page.")
+        return _discover_generic(listing_url, html or get_html(listing_url))
+
+    remote = bool(source_metadata(listing_url).get("remote_default"))
+    postings: list[ApiPosting] = []
+    for item in items:
+        title, company = item.title, item.author
+        if cfg.get("title_format") == "company: title" and ": " in title:
+            company, title = title.split(": ", 1)
+        location = item.extra.get(cfg.get("location_tag", ""), "") if cfg.get("location_tag") else ""
+        postings.append(ApiPosting(
+            url=item.link,
+            title=title.strip(),
+            company=company.strip(),
+            locations=[location] if location else [],
+            remote=remote,
+            workplace_type="remote" if remote else "",
+            department=", ".join(item.categories),
+            date_posted=item.published,
+            description_html=_html.unescape(item.summary_html) if "&lt;" in item.summary_html else item.summary_html,
+            apply_url=item.link,
+            source="feed",
+        ))
+    log_line("INFO", f".[FEED] {len(postings)} items from {feed_url}")
+    return _register_api_postings([x for x in postings if x.url], build_details=True, engine="search-api")
+
+
+def _discover_lever(listing_url: str, html: str | None) -> list[str]:
+    """Whole Lever board from the postings API; listing HTML only if that fails."""
+    postings = fetch_lever_board(listing_url)
+    company = lever_company_slug(listing_url)
+    if postings is None:
+        log_line("WARN", f".[LEVER] Postings API unavailable for {company}; scraping the listing page.")
+        return _discover_generic(listing_url, html or get_html(listing_url))
+    log_line("INFO", f".[LEVER] {company}: {len(postings)} postings from the API")
+    return _register_api_postings(postings, build_details=True)
+
+
+SOURCE_ADAPTERS: list[SourceAdapter] = [
+    SourceAdapter(
+        name="hubspot",
+        matches=lambda u: "hubspot.com" in _listing_host(u) and "/careers/jobs" in u,
+        discover=lambda u, html: collect_hubspot_links(u, max_pages=25, first_html=html),
+    ),
+    SourceAdapter(
+        name="dice",
+        matches=lambda u: "dice.com" in _listing_host(u) and "/jobs" in up.urlparse(u).path,
+        discover=_discover_dice,
+        is_detail=lambda u: "/job-detail/" in up.urlparse(u).path,
+        engine="json",
+    ),
+    SourceAdapter(
+        name="workday",
+        matches=_is_workday_host,
+        discover=_discover_workday,
+        engine="json",
+    ),
+    SourceAdapter(
+        name="simplyhired",
+        matches=lambda u: "simplyhired.com/search" in u,
+        discover=lambda u, html: collect_simplyhired_links(u, first_html=html),
+        is_detail=lambda u: up.urlparse(u).path.startswith("/job/"),
+    ),
+    SourceAdapter(
+        name="builtin",
+        matches=_is_builtin_host,
+        discover=_discover_generic,
+        is_detail=lambda u: bool(re.match(r"^/job/[^/]+/\d+/?$", up.urlparse(u).path.lower())),
+    ),
+    SourceAdapter(
+        name="greenhouse",
+        matches=lambda u: bool(greenhouse_board_token(u)),
+        discover=_discover_greenhouse,
+        engine="json",
+    ),
+    SourceAdapter(
+        name="lever",
+        matches=lambda u: bool(lever_company_slug(u)),
+        discover=_discover_lever,
+        engine="json",
+    ),
+    SourceAdapter(
+        name="ashby",
+        matches=lambda u: bool(ashby_board_slug(u)),
+        discover=_discover_ashby,
+        engine="json",
+    ),
+    SourceAdapter(
+        name="edsurge",
+        matches=lambda u: _listing_host(u).endswith("edsurge.com") and up.urlparse(u).path.rstrip("/") == "/jobs",
+        discover=_discover_edsurge,
+        engine="json",
+    ),
+    SourceAdapter(
+        name="remote_rocketship",
+        matches=lambda u: _listing_host(u).endswith("remoterocketship.com"),
+        discover=_discover_remote_rocketship,
+        engine="requests",
+    ),
+    SourceAdapter(
+        name="feed",
+        matches=lambda u: bool(feed_config(u)),
+        discover=_discover_feed,
+        engine="json",
+    ),
+    SourceAdapter(
+        name="remote_feed",
+        matches=lambda u: _listing_host(u) in ("remotive.com", "remoteok.com"),
+        discover=_discover_remote_feed,
+        engine="json",
+    ),
+]
+
+GENERIC_SOURCE = SourceAdapter(name="generic", matches=lambda u: True, discover=_discover_generic)
+
+
+def source_adapter_for(listing_url: str) -> SourceAdapter:
+    for adapter in SOURCE_ADAPTERS:
+        try:
+            if adapter.matches(listing_url):
+                return adapter
+        except Exception:
+            continue
+    return GENERIC_SOURCE
+
+
+def _discover_listing_links(listing_url: str) -> list[str]:
+    """
+    Discover the detail links behind one listing URL through its SourceAdapter.
+    The first page is fetched once here (unless the source is a JSON API) and
+    handed to the adapter, which walks any further pages itself.
+    Runs on a discovery worker thread; returns [] when the page cannot be fetched.
+    """
+    if "hubspot.com/careers/jobs" not in listing_url:
+        progress_clear_if_needed()
+    set_source_tag(listing_url)
+
+    adapter = source_adapter_for(listing_url)
+    if not _claim_listing_page(listing_url):
+        log_line("DEBUG", f".[{adapter.name}] Listing already fetched this run: {listing_url}")
+        return []
+
+    html = None
+    engine = adapter.preferred_engine(listing_url)
+    if engine != "json":
+        html = get_html(listing_url, engine)
+        if not html:
+            log_print(f"{_box('WARN')} {DOT3}{DOTW} Failed to fetch listing page: {listing_url}")
+            return []
+
+    links = adapter.discover(listing_url, html) or []
+    if adapter.is_detail is not None:
+        kept = [u for u in links if adapter.is_detail(u)]
+        if len(kept) != len(links):
+            log_line("DEBUG", f".[{adapter.name}] Dropped {len(links) - len(kept)} non-detail links from {listing_url}")
+        links = kept
+
+    progress_clear_if_needed()
+    return links
+
+
 def main(args: argparse.Namespace | None = None) -> None:
 #   #global raw_print
 #   global kept_count, skip_count, _seen_job_keys        #, start_ts  # add start_ts to globals
@@ -13673,19 +14375,67 @@ def main(args: argparse.Namespace | None = None) -> None:
     global PRIOR_DECISIONS_CACHE
     prior_decisions: dict[str, tuple[str, str]] = {}
 
+    # Record / replay archive (fetch_archive.py)
+    global FETCH_ARCHIVE
+    archive_dir = (getattr(args, "replay", "") or getattr(args, "record", "") or "").strip()
+    if archive_dir:
+        mode = "replay" if getattr(args, "replay", "") else "record"
+        try:
+            FETCH_ARCHIVE = FetchArchive(archive_dir, mode)
+        except Exception as e:
+            error(f".Cannot open fetch archive {archive_dir} ({e}).")
+            return
+        set_fetch_archive(FETCH_ARCHIVE)
+        info(f".Fetch archive: {mode} {archive_dir} ({len(FETCH_ARCHIVE)} responses indexed)")
+
+    requested_parser = getattr(args, "html_parser", "") or ""
+    parser_name = set_html_parser(requested_parser)
+    if requested_parser and parser_name != requested_parser:
+        warn(f"[PARSER] {requested_parser} is not installed; using {parser_name}")
+    info(f".HTML parser: {parser_name}")
+
     prior_decisions = {}
-    try:
-        prior_decisions = fetch_prior_decisions(
-            GS_SHEET_URL,
-            key_path=GS_KEY_PATH,
-            tab_name=GS_TAB_NAME,
-        )
-        info(f".Loaded {len(prior_decisions)} prior decisions for carry-forward.")
-    except Exception as e:
-        warn(f"[GS] No prior decisions loaded ({e}). Continuing without carry-forward.")
-        prior_decisions = {}
+    if _replaying():
+        info(".Replay run: skipping Google Sheets carry-forward.")
+    else:
+        try:
+            prior_decisions = fetch_prior_decisions(
+                GS_SHEET_URL,
+                key_path=GS_KEY_PATH,
+                tab_name=GS_TAB_NAME,
+            )
+            info(f".Loaded {len(prior_decisions)} prior decisions for carry-forward.")
+        except Exception as e:
+            warn(f"[GS] No prior decisions loaded ({e}). Continuing without carry-forward.")
+            prior_decisions = {}
 
     PRIOR_DECISIONS_CACHE = prior_decisions
+
+    global SEEN_INDEX
+    if not _replaying() and not (getattr(args, "only_url", "") or "").strip():
+        try:
+            SEEN_INDEX = SeenJobIndex(SEEN_INDEX_PATH)
+        except Exception as e:
+            warn(f"[SEEN] Seen-job index unavailable ({e}). Every link will be fetched.")
+            SEEN_INDEX = None
+
+    global PAGE_CACHE
+    if not getattr(args, "no_cache", False) and not _replaying():
+        try:
+            PAGE_CACHE = PageCache(args.cache_dir or CACHE_DIR, CACHE_TTL_BY_HOST)
+        except Exception as e:
+            warn(f"[CACHE] Page cache unavailable ({e}). Fetching everything live.")
+            PAGE_CACHE = None
+
+    global CAREER_BOARDS
+    # --record / --replay need the careers pages themselves in the archive
+    if not getattr(args, "no_cache", False) and FETCH_ARCHIVE is None:
+        try:
+            CAREER_BOARDS = CareerBoardCache(CAREER_BOARDS_PATH, CAREER_BOARDS_TTL_DAYS * 86400)
+        except Exception as e:
+            warn(f"[CAREERS] Career-board cache unavailable ({e}). Scanning careers pages live.")
+            CAREER_BOARDS = None
+
     CLASSIFIER_CONFIG = ClassificationConfig(
         mode="review",              # you want all reasons for now
         allow_missing_salary=True,
@@ -13698,8 +14448,9 @@ def main(args: argparse.Namespace | None = None) -> None:
 
     from urllib.parse import urlparse
 
-    # 1) Build the final set of listing pages
-    pages = list(STARTING_PAGES)
+    # 1) Build the final set of listing pages (each fetched once per run)
+    pages = list(dict.fromkeys(STARTING_PAGES))
+    _LISTING_PAGES_FETCHED.clear()
 
     # Temporarily disable HubSpot listings until title parsing is fixed
     pages = [p for p in pages if "hubspot.com/careers/jobs" not in p]
@@ -13727,215 +14478,64 @@ def main(args: argparse.Namespace | None = None) -> None:
 
         total_pages = len(pages)
 
-    # 1) Gather job detail links from each listing page
+    # 1) Gather job detail links from each listing page.
+    # Listings fan out across hosts; each host is walked one listing at a
+    # time (pagination stays sequential with its early stop), and links are
+    # merged back in STARTING_PAGES order.
     if not only_url:
-        for i, listing_url in enumerate(pages, start=1):
-            t0 = time.time()
-            if "hubspot.com/careers/jobs" not in listing_url:
-                progress_clear_if_needed()
-            set_source_tag(listing_url)
-            html = get_html(listing_url)
-            if not html:
-                log_print(f"{_box('WARN')} {DOT3}{DOTW} Failed to fetch listing page: {listing_url}")
-                continue
-
-            # derive host safely from the listing URL
-            p = up.urlparse(listing_url if isinstance(listing_url, str) else str(listing_url))
-            host = p.netloc.lower().replace("www.", "")
-
-            # HubSpot listing → handle pagination here and continue
-            if "hubspot.com" in host and "/careers/jobs" in listing_url:
-                links = collect_hubspot_links(listing_url, max_pages=25)
-                all_detail_links.extend(links)
-                elapsed = time.time() - t0
-                progress_clear_if_needed()
-                continue
-
-            if "dice.com" in host and "/jobs" in up.urlparse(listing_url).path:
-                links = collect_dice_links(listing_url, max_pages=25)
-                all_detail_links.extend(links)
-                continue
-
-            # Workday listing → detail expansion
-            if host.endswith("myworkdayjobs.com") or host.endswith("myworkdaysite.com"):
-                wd_detail_links = collect_workday_jobs(
-                    listing_url,
-                    max_links=(LINK_CAP or None),
-                )
-                if not wd_detail_links:
-                    wd_detail_links = workday_links_from_listing(listing_url, max_results=250)
-                if wd_detail_links:
-                    all_detail_links.extend(wd_detail_links)
-                    elapsed = time.time() - t0
-                    progress_clear_if_needed()
-                    continue
-
-            else:
-                if "hubspot.com/careers/jobs" in listing_url:
-                    links = collect_hubspot_links(listing_url, max_pages=25)
-                elif "simplyhired.com/search" in listing_url:
-                    links = collect_simplyhired_links(listing_url)
-                else:
-                    links = find_job_links(html, listing_url)
-
-                if "dice.com/jobs" in listing_url:
-                    links = collect_dice_links(listing_url, max_pages=25)
-                elif "hubspot.com/careers/jobs" in listing_url:
-                    links = collect_hubspot_links(listing_url, max_pages=25)
-
-            # HubSpot pagination
-            if "hubspot.com" in host and "/careers/jobs" in listing_url:
-                page_num = 1
-                hubspot_links = []
-                while True:
-                    page_url = (
-                        re.sub(r"page=\d+", f"page={page_num}", listing_url)
-                        if "page=" in listing_url
-                        else (listing_url + ("&" if "?" in listing_url else "?") + f"page={page_num}")
-                    )
-                    progress_clear_if_needed()
-                    set_source_tag(listing_url)
-                    html = get_html(page_url)
-                    links = parse_hubspot_list_page(html or "", base="https://www.hubspot.com")
-                    if not links:
-                        break
-                    hubspot_links.extend(links)
-                    page_num += 1
-                    if page_num > 20:
-                        break
-
-                info(f".Found {len(hubspot_links)}.candidate job links on hubspot.com")
-                all_detail_links.extend(hubspot_links)
-                progress_clear_if_needed()
+        discovery = run_ordered(
+            pages,
+            _discover_listing_links,
+            workers=_discovery_workers(args),
+            throttle=_discovery_throttle(),
+            on_thread_exit=lambda: get_browser_pool("chromium").close_thread(),
+        )
+        for listing_url, ok, links in discovery:
+            if not ok:
+                log_print(f"{_box('WARN')} {DOT3}{DOTW} Listing discovery failed for {listing_url}: {links}")
                 continue
+            all_detail_links.extend(links or [])
 
-            # Generic collector
-            if "simplyhired.com/search" in listing_url:
-                links = collect_simplyhired_links(listing_url)
-            else:
-                links = find_job_links(html, listing_url)
-
-            progress_clear_if_needed()
-            all_detail_links.extend(links)
-
-
-    def _norm_url(u: str) -> str:
-        from urllib.parse import urlparse, urlunparse
-
-        if not u:
-            return ""
-
-        u = str(u).strip().replace(" ", "")
-        p = urlparse(u)
-        host = (p.netloc or "").lower()
-
-        path_raw = (p.path or "/").strip().rstrip("/") or "/"
-        clean_path = path_raw if "ycombinator.com" in host else path_raw.lower()
-
-        return urlunparse((
-            (p.scheme or "https").lower(),
-            host,
-            clean_path,
-            "", "", ""
-        ))
-
-    from urllib.parse import urlparse, parse_qsl, urlencode  # (at top of file if not already imported)
-
-    # De-duplicate by normalized link key
-    _seen = set()
-    deduped_links = []
-    for u in all_detail_links:
-        k = link_key(u)
-        if not k or k in _seen:
-            continue
-        _seen.add(k)
-        deduped_links.append(u)
-
-    all_detail_links = deduped_links
-    #processed_keys: set[str] = set()
 
-    # Optional caps (leave both; LINK_CAP takes precedence if you set it)
-    # SMOKE keeps the shorter cap if you’re using it
     # --- Final normalization & deduplication ---
-    import re
-    from urllib.parse import urlparse, urlunparse, parse_qsl, urlencode
-
-    def _normalize_link(url: str) -> str:
-        """
-        Normalize links for dedupe while preserving case-sensitive paths (YC).
-        - Lowercase scheme and host
-        - Preserve path casing for ycombinator.com, lowercase path elsewhere
-        - Strip obvious tracking params
-        - Sort kept query params for stability
-        """
-        if not url:
-            return ""
-
-        u = str(url).strip().replace(" ", "")
-        p = urlparse(u)
-
-        scheme = (p.scheme or "https").lower()
-        host = (p.netloc or "").lower()
-
-        path_raw = (p.path or "/").rstrip("/") or "/"
-        path = path_raw if "ycombinator.com" in host else path_raw.lower()
-
-        drop = {
-            "utm_source", "utm_medium", "utm_campaign", "utm_term", "utm_content",
-            "ref", "referrer", "source", "_hsmi", "_hsenc", "gh_src", "page", "p", "start",
-        }
-
-        kept = []
-        for k, v in parse_qsl(p.query or "", keep_blank_values=True):
-            k_norm = (k or "").lower()
-            if k_norm in drop:
-                continue
-            kept.append((k_norm, v))
-
-        kept.sort()
-        q = urlencode(kept, doseq=True)
-
-        return urlunparse((scheme, host, path, "", q, ""))
-
-    # === HARD DEDUPE AFTER EXPANSIONS, BEFORE PROGRESS TOTALS ===
-    from urllib.parse import urlparse, urlunparse, parse_qsl, urlencode
-
-    def _norm_url(u: str) -> str:
-        """Lowercase host, strip tracking params and trailing slash, keep stable path."""
-        p = urlparse(u)
-        host = p.netloc.lower()
-        # strip common trackers everywhere
-        q = [(k, v) for k, v in parse_qsl(p.query, keep_blank_values=True)
-            if k.lower() not in {"utm_source","utm_medium","utm_campaign","utm_term","utm_content",
-                                "ref","source","_hsmi","_hsenc"}]
-        if "workday" in host:
-            q = [(k, v) for k, v in q if k.lower() not in {"q","t","timeType","locations","location","jobFamily"}]
-        clean = urlunparse((
-            p.scheme,
-            p.netloc.lower(),
-            p.path.rstrip("/"),
-            "",  # params
-            urlencode(q, doseq=True),
-            ""   # fragment
-        ))
-        return clean
-
+    # One canonical form (url_canon.py): the fetched link is the canonical
+    # URL, duplicates are decided on its key, the same key the seen-job
+    # index and job keys use.
     # before you start dedupe and deduping
     before_total = len(all_detail_links)
 
     deduped = []
-    _seen = set()
+    _seen: dict[str, int] = {}  # key -> index in deduped
+    mirrors_dropped = 0
 
     # normalize each individual link, then de-dupe
     for raw_link in all_detail_links:
-        link = _normalize_link(raw_link)
-
-        if link in _seen:
+        canon = canonicalize(raw_link)
+        link = canon.url
+        if not link:
+            continue
+        if raw_link in LISTING_TITLES:
+            LISTING_TITLES.setdefault(link, LISTING_TITLES[raw_link])
+        if raw_link in LISTING_CONTEXT:
+            listing_ctx_by_url.setdefault(link, dict(LISTING_CONTEXT[raw_link]))
+        if raw_link in API_DETAIL_PAGES:
+            API_DETAIL_PAGES.setdefault(link, API_DETAIL_PAGES[raw_link])
+        if raw_link in API_POSTINGS:
+            API_POSTINGS.setdefault(link, API_POSTINGS[raw_link])
+
+        if canon.key in _seen:
+            if canon.host != up.urlparse(deduped[_seen[canon.key]]).netloc.lower().replace("www.", ""):
+                mirrors_dropped += 1
+                if canon.host == BUILTIN_PREFERRED_HOST:
+                    deduped[_seen[canon.key]] = link
             continue
 
-        _seen.add(link)
+        _seen[canon.key] = len(deduped)
         deduped.append(link)
 
+    if mirrors_dropped:
+        log_line("INFO", f".[DE-DUPE] {mirrors_dropped} mirrored Built In posting(s) collapsed by job ID")
+
     after_unique = len(deduped)
     #log_line("DE-DUPE", f"{DOT3}{DOTR} Reduced {before_total} → {after_unique} unique URLs")   ignored 20251215
 
@@ -13979,10 +14579,90 @@ def main(args: argparse.Namespace | None = None) -> None:
     skip_count = 0
     progress_start(len(all_detail_links))
 
+    # Fetch detail pages on a host-aware worker pool. Results come back in
+    # link order, so parsing, classification and _record_keep/_record_skip
+    # below still run on this thread in the same order as a serial run.
+    detail_workers = max(1, int(getattr(args, "workers", DETAIL_WORKERS) or 1))
+
+    # Optional: HTML -> details extraction on a process pool, fed by the
+    # fetch workers as pages arrive. Collected in link order below.
+    extract_pool = None
+    extract_processes = int(getattr(args, "extract_processes", EXTRACT_PROCESSES) or 0)
+    if extract_processes:
+        try:
+            extract_pool = start_extract_pool(extract_processes, parser_name)
+        except Exception as e:
+            warn(f"[EXTRACT] Process pool unavailable ({e}). Extracting on the main thread.")
+    if extract_pool is not None:
+        info(f".Extracting detail pages in {extract_processes if extract_processes > 0 else os.cpu_count()} processes.")
+
+    # Listing-title prefilter: obvious non-target roles are recorded as skips
+    # straight from the listing card, without fetching the detail page.
+    prefiltered: dict[str, str] = {}
+    if LISTING_TITLE_PREFILTER and not getattr(args, "no_title_prefilter", False) and not only_url:
+        for link in all_detail_links:
+            reason = _listing_title_skip_reason(LISTING_TITLES.get(link, ""))
+            if reason:
+                prefiltered[link] = reason
+        if prefiltered:
+            info(
+                f".Title prefilter: skipping {len(prefiltered)} non-target listing"
+                f"{'s' if len(prefiltered) != 1 else ''} without fetching."
+            )
+
+    # Jobs decided in an earlier run, inside the revisit window and with an
+    # unchanged listing, reuse that decision instead of being fetched again.
+    reused: dict[str, SeenJob] = {}
+    if SEEN_INDEX is not None:
+        window = max(0.0, float(getattr(args, "revisit_days", SEEN_REVISIT_DAYS) or 0)) * 86400
+        for link in all_detail_links:
+            if link in prefiltered:
+                continue
+            seen = SEEN_INDEX.reusable(link_key(link), _listing_fingerprint(link, listing_ctx_by_url), window)
+            if seen is not None:
+                reused[link] = seen
+        if reused:
+            info(
+                f".Reusing {len(reused)} unchanged decision{'s' if len(reused) != 1 else ''} "
+                f"from earlier runs; fetching {total - len(reused)}."
+            )
+
+    # Pages rendered from ATS board APIs need no fetch; they skip the pool.
+    api_built = {
+        link for link in all_detail_links
+        if link in API_DETAIL_PAGES and link not in reused and link not in prefiltered
+    }
+    if api_built:
+        info(f".Building {len(api_built)} detail page{'s' if len(api_built) != 1 else ''} from ATS board APIs without fetching.")
+
+    detail_pages = run_ordered(
+        [link for link in all_detail_links if link not in reused and link not in prefiltered and link not in api_built],
+        lambda link: _fetch_detail_page(link, listing_ctx_by_url.get(link, {})),
+        workers=detail_workers,
+        throttle=_detail_throttle(),
+        on_thread_exit=lambda: get_browser_pool("chromium").close_thread(),
+    )
+    if detail_workers > 1:
+        info(f".Fetching detail pages with {detail_workers} workers.")
+
+    def _detail_stream():
+        """Fetched results merged back with reused, prefiltered and API-built links, in discovery order."""
+        for link in all_detail_links:
+            if link in prefiltered:
+                yield link, True, None
+            elif link in reused:
+                yield link, True, reused[link]
+            elif link in api_built:
+                yield link, True, _fetch_detail_page(link, listing_ctx_by_url.get(link, {}))
+            else:
+                yield next(detail_pages)
+
     try:
-        for j, link in enumerate(all_detail_links, start=1):
+        for j, (link, fetched_ok, fetched) in enumerate(_detail_stream(), start=1):
             # ensure details is always defined, even if extract_job_details blows up
             details: dict = {}
+            _SEEN_CURRENT.clear()
+            _SEEN_CURRENT.update(key=link_key(link), listing_fp=_listing_fingerprint(link, listing_ctx_by_url))
             try:
                 source_url = link
 
@@ -13993,7 +14673,29 @@ def main(args: argparse.Namespace | None = None) -> None:
 
                 set_source_tag(source_url)
 
-                html = get_html(link)
+                # fetched by the worker pool; a fetch that raised is handled
+                # by the error-row path below, same as the serial loop.
+                # The FetchResult rides along so later checks reuse it.
+                if not fetched_ok:
+                    raise fetched
+                if link in prefiltered:
+                    board = career_board_name(link)
+                    skip_row = _normalize_skip_defaults({
+                        "Job URL": link,
+                        "Title": LISTING_TITLES.get(link, ""),
+                        "Company": board or "Missing Company",
+                        "Career Board": board or "Missing Board",
+                        "Reason Skipped": prefiltered[link],
+                    })
+                    _log_and_record_skip(link, prefiltered[link], skip_row)
+                    continue
+                if isinstance(fetched, SeenJob):
+                    _replay_seen_decision(link, fetched)
+                    continue
+                fetch_result, extraction = fetched
+                html = fetch_result.html
+                if html:
+                    _SEEN_CURRENT["content_fp"] = fingerprint(html)
 
                 # A) Could not fetch detail page → record a minimal SKIP and continue
                 if not html:
@@ -14039,50 +14741,15 @@ def main(args: argparse.Namespace | None = None) -> None:
                     except Exception:
                         pass
 
-                # B) we have HTML -> parse details and enrich salary
-                details = extract_job_details(html, link)
-
-                # DEBUG one-off: YC location correctness
-                try:
-                    if "ycombinator.com" in (up.urlparse(link).netloc or "").lower() and "companies/gromo/jobs" in link:
-                        host_dbg = (up.urlparse(link).netloc or "").lower()
-                        log_line(
-                            "YC CHECK",
-                            f"Location={details.get('Location')!r} | Location Raw={details.get('Location Raw')!r} | "
-                            f"Location Chips={details.get('Location Chips')!r} | Applicant Regions={details.get('Applicant Regions')!r} | "
-                            f"Country Chips={details.get('Country Chips')!r} | host={host_dbg} | url={link}"
-                        )
-                except Exception:
-                    pass
-
-                if "ycombinator.com" in link:
-                    log_line("YC TAP", f"Company={details.get('Company')!r} | Title={details.get('Title')!r} | job_url={details.get('job_url')!r}")        #removed 20260108- activate if you want to log the company, title, and job URL for each YC job page.
-
+                # B) we have HTML -> parse details (extract, listing location,
+                # JSON-LD and HTML dates; pooled when --extract-processes is set)
                 listing = listing_ctx_by_url.get(link, {})
-                details = _prefer_listing_location(details, listing)
+                details = _extracted_details(link, html, listing, extraction)
 
                 if DEBUG_LOCATION and "builtinvancouver.org" in link:
                     host = (urlparse(link).netloc or "").lower()
                     #log_line("BIV DEBUG", f"{DOTL}..prefer_listing: detail_loc={details.get('Location')!r} listing_loc={listing.get('Location')!r}")
 
-
-
-                # 1) Try to pull structured JobPosting data (datePosted, validThrough, etc.)
-                schema_bits = parse_jobposting_ldjson(html)
-                if schema_bits:
-                    # Only copy fields we care about; avoid overwriting with None
-                    for key in ("Title", "Company", "posting_date", "valid_through", "posted"):
-                        val = schema_bits.get(key)
-                        if val:
-                            details[key] = val
-
-                # 2) Fallback: regex-based extraction from raw HTML (Muse, Remotive, etc.)
-                html_dates = _extract_dates_from_html(html)
-                if html_dates:
-                    for k, v in html_dates.items():
-                        if v:
-                            details[k] = v
-
                 # 3) Enrich salary and board
                 # ... keep ALL your existing logic here unchanged ...
                 # through keep_row construction, filters, salary gate, etc.
@@ -14292,7 +14959,7 @@ def main(args: argparse.Namespace | None = None) -> None:
                     _log_and_record_skip(link, reason or "Filtered by rules", skip_row)
                     continue
 
-                vis, score, mark = _public_sanity_checks(keep_row)
+                vis, score, mark = _public_sanity_checks(keep_row, fetch_result)
                 keep_row["Visibility Status"] = vis
                 keep_row["Confidence Score"]  = score
                 keep_row["Confidence Mark"]   = mark
@@ -14395,7 +15062,12 @@ def main(args: argparse.Namespace | None = None) -> None:
 
 
     finally:
+        _SEEN_CURRENT.clear()
+        detail_pages.close()
         progress_done()
+        # all fetching is done; release the pooled browser before prompts/writes
+        shutdown_browser_pools()
+        shutdown_extract_pool()
 
     log_final_reminder_if_needed(GS_SHEET_URL)
 
@@ -14424,17 +15096,18 @@ def main(args: argparse.Namespace | None = None) -> None:
     write_rows_csv(OUTPUT_CSV, kept_rows, KEEP_FIELDS)
     write_rows_csv(SKIPPED_CSV, skipped_rows, SKIP_FIELDS)
 
-    # 3b) Push to Google Sheets
-    push_results_to_sheets(
-        GS_SHEET_URL,
-        kept_rows,
-        skipped_rows,
-        KEEP_FIELDS,
-        SKIP_FIELDS,
-        tab_name=GS_TAB_NAME,
-        key_path=GS_KEY_PATH,
-        progress_clear=progress_clear_if_needed,
-    )
+    # 3b) Push to Google Sheets (never from a replayed run)
+    if not _replaying():
+        push_results_to_sheets(
+            GS_SHEET_URL,
+            kept_rows,
+            skipped_rows,
+            KEEP_FIELDS,
+            SKIP_FIELDS,
+            tab_name=GS_TAB_NAME,
+            key_path=GS_KEY_PATH,
+            progress_clear=progress_clear_if_needed,
+        )
 
     kept_count = len(kept_rows)
     skip_count = len(skipped_rows)
@@ -14443,6 +15116,29 @@ def main(args: argparse.Namespace | None = None) -> None:
     info(
         f".Playwright success {PW_SUCCESS}, failures {PW_FAIL}, fallbacks {REQ_FALLBACK}",
     )
+    finish_career_refresh()
+    info(f".Browser pool {get_browser_pool('chromium').stats_line()}")
+    if CAREER_BOARDS is not None:
+        info(f".Career boards {CAREER_BOARDS.stats_line()}")
+    if PAGE_CACHE is not None:
+        info(f".Page cache {PAGE_CACHE.stats_line()}")
+        PAGE_CACHE.close()
+    if FETCH_ARCHIVE is not None:
+        info(f".Fetch archive {FETCH_ARCHIVE.stats_line()}")
+    if SEEN_INDEX is not None:
+        info(f".Seen-job index {SEEN_INDEX.stats_line()}")
+        SEEN_INDEX.close()
+    if _WORKDAY_CLIENT is not None:
+        info(f".Workday API {_WORKDAY_CLIENT.stats_line()}")
+    if _REMOTE_FEEDS is not None:
+        info(f".Remote board feeds {_REMOTE_FEEDS.stats_line()}")
+    if _FEED_READER is not None:
+        info(f".RSS/Atom feeds {_FEED_READER.stats_line()}")
+    if LISTING_FETCH_STATS["fetched"]:
+        info(
+            f".Listing pages fetched {LISTING_FETCH_STATS['fetched']}, "
+            f"repeats skipped {LISTING_FETCH_STATS['repeats']}"
+        )
     done_log(f".Kept {kept_count}, Skipped {skip_count} "
           f"in {(datetime.now() - start_ts).seconds}s")
     done_log(f".CSV: {OUTPUT_CSV}")
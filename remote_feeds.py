@@ -0,0 +1,204 @@
+"""
+remote_feeds.py
+
+JSON job feeds of the remote-only boards, instead of their HTML pages:
+
+  Remotive    GET remotive.com/api/remote-jobs?category=<slug>
+  Remote OK   GET remoteok.com/api   (first element is a legal notice)
+
+Each board is requested once per run whatever the number of seeds: a
+listing URL is mapped to its feed plus the filters the site would have
+applied (Remotive `search` / `locations`, Remote OK `location` codes),
+and those filters run locally over the cached feed.
+
+Jobs come back as ats_boards.ApiPosting so the scraper builds their rows
+straight from the feed (title, company, location restrictions, salary,
+tags, dates and the full description).
+
+This module has no dependency on po_job_scraper.py.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from concurrent.futures import Future
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from ats_boards import ApiPosting
+from http_client import http_get
+
+
+REMOTIVE_API = "https://remotive.com/api/remote-jobs"
+REMOTEOK_API = "https://remoteok.com/api"
+
+# location restrictions that admit anyone
+_OPEN_LOCATIONS = ("worldwide", "anywhere", "global")
+
+# location filter values (Remote OK codes, Remotive names) -> words in a job's location text
+_PLACE_ALIASES = {
+    "us": ("us", "usa", "united states", "america"),
+    "usa": ("us", "usa", "united states", "america"),
+    "ca": ("canada",),
+    "region_na": ("north america", "americas"),
+}
+
+
+def _wanted_places(values: List[str]) -> Tuple[str, ...]:
+    words: List[str] = []
+    for v in values:
+        v = v.strip().lower()
+        if v:
+            words.extend(_PLACE_ALIASES.get(v, (v,)))
+    return tuple(dict.fromkeys(words))
+
+
+def _as_int(value: Any) -> int:
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return 0
+
+
+def _location_allows(location: str, wanted: Tuple[str, ...]) -> bool:
+    """True when no filter is set, the job is open to anywhere, or it names a wanted place."""
+    if not wanted:
+        return True
+    text = (location or "").lower()
+    if text.strip() in ("", "remote") or any(w in text for w in _OPEN_LOCATIONS):
+        return True
+    return any(re.search(rf"\b{re.escape(w)}\b", text) for w in wanted)
+
+
+def _matches_search(search: str, *fields: str) -> bool:
+    if not search:
+        return True
+    hay = " ".join(f or "" for f in fields).lower()
+    return all(word in hay for word in search.lower().split())
+
+
+class RemoteFeeds:
+    """Fetches each board feed once per run and filters it per seed."""
+
+    def __init__(self, timeout: float = 30) -> None:
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._feeds: Dict[str, Future] = {}  # feed URL -> future of its jobs (None = failed)
+
+        self.requests = 0
+        self.failures = 0
+
+    def _feed(self, url: str, params: Optional[Dict[str, str]] = None) -> Optional[List[Dict[str, Any]]]:
+        """Jobs of one feed, downloaded once; only callers of the same feed wait for it."""
+        key = url + ("?" + "&".join(f"{k}={v}" for k, v in sorted(params.items())) if params else "")
+        with self._lock:
+            fut = self._feeds.get(key)
+            owner = fut is None
+            if owner:
+                fut = self._feeds[key] = Future()
+                self.requests += 1
+        if not owner:
+            return fut.result()
+
+        jobs: Optional[List[Dict[str, Any]]] = None
+        try:
+            resp = http_get(url, params=params, timeout=self.timeout, headers={"Accept": "application/json"})
+            if resp.status_code == 200:
+                data = resp.json()
+                items = data.get("jobs") if isinstance(data, dict) else data
+                if isinstance(items, list):
+                    jobs = [j for j in items if isinstance(j, dict)]
+        except Exception:
+            jobs = None
+        if jobs is None:
+            with self._lock:
+                self.failures += 1
+        fut.set_result(jobs)
+        return jobs
+
+    # ---- Remotive ----------------------------------------------------------
+    def remotive(self, listing_url: str) -> Optional[List[ApiPosting]]:
+        """Jobs for a remotive.com/remote-jobs/<category>?search=&locations= URL."""
+        p = urlparse(listing_url or "")
+        q = parse_qs(p.query)
+        parts = [s for s in (p.path or "").split("/") if s]
+        category = parts[1] if len(parts) >= 2 and parts[0] == "remote-jobs" else ""
+        search = (q.get("search") or [""])[0].strip()
+        wanted = _wanted_places(re.split(r"[+,]", (q.get("locations") or [""])[0]))
+
+        jobs = self._feed(REMOTIVE_API, {"category": category} if category else None)
+        if jobs is None:
+            return None
+
+        out: List[ApiPosting] = []
+        for job in jobs:
+            url = str(job.get("url") or "")
+            location = str(job.get("candidate_required_location") or "").strip()
+            tags = [str(t) for t in job.get("tags") or []]
+            if not url or not _location_allows(location, wanted):
+                continue
+            if not _matches_search(search, str(job.get("title") or ""), " ".join(tags)):
+                continue
+            out.append(ApiPosting(
+                url=url,
+                title=str(job.get("title") or "").strip(),
+                company=str(job.get("company_name") or "").strip(),
+                locations=[location] if location else [],
+                remote=True,
+                workplace_type="remote",
+                department=str(job.get("category") or "").strip(),
+                employment_type=str(job.get("job_type") or "").replace("_", " ").strip(),
+                date_posted=str(job.get("publication_date") or ""),
+                salary_text=str(job.get("salary") or "").strip(),
+                description_html=str(job.get("description") or ""),
+                apply_url=url,
+                source="remotive",
+            ))
+        return out
+
+    # ---- Remote OK ---------------------------------------------------------
+    def remoteok(self, listing_url: str) -> Optional[List[ApiPosting]]:
+        """Jobs for a remoteok.com/?location=<codes> URL."""
+        q = parse_qs(urlparse(listing_url or "").query)
+        wanted = _wanted_places((q.get("location") or [""])[0].split(","))
+
+        jobs = self._feed(REMOTEOK_API)
+        if jobs is None:
+            return None
+
+        out: List[ApiPosting] = []
+        for job in jobs:
+            if "legal" in job or not job.get("id"):
+                continue
+            url = str(job.get("url") or "")
+            location = str(job.get("location") or "").strip()
+            if not url or not _location_allows(location, wanted):
+                continue
+            lo, hi = _as_int(job.get("salary_min")), _as_int(job.get("salary_max"))
+            salary = f"${lo:,} - ${hi:,}" if lo and hi else (f"${(lo or hi):,}" if (lo or hi) else "")
+            posted = str(job.get("date") or "")
+            if not posted and job.get("epoch"):
+                try:
+                    posted = datetime.fromtimestamp(int(job["epoch"]), tz=timezone.utc).date().isoformat()
+                except (TypeError, ValueError, OverflowError, OSError):
+                    posted = ""
+            out.append(ApiPosting(
+                url=url,
+                title=str(job.get("position") or "").strip(),
+                company=str(job.get("company") or "").strip(),
+                locations=[location] if location else [],
+                remote=True,
+                workplace_type="remote",
+                department=", ".join(str(t) for t in job.get("tags") or []),
+                date_posted=posted,
+                salary_text=salary,
+                description_html=str(job.get("description") or ""),
+                apply_url=str(job.get("apply_url") or url),
+                source="remoteok",
+            ))
+        return out
+
+    def stats_line(self) -> str:
+        return f"feeds requested {self.requests}, failures {self.failures}"
@@ -0,0 +1,198 @@
+"""
+seen_index.py
+
+Persistent cross-run index of job detail links the scraper has decided.
+
+One row per job, keyed by url_canon.link_key() of the detail URL:
+
+  first_seen / last_seen   when the link was first / most recently discovered
+  decided_at, decision     when it was last classified, and "keep" or "skip"
+  row                      the recorded keep/skip row (JSON), so an unchanged
+                           job can be carried into this run's output as-is
+  content_fp               fingerprint of the detail page it was decided on
+  listing_fp               fingerprint of what the listing said about it
+
+A link is revisited (fetched and classified again) when it is new, when its
+decision is older than the revisit window, or when the listing fingerprint
+differs from the stored one. Everything else reuses the stored decision.
+
+This module has no dependency on po_job_scraper.py.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+
+def fingerprint(*parts: Any) -> str:
+    """Short stable hash of some text / JSON-able parts ('' when all are empty)."""
+    if not any(parts):
+        return ""
+    blob = "\x1f".join(
+        p if isinstance(p, str) else json.dumps(p, sort_keys=True, default=str)
+        for p in parts
+    )
+    return hashlib.sha1(blob.encode("utf-8", "replace")).hexdigest()[:16]
+
+
+@dataclass
+class SeenJob:
+    key: str
+    job_key: str
+    first_seen: float
+    last_seen: float
+    decided_at: float
+    decision: str
+    row: Dict[str, Any]
+    content_fp: str = ""
+    listing_fp: str = ""
+
+
+class SeenJobIndex:
+    """SQLite-backed link_key -> SeenJob index."""
+
+    def __init__(self, path: str) -> None:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS seen_jobs (
+                key         TEXT PRIMARY KEY,
+                job_key     TEXT,
+                first_seen  REAL,
+                last_seen   REAL,
+                decided_at  REAL,
+                decision    TEXT,
+                row         TEXT,
+                content_fp  TEXT,
+                listing_fp  TEXT
+            )
+            """
+        )
+        self._db.commit()
+
+        self.reused = 0
+        self.new = 0
+        self.stale = 0
+        self.changed = 0
+        self.unchanged_content = 0
+
+    # ---- read --------------------------------------------------------------
+    def get(self, key: str) -> Optional[SeenJob]:
+        with self._lock:
+            rec = self._db.execute(
+                "SELECT key, job_key, first_seen, last_seen, decided_at, decision, row, "
+                "content_fp, listing_fp FROM seen_jobs WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if not rec:
+            return None
+        try:
+            row = json.loads(rec[6] or "{}")
+        except ValueError:
+            row = {}
+        return SeenJob(
+            key=rec[0],
+            job_key=rec[1] or "",
+            first_seen=float(rec[2] or 0),
+            last_seen=float(rec[3] or 0),
+            decided_at=float(rec[4] or 0),
+            decision=rec[5] or "",
+            row=row,
+            content_fp=rec[7] or "",
+            listing_fp=rec[8] or "",
+        )
+
+    def reusable(self, key: str, listing_fp: str, window_seconds: float) -> Optional[SeenJob]:
+        """
+        Return the stored decision when it can be reused for this run, else
+        None (new, decided too long ago, or the listing changed). Counts the
+        outcome for stats_line().
+        """
+        seen = self.get(key)
+        if seen is None or not seen.decision or not seen.row:
+            self._count("new")
+            return None
+        if window_seconds <= 0 or (time.time() - seen.decided_at) >= window_seconds:
+            self._count("stale")
+            return None
+        if listing_fp and seen.listing_fp and listing_fp != seen.listing_fp:
+            self._count("changed")
+            return None
+        self._count("reused")
+        return seen
+
+    # ---- write -------------------------------------------------------------
+    def touch(self, key: str) -> None:
+        """Bump last_seen for a link discovered again this run."""
+        with self._lock:
+            self._db.execute("UPDATE seen_jobs SET last_seen = ? WHERE key = ?", (time.time(), key))
+            self._db.commit()
+
+    def record(
+        self,
+        key: str,
+        *,
+        decision: str,
+        row: Dict[str, Any],
+        job_key: str = "",
+        content_fp: str = "",
+        listing_fp: str = "",
+    ) -> None:
+        """Store a fresh keep/skip decision, keeping the original first_seen."""
+        now = time.time()
+        prev = self.get(key)
+        if prev is not None and content_fp and prev.content_fp == content_fp:
+            self._count("unchanged_content")
+        payload = json.dumps(
+            {k: v for k, v in (row or {}).items() if not str(k).startswith("__")},
+            default=str,
+        )
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO seen_jobs "
+                "(key, job_key, first_seen, last_seen, decided_at, decision, row, content_fp, listing_fp) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    job_key,
+                    prev.first_seen if prev else now,
+                    now,
+                    now,
+                    decision,
+                    payload,
+                    content_fp,
+                    listing_fp,
+                ),
+            )
+            self._db.commit()
+
+    def _count(self, outcome: str) -> None:
+        with self._lock:
+            setattr(self, outcome, getattr(self, outcome) + 1)
+
+    def close(self) -> None:
+        with self._lock:
+            try:
+                self._db.close()
+            except Exception:
+                pass
+
+    def __len__(self) -> int:
+        with self._lock:
+            return int(self._db.execute("SELECT COUNT(*) FROM seen_jobs").fetchone()[0])
+
+    def stats_line(self) -> str:
+        return (
+            f"reused {self.reused}, new {self.new}, stale {self.stale}, "
+            f"listing changed {self.changed}, refetched unchanged {self.unchanged_content}"
+        )
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""Check that every HTML parser backend extracts the same job fields.
+
+Runs extract_job_details() and parse_jobposting_ldjson() over the saved
+view-source pages in docs/ once per BeautifulSoup backend, each in its own
+interpreter (the backend is picked at import via SCRAPER_HTML_PARSER), and
+diffs the results against "html.parser". Exits non-zero on any mismatch,
+so it can gate switching the default backend.
+
+    python tools/check_parser_parity.py
+    python tools/check_parser_parity.py --parsers html.parser lxml --show-fields
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+DOCS_DIR = REPO_ROOT / "docs"
+BASELINE_PARSER = "html.parser"
+
+# Saved pages whose markup carries no canonical / og:url we can recover.
+KNOWN_URLS = {
+    "view-source-https-www.ycombinator.comcompaniesgromojobsJ7KDfr0-senior-ai-product-manager.txt":
+        "https://www.ycombinator.com/companies/gromo/jobs/J7KDfr0-senior-ai-product-manager",
+}
+
+_CANONICAL_RX = re.compile(r'<link[^>]+rel="canonical"[^>]+href="([^"]+)"', re.I)
+_OG_URL_RX = re.compile(r'<meta[^>]+property="og:url"[^>]+content="([^"]+)"', re.I)
+
+
+def saved_pages(docs_dir: Path) -> list[tuple[Path, str]]:
+    """Return (path, job_url) for every raw-HTML view-source page in docs/."""
+    pages: list[tuple[Path, str]] = []
+    for path in sorted(docs_dir.glob("view-source*")):
+        if path.suffix.lower() not in (".txt", ".html", ".htm"):
+            continue  # .mhtml is a MIME archive, not HTML
+        text = path.read_text(encoding="utf-8", errors="replace")
+        url = KNOWN_URLS.get(path.name)
+        if not url:
+            m = _CANONICAL_RX.search(text) or _OG_URL_RX.search(text)
+            url = m.group(1) if m else ""
+        if url:
+            pages.append((path, url))
+    return pages
+
+
+def extract_with_current_parser(pages: list[tuple[Path, str]]) -> dict:
+    """Worker side: import the scraper and extract every page."""
+    sys.path.insert(0, str(REPO_ROOT))
+    import parsed_page
+    import po_job_scraper as scraper
+
+    out: dict = {"parser": parsed_page.HTML_PARSER, "pages": {}}
+    for path, url in pages:
+        html = path.read_text(encoding="utf-8", errors="replace")
+        page = parsed_page.ParsedPage(html, url)
+        try:
+            fields = {
+                "details": scraper.extract_job_details(page, url),
+                "ldjson": scraper.parse_jobposting_ldjson(page),
+            }
+        except Exception as e:  # report, do not hide, extractor crashes
+            fields = {"error": f"{type(e).__name__}: {e}"}
+        out["pages"][path.name] = json.loads(json.dumps(fields, default=str, sort_keys=True))
+    return out
+
+
+def run_backend(parser: str, docs_dir: Path) -> dict:
+    """Parent side: run one backend in a fresh interpreter and load its JSON."""
+    env = dict(os.environ, SCRAPER_HTML_PARSER=parser)
+    cmd = [sys.executable, str(Path(__file__).resolve()), "--worker", "--docs-dir", str(docs_dir)]
+    result = subprocess.run(cmd, cwd=REPO_ROOT, env=env, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"{parser} worker failed:\n{result.stderr.strip()[-2000:]}")
+    # the scraper logs on import; the JSON payload is the last stdout line
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def diff_fields(base: dict, other: dict, prefix: str = "") -> list[str]:
+    diffs: list[str] = []
+    for key in sorted(set(base) | set(other)):
+        a, b = base.get(key), other.get(key)
+        name = f"{prefix}{key}"
+        if isinstance(a, dict) and isinstance(b, dict):
+            diffs.extend(diff_fields(a, b, f"{name}."))
+        elif a != b:
+            diffs.append(f"{name}: {a!r} != {b!r}")
+    return diffs
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Compare job-field extraction across HTML parser backends."
+    )
+    parser.add_argument(
+        "--parsers",
+        nargs="+",
+        default=["html.parser", "lxml"],
+        help="Backends to compare; each is diffed against html.parser.",
+    )
+    parser.add_argument(
+        "--docs-dir",
+        default=str(DOCS_DIR),
+        help="Directory holding the saved view-source pages (default: docs/).",
+    )
+    parser.add_argument(
+        "--show-fields",
+        action="store_true",
+        help="Print the baseline fields per page as well as the differences.",
+    )
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+
+    docs_dir = Path(args.docs_dir)
+    pages = saved_pages(docs_dir)
+
+    if args.worker:
+        payload = extract_with_current_parser(pages)
+        sys.stdout.write("\n" + json.dumps(payload) + "\n")
+        return 0
+
+    if not pages:
+        print(f"No view-source pages found in {args.docs_dir}")
+        return 1
+
+    parsers = [BASELINE_PARSER] + [p for p in args.parsers if p != BASELINE_PARSER]
+    runs = {}
+    for name in parsers:
+        run = run_backend(name, docs_dir)
+        if run["parser"] != name:
+            print(f"skip {name}: not installed (worker fell back to {run['parser']})")
+            continue
+        runs[name] = run
+
+    baseline = runs[BASELINE_PARSER]["pages"]
+    failures = 0
+    for name, run in runs.items():
+        if name == BASELINE_PARSER:
+            continue
+        for page_name, fields in run["pages"].items():
+            diffs = diff_fields(baseline.get(page_name, {}), fields)
+            status = "OK  " if not diffs else "DIFF"
+            print(f"{status} {name:<12} {page_name}")
+            for line in diffs:
+                print(f"       {line}")
+            failures += bool(diffs)
+
+    if args.show_fields:
+        for page_name, fields in baseline.items():
+            print(f"\n## {page_name}")
+            print(json.dumps(fields, indent=2, sort_keys=True))
+
+    if len(runs) < 2:
+        print("Only html.parser is installed; nothing to compare.")
+    print(f"{len(pages)} pages, {len(runs)} backends, {failures} mismatching page(s)")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
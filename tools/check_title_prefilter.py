@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""Check what the listing-title prefilter skips before a detail fetch.
+
+_listing_title_skip_reason() drops listing cards on their title alone, so a
+pattern that matches inside a word (e.g. "ui" in "Building") loses jobs the
+full classification could keep. Runs the titles below through it and exits
+non-zero when one that must reach the full path is skipped, or an obvious
+non-target is not. Run it after editing LISTING_EXCLUDE_TITLES or the
+INCLUDE_TITLES lists.
+
+    python tools/check_title_prefilter.py
+    python tools/check_title_prefilter.py "Senior UX Researcher" "IT Analyst"
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+# titles the prefilter must pass to the full path
+MUST_KEEP = (
+    "IT Analyst - Guidewire",
+    "Building Information Modeling Analyst",
+    "Technical Analyst, Build & Release",
+    "Agile Delivery Lead - Requirements",
+    "Customer Support Operations Lead",
+    "International Business Analyst",
+)
+
+# titles the prefilter must skip
+MUST_SKIP = (
+    "Senior UX Designer",
+    "HR Generalist",
+    "Technical Recruiter",
+    "Senior Data Engineer",
+)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Check the listing-title prefilter against known titles."
+    )
+    parser.add_argument(
+        "titles",
+        nargs="*",
+        help="Extra titles to print the prefilter's verdict for (not checked).",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+
+    sys.path.insert(0, str(REPO_ROOT))
+    import po_job_scraper as scraper
+
+    failures = 0
+    for title in MUST_KEEP:
+        reason = scraper._listing_title_skip_reason(title)
+        print(f"{'OK  ' if reason is None else 'FAIL'} keep  {title}")
+        failures += reason is not None
+    for title in MUST_SKIP:
+        reason = scraper._listing_title_skip_reason(title)
+        print(f"{'OK  ' if reason else 'FAIL'} skip  {title}")
+        failures += not reason
+    for title in args.titles:
+        reason = scraper._listing_title_skip_reason(title)
+        print(f"     {'skip' if reason else 'keep'}  {title}")
+
+    print(f"{len(MUST_KEEP) + len(MUST_SKIP)} titles checked, {failures} failure(s)")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,134 @@
+"""
+url_canon.py
+
+One canonical form for job URLs, used for discovery dedupe, the seen-job
+index and job keys alike.
+
+canonicalize(u) parses a URL once and returns a CanonicalUrl:
+
+  url   the form the scraper fetches and reports: lowercase scheme and
+        host, no fragment, no trailing slash, tracking / paging params
+        dropped and the rest sorted, path lowercased unless the host is
+        case sensitive
+  key   identity for dedupe: `url` without the scheme and "www.", with the
+        host replaced by the board family for boards that mirror one
+        posting under several hosts, and reduced to the numeric job ID
+        where the board has one (Built In: builtin.com/job/<id>)
+
+Per-host behaviour lives in HOST_RULES (matched by host suffix, most
+specific first) and is resolved once per host. Results are memoized in a
+bounded LRU, so repeated links cost a dictionary lookup.
+
+This module has no dependency on po_job_scraper.py.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import FrozenSet, Optional, Pattern, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+
+# Query params that never identify a posting
+TRACKING_PARAMS = frozenset({
+    "utm_source", "utm_medium", "utm_campaign", "utm_term", "utm_content",
+    "ref", "referrer", "source", "src", "_hsmi", "_hsenc", "gh_src",
+    "page", "p", "start",
+})
+
+MEMO_SIZE = 65536
+
+
+@dataclass(frozen=True)
+class HostRule:
+    suffixes: Tuple[str, ...]
+    case_sensitive_path: bool = False
+    drop_params: FrozenSet[str] = field(default_factory=frozenset)  # lowercase, on top of TRACKING_PARAMS
+    key_host: str = ""  # host used in keys ("" = the URL's own host)
+    id_path: Optional[Pattern[str]] = None  # group 1 = posting ID; key becomes <key host>/job/<id>
+
+
+HOST_RULES: Tuple[HostRule, ...] = (
+    # YC company/job slugs are case sensitive
+    HostRule(("ycombinator.com",), case_sensitive_path=True),
+    # the same /job/<slug>/<id> is served by every Built In board
+    # (slugs can differ between mirrors, the numeric ID does not)
+    HostRule(
+        ("builtin.com", "builtinseattle.com", "builtinvancouver.org"),
+        key_host="builtin.com",
+        id_path=re.compile(r"^/job/(?:[^/]+/)?(\d+)$"),
+    ),
+    # search facets ride along on Workday detail links
+    HostRule(
+        ("myworkdayjobs.com", "myworkdaysite.com"),
+        drop_params=frozenset({"q", "t", "timetype", "locations", "location", "jobfamily"}),
+    ),
+)
+
+_DEFAULT_RULE = HostRule(())
+
+
+@dataclass(frozen=True)
+class CanonicalUrl:
+    url: str
+    key: str
+    host: str  # lowercase, without "www."
+
+
+@lru_cache(maxsize=1024)
+def host_rule(host: str) -> HostRule:
+    """Rule for a lowercase host without "www." (suffix match)."""
+    for rule in HOST_RULES:
+        for suffix in rule.suffixes:
+            if host == suffix or host.endswith("." + suffix):
+                return rule
+    return _DEFAULT_RULE
+
+
+@lru_cache(maxsize=MEMO_SIZE)
+def canonicalize(u: str) -> CanonicalUrl:
+    raw = str(u or "").strip().replace(" ", "")
+    if not raw:
+        return CanonicalUrl("", "", "")
+    p = urlsplit(raw)
+    netloc = (p.netloc or "").lower()
+    host = netloc[4:] if netloc.startswith("www.") else netloc
+    rule = host_rule(host)
+
+    path = (p.path or "/").rstrip("/") or "/"
+    if not rule.case_sensitive_path:
+        path = path.lower()
+
+    drop = TRACKING_PARAMS | rule.drop_params
+    kept = sorted(
+        (k.lower(), v)
+        for k, v in parse_qsl(p.query or "", keep_blank_values=True)
+        if k.lower() not in drop
+    )
+    query = urlencode(kept, doseq=True)
+
+    url = urlunsplit(((p.scheme or "https").lower(), netloc, path, query, ""))
+    key_host = rule.key_host or host
+    m = rule.id_path.match(path) if rule.id_path else None
+    if m:
+        key = f"{key_host}/job/{m.group(1)}"
+    else:
+        key = f"{key_host}{path}?{query}" if query else f"{key_host}{path}"
+    return CanonicalUrl(url=url, key=key, host=host)
+
+
+def canonical_url(u: str) -> str:
+    """Fetchable canonical form of a URL ('' for empty input)."""
+    return canonicalize(u).url
+
+
+def link_key(u: str) -> str:
+    """Dedupe key of a URL: equal keys are the same posting."""
+    return canonicalize(u).key
+
+
+def memo_stats() -> str:
+    info = canonicalize.cache_info()
+    return f"{info.currsize} urls, hits {info.hits}, misses {info.misses}"
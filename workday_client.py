@@ -0,0 +1,247 @@
+"""
+workday_client.py
+
+One client for Workday career sites (myworkdayjobs.com / myworkdaysite.com).
+
+A listing URL is resolved once to its CXS jobs endpoint:
+
+  https://<api host>/wday/cxs/<tenant>/<site>/jobs
+
+Tenant and site come from the URL (`/recruiting/<tenant>/<site>` on
+myworkdaysite, `<tenant>.wdN.myworkdayjobs.com/<site>` otherwise). The API
+host is probed in order (the UI host or its myworkday.com twin, then the
+shared wdN.myworkday.com host); the first one that answers with JSON is
+cached per board for the run, failures included, so later listings on the
+same board go straight to it.
+
+Paging: the first POST reveals `total`, then the remaining offsets are
+fetched concurrently on a small thread pool and merged in offset order,
+deduplicated by detail URL. Each posting keeps the listing metadata
+(title, locationsText, postedOn) so the scraper can prefilter on it.
+
+This module has no dependency on po_job_scraper.py.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urljoin, urlparse
+
+from http_client import http_post
+
+
+# Page size the Workday UI itself requests from the CXS endpoint.
+PAGE_SIZE = 20
+PAGE_WORKERS = 4
+
+_LOCALE_RX = re.compile(r"^[a-z]{2}-[a-z]{2}$", re.I)
+_WD_SHARD_RX = re.compile(r"^wd\d+$", re.I)
+_TENANT_HOST_RX = re.compile(r"https?://([a-z0-9-]+)\.(wd\d+)\.myworkdayjobs\.com", re.I)
+
+
+@dataclass(frozen=True)
+class WorkdayBoard:
+    ui_host: str
+    tenant: str
+    site: str
+    search: str = ""
+
+    @property
+    def key(self) -> Tuple[str, str, str]:
+        return (self.ui_host, self.tenant.lower(), self.site.lower())
+
+    def api_hosts(self) -> List[str]:
+        """Candidate CXS hosts, most likely first."""
+        # myworkdaysite UIs are served by myworkday.com; myworkdayjobs tenants answer on their own host
+        hosts = [self.ui_host.replace("myworkdaysite.com", "myworkday.com"), self.ui_host]
+        m = re.search(r"\b(wd\d+)\.", self.ui_host, re.I)
+        if m:
+            hosts.append(f"{m.group(1).lower()}.myworkday.com")
+        return list(dict.fromkeys(hosts))
+
+
+@dataclass
+class WorkdayPosting:
+    url: str
+    title: str = ""
+    locations_text: str = ""
+    posted_on: str = ""
+
+
+def parse_workday_listing(listing_url: str, tenant_host: str = "") -> Optional[WorkdayBoard]:
+    """
+    Tenant / site / search text for a Workday listing URL, or None when the
+    URL does not name them. `tenant_host` replaces a bare wdN.myworkdayjobs.com
+    host (see tenant_host_from_html()).
+    """
+    p = urlparse(listing_url)
+    host = (tenant_host or p.netloc or "").lower()
+    parts = [s for s in (p.path or "").split("/") if s]
+    if parts and _LOCALE_RX.match(parts[0]):
+        parts = parts[1:]
+    search = " ".join(parse_qs(p.query).get("q", [])).strip()
+
+    tenant = site = ""
+    if len(parts) >= 3 and parts[0].lower() == "recruiting":
+        tenant, site = parts[1], parts[2]
+    else:
+        sub = host.split(".")[0]
+        if sub and not _WD_SHARD_RX.match(sub) and "myworkdayjobs.com" in host:
+            tenant, site = sub, (parts[0] if parts else "")
+        elif len(parts) >= 2:
+            tenant, site = parts[0], parts[1]
+    if not tenant:
+        return None
+    return WorkdayBoard(ui_host=host, tenant=tenant, site=site or tenant, search=search)
+
+
+def tenant_host_from_html(html: str) -> str:
+    """'<tenant>.wdN.myworkdayjobs.com' embedded in a listing page, or ''."""
+    m = _TENANT_HOST_RX.search(html or "")
+    return f"{m.group(1)}.{m.group(2)}.myworkdayjobs.com".lower() if m else ""
+
+
+def _postings_of(data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    # tenants differ on the key name
+    items = data.get("jobPostings") or data.get("jobs") or data.get("data") or []
+    return items if isinstance(items, list) else []
+
+
+def _total_of(data: Dict[str, Any]) -> Optional[int]:
+    for key in ("total", "totalCount", "totalHits", "totalRecords"):
+        try:
+            if data.get(key):
+                return int(data[key])
+        except (TypeError, ValueError):
+            continue
+    return None
+
+
+class WorkdayClient:
+    """Resolves Workday boards once per run and pages their CXS search API."""
+
+    def __init__(
+        self,
+        *,
+        headers: Optional[Dict[str, str]] = None,
+        page_size: int = PAGE_SIZE,
+        workers: int = PAGE_WORKERS,
+        timeout: float = 30,
+    ) -> None:
+        self.headers = dict(headers or {})
+        self.headers.update({
+            "Accept": "application/json, text/plain, */*",
+            "Content-Type": "application/json;charset=UTF-8",
+        })
+        self.page_size = max(1, int(page_size))
+        self.workers = max(1, int(workers))
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._api_base: Dict[Tuple[str, str, str], str] = {}  # "" = no JSON API
+
+        self.requests = 0
+        self.failures = 0
+        self.boards_resolved = 0
+
+    # ---- transport ---------------------------------------------------------
+    def _post(self, api_base: str, search: str, offset: int, limit: int) -> Optional[Dict[str, Any]]:
+        payload: Dict[str, Any] = {"appliedFacets": {}, "limit": limit, "offset": offset, "searchText": search}
+        with self._lock:
+            self.requests += 1
+        try:
+            resp = http_post(api_base, headers=self.headers, data=json.dumps(payload), timeout=self.timeout)
+            if resp.status_code != 200:
+                raise ValueError(f"HTTP {resp.status_code}")
+            data = resp.json()
+            if not isinstance(data, dict):
+                raise ValueError("not a JSON object")
+            return data
+        except Exception:
+            with self._lock:
+                self.failures += 1
+            return None
+
+    # ---- resolve -----------------------------------------------------------
+    def _first_page(self, board: WorkdayBoard) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """(api_base, first page) using the cached API host, probing on first use."""
+        with self._lock:
+            cached = self._api_base.get(board.key)
+        if cached == "":
+            return "", None
+        candidates = [cached] if cached else [
+            f"https://{h}/wday/cxs/{board.tenant}/{board.site}/jobs" for h in board.api_hosts()
+        ]
+        for api_base in candidates:
+            data = self._post(api_base, board.search, 0, self.page_size)
+            if data is not None:
+                with self._lock:
+                    if board.key not in self._api_base:
+                        self.boards_resolved += 1
+                    self._api_base[board.key] = api_base
+                return api_base, data
+        if not cached:
+            with self._lock:
+                self._api_base[board.key] = ""
+        return "", None
+
+    # ---- search ------------------------------------------------------------
+    def postings(self, board: WorkdayBoard, max_results: Optional[int] = None) -> Optional[List[WorkdayPosting]]:
+        """
+        Every posting the board's search returns (up to max_results), in
+        Workday's order. None when no CXS endpoint answered.
+        """
+        api_base, first = self._first_page(board)
+        if first is None:
+            return None
+
+        pages: List[List[Dict[str, Any]]] = [_postings_of(first)]
+        total = _total_of(first)
+        if total is not None and max_results:
+            total = min(total, max_results)
+
+        if total is not None:
+            offsets = list(range(self.page_size, total, self.page_size))
+            if offsets:
+                with ThreadPoolExecutor(max_workers=min(self.workers, len(offsets))) as pool:
+                    pages.extend(
+                        pool.map(lambda off: _postings_of(self._post(api_base, board.search, off, self.page_size) or {}), offsets)
+                    )
+        else:
+            # no total: walk sequentially until a short page
+            offset = self.page_size
+            while len(pages[-1]) >= self.page_size:
+                data = self._post(api_base, board.search, offset, self.page_size)
+                if not data or not _postings_of(data):
+                    break
+                pages.append(_postings_of(data))
+                offset += self.page_size
+
+        base = f"https://{board.ui_host}/"
+        out: List[WorkdayPosting] = []
+        seen = set()
+        for page in pages:
+            for job in page:
+                path = job.get("externalPath") or job.get("externalUrl") or job.get("url")
+                if not path:
+                    continue
+                url = urljoin(base, str(path))
+                if url in seen:
+                    continue
+                seen.add(url)
+                out.append(WorkdayPosting(
+                    url=url,
+                    title=str(job.get("title") or "").strip(),
+                    locations_text=str(job.get("locationsText") or "").strip(),
+                    posted_on=str(job.get("postedOn") or "").strip(),
+                ))
+                if max_results and len(out) >= max_results:
+                    return out
+        return out
+
+    def stats_line(self) -> str:
+        return f"boards {self.boards_resolved}, requests {self.requests}, failures {self.failures}"